@@ -0,0 +1,310 @@
+"""
+Test de charge HTTP de l'API, sans dépendance (bibliothèque standard seule).
+
+Des utilisateurs virtuels (un thread et une connexion keep-alive chacun) se
+connectent par `/api/token/` avec les comptes du personnel, puis enchaînent
+liste, recherche, fiche et création de clients, entrecoupées d'un temps de
+réflexion. Comme le client web (`client/src/services/api.ts`), un 401 déclenche
+un seul `/api/token/refresh/`, dont le nouveau jeton de rafraîchissement
+remplace l'ancien (rotation), puis la requête est rejouée une fois.
+
+À la fin : nombre d'appels, taux d'erreur, p50/p95/p99 et débit par type de
+requête. Voir la section « Tests de charge » de backend/README.md.
+
+    python benchmarks/loadtest.py --email admin@clinique-veto.fr --password vetogest \\
+        --users 20 --duration 120 --output charge.json
+"""
+import argparse
+import http.client
+import itertools
+import json
+import random
+import sys
+import threading
+import time
+import uuid
+from collections import defaultdict
+from urllib.parse import urlencode, urlsplit
+
+# Poids des actions d'un utilisateur virtuel
+ACTIONS = {'list': 35, 'search': 25, 'detail': 30, 'create': 10}
+# Début de noms de famille fréquents dans le jeu de données (core.dataset)
+SEARCH_TERMS = ('mar', 'ber', 'tho', 'pet', 'dur', 'dub', 'mor', 'lau', 'leg', 'gar', 'rou', 'fou', 'le g', 'da s')
+CITIES = (('75011', 'Paris'), ('69003', 'Lyon'), ('13006', 'Marseille'), ('44000', 'Nantes'), ('33000', 'Bordeaux'))
+
+
+class Stats:
+    """Durées et erreurs par type de requête, partagées par les threads."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.timings = defaultdict(list)
+        self.errors = defaultdict(lambda: defaultdict(int))
+
+    def record(self, name, seconds, error=None):
+        with self._lock:
+            self.timings[name].append(seconds)
+            if error is not None:
+                self.errors[name][error] += 1
+
+    def summary(self, elapsed):
+        with self._lock:
+            rows = {name: _summarize(timings, self.errors[name], elapsed) for name, timings in self.timings.items()}
+            everything = list(itertools.chain.from_iterable(self.timings.values()))
+            errors = defaultdict(int)
+            for by_status in self.errors.values():
+                for status, count in by_status.items():
+                    errors[status] += count
+        if everything:
+            rows['total'] = _summarize(everything, errors, elapsed)
+        return rows
+
+
+def _percentile(ordered, fraction):
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def _summarize(timings, errors, elapsed):
+    ordered = sorted(timings)
+    failed = sum(errors.values())
+    return {
+        'requests': len(ordered),
+        'errors': failed,
+        'error_rate': round(failed / len(ordered), 4),
+        'error_statuses': dict(errors),
+        'p50_ms': round(_percentile(ordered, 0.50) * 1000, 1),
+        'p95_ms': round(_percentile(ordered, 0.95) * 1000, 1),
+        'p99_ms': round(_percentile(ordered, 0.99) * 1000, 1),
+        'max_ms': round(ordered[-1] * 1000, 1),
+        'rps': round(len(ordered) / elapsed, 1),
+    }
+
+
+class ApiError(Exception):
+    def __init__(self, status, body=b''):
+        super().__init__(f'{status} {body[:200]!r}')
+        self.status = status
+
+
+class Client:
+    """Connexion HTTP keep-alive avec les jetons d'un utilisateur."""
+
+    def __init__(self, base_url, stats, timeout):
+        url = urlsplit(base_url)
+        connection_class = http.client.HTTPSConnection if url.scheme == 'https' else http.client.HTTPConnection
+        self.connection = connection_class(url.hostname, url.port, timeout=timeout)
+        self.stats = stats
+        self.access = self.refresh = None
+
+    def request(self, name, method, path, payload=None, authenticated=True, retry=False):
+        """
+        Appel chronométré sous le nom `name` ; renvoie `(statut, corps JSON)`.
+        Avec `retry`, un 401 n'est pas compté en erreur : l'appel sera rejoué.
+        """
+        headers = {'Accept': 'application/json'}
+        body = None
+        if payload is not None:
+            body = json.dumps(payload).encode()
+            headers['Content-Type'] = 'application/json'
+        if authenticated and self.access:
+            headers['Authorization'] = f'Bearer {self.access}'
+
+        start = time.perf_counter()
+        try:
+            self.connection.request(method, path, body, headers)
+            response = self.connection.getresponse()
+            content = response.read()
+        except (OSError, http.client.HTTPException) as exc:
+            # Connexion fermée par le serveur (recyclage d'un worker) : rouverte au prochain appel
+            self.connection.close()
+            self.stats.record(name, time.perf_counter() - start, type(exc).__name__)
+            raise ApiError(type(exc).__name__) from exc
+        elapsed = time.perf_counter() - start
+        status = response.status
+        self.stats.record(name, elapsed, None if status < 400 or (retry and status == 401) else status)
+        if response.getheader('Connection', '').lower() == 'close':
+            self.connection.close()
+        return status, json.loads(content) if content and 'json' in response.getheader('Content-Type', '') else None
+
+    def login(self, email, password):
+        status, data = self.request('token_obtain', 'POST', '/api/token/', {'email': email, 'password': password},
+                                    authenticated=False)
+        if status != 200:
+            raise ApiError(status, json.dumps(data).encode())
+        self.access, self.refresh = data['access'], data['refresh']
+
+    def renew(self):
+        status, data = self.request('token_refresh', 'POST', '/api/token/refresh/', {'refresh': self.refresh},
+                                     authenticated=False)
+        if status != 200:
+            raise ApiError(status, json.dumps(data).encode())
+        # Rotation : l'ancien jeton de rafraîchissement est désormais révoqué
+        self.access, self.refresh = data['access'], data.get('refresh', self.refresh)
+
+    def call(self, name, method, path, payload=None, expected=200):
+        status, data = self.request(name, method, path, payload, retry=True)
+        if status == 401:
+            # Jeton d'accès expiré : un seul rafraîchissement, puis la requête est rejouée
+            self.renew()
+            status, data = self.request(name, method, path, payload)
+        if status != expected:
+            raise ApiError(status)
+        return data
+
+
+class VirtualUser(threading.Thread):
+    def __init__(self, index, account, options, stats, stop):
+        super().__init__(name=f'vu-{index}', daemon=True)
+        self.account = account
+        self.options = options
+        self.stats = stats
+        self.stop = stop
+        self.rng = random.Random(options.seed + index)
+        self.client = Client(options.host, stats, options.timeout)
+        self.ids = []
+        self.next_page = None
+
+    def run(self):
+        # Départs étalés sur la montée en charge
+        if self.stop.wait(self.rng.uniform(0, self.options.ramp_up)):
+            return
+        try:
+            self.client.login(*self.account)
+        except ApiError as exc:
+            print(f'{self.name} : connexion impossible pour {self.account[0]} ({exc})', file=sys.stderr)
+            return
+        actions, weights = zip(*ACTIONS.items())
+        while not self.stop.is_set():
+            action = self.rng.choices(actions, weights)[0]
+            try:
+                getattr(self, f'do_{action}')()
+            except ApiError as exc:
+                if exc.status == 401:
+                    # Rafraîchissement refusé : nouvelle connexion, comme après une déconnexion
+                    try:
+                        self.client.login(*self.account)
+                    except ApiError:
+                        pass
+            if self.options.think > 0:
+                self.stop.wait(self.rng.expovariate(1 / self.options.think))
+
+    def _remember(self, data):
+        self.ids.extend(customer['id'] for customer in data['results'])
+        del self.ids[:-500]
+        self.next_page = data.get('next')
+
+    def do_list(self):
+        # Une fois sur trois, page suivante de la liste déjà affichée
+        if self.next_page and self.rng.random() < 1 / 3:
+            url = urlsplit(self.next_page)
+            self._remember(self.client.call('list', 'GET', f'{url.path}?{url.query}'))
+        else:
+            self._remember(self.client.call('list', 'GET', '/api/customers/'))
+
+    def do_search(self):
+        query = urlencode({'search': self.rng.choice(SEARCH_TERMS)})
+        self._remember(self.client.call('search', 'GET', f'/api/customers/?{query}'))
+
+    def do_detail(self):
+        if not self.ids:
+            return self.do_list()
+        self.client.call('detail', 'GET', f'/api/customers/{self.rng.choice(self.ids)}/')
+
+    def do_create(self):
+        zip_code, city = self.rng.choice(CITIES)
+        customer = self.client.call('create', 'POST', '/api/customers/', {
+            'lastName': 'Charge',
+            'firstName': self.name,
+            'email': f'charge.{uuid.uuid4().hex}@example.com',
+            'phoneNumber': f'06 {self.rng.randrange(100):02d} {self.rng.randrange(100):02d} 00 00',
+            'street': f'{self.rng.randint(1, 180)} rue de la République',
+            'zipCode': zip_code,
+            'city': city,
+        }, expected=201)
+        self.ids.append(customer['id'])
+
+
+def staff_accounts(options, stats):
+    """Comptes actifs du personnel, lus avec le compte `--email`."""
+    client = Client(options.host, stats, options.timeout)
+    client.login(options.email, options.password)
+    users = client.call('users', 'GET', '/api/users/?fields=email,isActive')
+    emails = [user['email'] for user in users if user['isActive']]
+    if options.email not in emails:
+        emails.insert(0, options.email)
+    return [(email, options.password) for email in emails[:options.users]]
+
+
+def print_report(summary, elapsed):
+    print(f'\nDurée : {elapsed:.1f} s')
+    header = f"{'requête':<16}{'appels':>8}{'erreurs':>9}{'taux':>8}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'req/s':>8}"
+    print(header)
+    print('-' * len(header))
+    for name, row in sorted(summary.items(), key=lambda item: item[0] == 'total'):
+        print(
+            f"{name:<16}{row['requests']:>8}{row['errors']:>9}{row['error_rate']:>8.2%}"
+            f"{row['p50_ms']:>9}{row['p95_ms']:>9}{row['p99_ms']:>9}{row['rps']:>8}"
+        )
+    statuses = summary.get('total', {}).get('error_statuses')
+    if statuses:
+        print('Erreurs : ' + ', '.join(f'{status} × {count}' for status, count in statuses.items()))
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--host', default='http://localhost:8000', help='URL du backend')
+    parser.add_argument('--email', required=True, help='Compte qui liste le personnel (et se connecte lui-même)')
+    parser.add_argument('--password', required=True, help='Mot de passe commun (generate_dataset --password)')
+    parser.add_argument('--users', type=int, default=20, help='Utilisateurs virtuels (au plus un par compte)')
+    parser.add_argument('--duration', type=float, default=60, help='Durée du test (s), montée en charge comprise')
+    parser.add_argument('--ramp-up', type=float, default=10, help='Étalement des connexions (s)')
+    parser.add_argument('--think', type=float, default=1.0, help='Temps de réflexion moyen entre deux requêtes (s)')
+    parser.add_argument('--timeout', type=float, default=30, help='Délai maximal d\'une requête (s)')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--max-error-rate', type=float, default=0.01,
+                        help='Code de sortie 1 au-delà de ce taux d\'erreur global')
+    parser.add_argument('--output', help='Écrit les résultats en JSON')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    options = parse_args(argv)
+    stats = Stats()
+    try:
+        accounts = staff_accounts(options, stats)
+    except ApiError as exc:
+        sys.exit(f'Connexion de {options.email} impossible : {exc}')
+    if len(accounts) < options.users:
+        print(f'{len(accounts)} comptes disponibles : {len(accounts)} utilisateurs virtuels', file=sys.stderr)
+    # Les appels de préparation ne comptent pas
+    stats = Stats()
+
+    stop = threading.Event()
+    users = [VirtualUser(index, account, options, stats, stop) for index, account in enumerate(accounts)]
+    print(f'{len(users)} utilisateurs virtuels contre {options.host} pendant {options.duration:.0f} s…')
+    start = time.perf_counter()
+    for user in users:
+        user.start()
+    try:
+        stop.wait(options.duration)
+    except KeyboardInterrupt:
+        pass
+    stop.set()
+    for user in users:
+        user.join(options.timeout)
+    elapsed = time.perf_counter() - start
+
+    summary = stats.summary(elapsed)
+    if not summary:
+        sys.exit('Aucune requête aboutie.')
+    print_report(summary, elapsed)
+    if options.output:
+        with open(options.output, 'w', encoding='utf-8') as file:
+            settings = {key: value for key, value in vars(options).items() if key != 'password'}
+            json.dump({'options': settings, 'duration_s': round(elapsed, 1), 'results': summary},
+                      file, indent=2, ensure_ascii=False)
+    return 1 if summary['total']['error_rate'] > options.max_error_rate else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -12,6 +12,7 @@ https://docs.djangoproject.com/en/6.0/ref/settings/
 from datetime import timedelta
 
 import environ
+from corsheaders.defaults import default_headers
 from pathlib import Path
 
 env = environ.Env(
@@ -34,9 +35,17 @@ DEBUG = env('DEBUG')
 
 ALLOWED_HOSTS = env.list('ALLOWED_HOSTS', default=['127.0.0.1', 'localhost'])
 if not DEBUG:
-    ALLOWED_HOSTS = [env('RAILWAY_STATIC_URL'), 'localhost', '127.0.0.1']
+    # Domaine Railway s'il est défini, plus les hôtes de ALLOWED_HOSTS (réseau Docker, nginx…)
+    ALLOWED_HOSTS = [
+        *([env('RAILWAY_STATIC_URL')] if env('RAILWAY_STATIC_URL', default=None) else []),
+        'localhost', '127.0.0.1',
+        *(host for host in env.list('ALLOWED_HOSTS', default=[]) if host not in ('localhost', '127.0.0.1')),
+    ]
 
 CORS_ALLOWED_ORIGINS = env.list('CORS_ALLOWED_ORIGINS', default=['http://localhost:5173'])
+# Requêtes conditionnelles (ETag), mesures Server-Timing et nom des exports lisibles par le client
+CORS_ALLOW_HEADERS = (*default_headers, 'if-match', 'if-none-match', 'if-modified-since', 'if-unmodified-since')
+CORS_EXPOSE_HEADERS = ['Content-Disposition', 'ETag', 'Last-Modified', 'Server-Timing']
 
 CSRF_TRUSTED_ORIGINS = [
     "http://localhost:5173",
@@ -56,6 +65,7 @@ INSTALLED_APPS = [
     'rest_framework_simplejwt',
     'corsheaders',
     'drf_spectacular',
+    'core',
     'users',
     'customers',
 ]
@@ -63,32 +73,57 @@ INSTALLED_APPS = [
 REST_FRAMEWORK = {
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
     'DEFAULT_RENDERER_CLASSES': (
-        'djangorestframework_camel_case.render.CamelCaseJSONRenderer',
-        'djangorestframework_camel_case.render.CamelCaseBrowsableAPIRenderer',
+        'core.renderers.CamelCaseORJSONRenderer',
+        'core.renderers.CamelCaseBrowsableAPIRenderer',
     ),
     'DEFAULT_PARSER_CLASSES': (
-        'djangorestframework_camel_case.parser.CamelCaseFormParser',
-        'djangorestframework_camel_case.parser.CamelCaseMultiPartParser',
-        'djangorestframework_camel_case.parser.CamelCaseJSONParser',
+        'core.parsers.CamelCaseFormParser',
+        'core.parsers.CamelCaseMultiPartParser',
+        'core.parsers.CamelCaseORJSONParser',
     ),
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'users.authentication.CachedJWTAuthentication',
     ),
     'DEFAULT_PERMISSION_CLASSES': (
         'rest_framework.permissions.IsAuthenticated',
     ),
     'DEFAULT_THROTTLE_CLASSES': [
-        'rest_framework.throttling.AnonRateThrottle',
-        'rest_framework.throttling.UserRateThrottle'
+        'core.throttling.FixedWindowAnonRateThrottle',
+        'core.throttling.FixedWindowUserRateThrottle',
     ],
     'DEFAULT_THROTTLE_RATES': {
-        'anon': '5/minute',
-        'user': '1000/day'
+        'anon': env('THROTTLE_ANON_RATE', default='5/minute'),
+        'user': env('THROTTLE_USER_RATE', default='1000/day'),
     }
 }
 
+# Pagination par curseur de la liste des clients
+CUSTOMERS_PAGE_SIZE = env.int('CUSTOMERS_PAGE_SIZE', default=50)
+CUSTOMERS_MAX_PAGE_SIZE = env.int('CUSTOMERS_MAX_PAGE_SIZE', default=200)
+# Nombre maximal de suggestions renvoyées par /api/customers/autocomplete/
+CUSTOMERS_AUTOCOMPLETE_LIMIT = env.int('CUSTOMERS_AUTOCOMPLETE_LIMIT', default=10)
+# Envois en masse (/api/customers/bulk/) : taille maximale d'un envoi et des transactions
+CUSTOMERS_BULK_MAX_ROWS = env.int('CUSTOMERS_BULK_MAX_ROWS', default=5000)
+CUSTOMERS_BULK_BATCH_SIZE = env.int('CUSTOMERS_BULK_BATCH_SIZE', default=500)
+# Synchronisation (/api/customers/changes/) : recul du filigrane (s), au moins la durée de la plus
+# longue transaction d'écriture, et conservation (jours) des traces de suppression
+CUSTOMERS_SYNC_WATERMARK_MARGIN = env.int('CUSTOMERS_SYNC_WATERMARK_MARGIN', default=60)
+CUSTOMERS_TOMBSTONE_RETENTION_DAYS = env.int('CUSTOMERS_TOMBSTONE_RETENTION_DAYS', default=30)
+
+# Cache partagé par les workers (redis://… en production)
+CACHES = {
+    'default': env.cache('CACHE_URL', default='locmemcache://'),
+}
+# Alias (dans CACHES) des compteurs de throttling : un cache partagé rend les limites globales
+THROTTLE_CACHE = env('THROTTLE_CACHE', default='default')
+# Fiche client déjà rendue : alias du cache et durée de vie (s), 0 pour désactiver
+CUSTOMERS_DETAIL_CACHE = env('CUSTOMERS_DETAIL_CACHE', default='default')
+CUSTOMERS_DETAIL_CACHE_TIMEOUT = env.int('CUSTOMERS_DETAIL_CACHE_TIMEOUT', default=300)
+# Durée de vie (s) de l'utilisateur mis en cache par l'authentification JWT
+AUTH_USER_CACHE_TIMEOUT = env.int('AUTH_USER_CACHE_TIMEOUT', default=30)
+
 SIMPLE_JWT = {
-    'ACCESS_TOKEN_LIFETIME': timedelta(minutes=15),
+    'ACCESS_TOKEN_LIFETIME': timedelta(seconds=env.int('JWT_ACCESS_TOKEN_LIFETIME', default=15 * 60)),
     'REFRESH_TOKEN_LIFETIME': timedelta(days=1),
     'ROTATE_REFRESH_TOKENS': True,
     'BLACKLIST_AFTER_ROTATION': True,
@@ -100,7 +135,14 @@ SIMPLE_JWT = {
     'AUTH_HEADER_NAME': 'HTTP_AUTHORIZATION',
     'USER_ID_FIELD': 'id',
     'USER_ID_CLAIM': 'user_id',
+    'TOKEN_OBTAIN_SERIALIZER': 'users.serializers.RoleTokenObtainPairSerializer',
+    'TOKEN_REFRESH_SERIALIZER': 'users.serializers.RoleTokenRefreshSerializer',
 }
+# Rôle et statut superutilisateur dans le jeton d'accès : permissions évaluées
+# sans lecture de l'utilisateur (changements visibles au renouvellement du jeton)
+JWT_ROLE_CLAIMS = env.bool('JWT_ROLE_CLAIMS', default=False)
+# Liste noire des jetons remplacés par la rotation (voir users/blacklist.py)
+JWT_BLACKLIST_STORE = env('JWT_BLACKLIST_STORE', default='users.blacklist.DatabaseBlacklistStore')
 
 SPECTACULAR_SETTINGS = {
     'TITLE': 'VetoGest API',
@@ -117,9 +159,25 @@ SPECTACULAR_SETTINGS = {
     'OAS_VERSION': '3.0.3',
 }
 
+# En-tête Server-Timing (durées de parsing, conversion camelCase, total)
+SERVER_TIMING = env.bool('SERVER_TIMING', default=DEBUG)
+# Nombre et durée des requêtes SQL, sérialisation et rendu par requête
+# (Server-Timing) et agrégés par route sur /api/metrics/requests/
+REQUEST_METRICS = env.bool('REQUEST_METRICS', default=False)
+# Métriques Prometheus sur /metrics (PROMETHEUS_MULTIPROC_DIR sous gunicorn),
+# lisibles sans authentification depuis ces réseaux, par un admin sinon. Boucle locale
+# seulement par défaut : un port publié par Docker arrive depuis le réseau 172.16.0.0/12
+PROMETHEUS_METRICS = env.bool('PROMETHEUS_METRICS', default=True)
+METRICS_ALLOWED_NETWORKS = env.list('METRICS_ALLOWED_NETWORKS', default=['127.0.0.0/8', '::1/128'])
+
 MIDDLEWARE = [
+    'core.middleware.PrometheusMiddleware',
+    'core.middleware.ServerTimingMiddleware',
+    'core.middleware.RequestMetricsMiddleware',
+    'core.middleware.ReplicaRoutingMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
+    'whitenoise.middleware.WhiteNoiseMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.locale.LocaleMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -127,7 +185,7 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
-    'djangorestframework_camel_case.middleware.CamelCaseMiddleWare',
+    'core.middleware.CamelCaseQueryParamsMiddleware',
 ]
 
 ROOT_URLCONF = 'config.urls'
@@ -156,6 +214,32 @@ WSGI_APPLICATION = 'config.wsgi.application'
 DATABASES = {
     'default': env.db('DATABASE_URL')
 }
+# Connexions persistantes : réutilisées d'une requête à l'autre pendant
+# DB_CONN_MAX_AGE secondes, vérifiées avant réutilisation
+DATABASES['default']['CONN_MAX_AGE'] = env.int('DB_CONN_MAX_AGE', default=60)
+DATABASES['default']['CONN_HEALTH_CHECKS'] = env.bool('DB_CONN_HEALTH_CHECKS', default=True)
+# Réplica en lecture (facultatif) : GET/HEAD y lisent, voir core/routers.py
+if env('DATABASE_REPLICA_URL', default=None):
+    DATABASES['replica'] = {
+        **env.db('DATABASE_REPLICA_URL'),
+        'CONN_MAX_AGE': DATABASES['default']['CONN_MAX_AGE'],
+        'CONN_HEALTH_CHECKS': DATABASES['default']['CONN_HEALTH_CHECKS'],
+        # En test, le réplica est la base principale
+        'TEST': {'MIRROR': 'default'},
+    }
+DATABASE_ROUTERS = ['core.routers.PrimaryReplicaRouter']
+# Durée (s) pendant laquelle un utilisateur qui vient d'écrire relit sur la base principale
+DATABASE_REPLICA_STICKINESS = env.int('DATABASE_REPLICA_STICKINESS', default=5)
+# Pool de connexions de psycopg 3 (déploiement ASGI) : exclusif des connexions persistantes
+if env.bool('DB_POOL', default=False):
+    for database in DATABASES.values():
+        if database['ENGINE'] == 'django.db.backends.postgresql':
+            database['CONN_MAX_AGE'] = 0
+            database.setdefault('OPTIONS', {})['pool'] = {
+                'min_size': env.int('DB_POOL_MIN_SIZE', default=2),
+                'max_size': env.int('DB_POOL_MAX_SIZE', default=10),
+                'timeout': env.int('DB_POOL_TIMEOUT', default=10),
+            }
 
 
 # Password validation
@@ -196,4 +280,14 @@ STATIC_URL = 'static/'
 
 STATIC_ROOT = BASE_DIR / "staticfiles"
 
+# Fichiers statiques servis par WhiteNoise : noms hachés (cache navigateur
+# illimité) et versions gzip/brotli produites par collectstatic
+STORAGES = {
+    'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+    'staticfiles': {'BACKEND': 'whitenoise.storage.CompressedManifestStaticFilesStorage'},
+}
+# Sans collectstatic, les noms non hachés restent utilisables en développement ; en
+# production, un fichier absent du manifeste est une erreur plutôt qu'une URL non hachée
+WHITENOISE_MANIFEST_STRICT = DEBUG
+
 AUTH_USER_MODEL = 'users.User'
@@ -0,0 +1,18 @@
+"""
+Réglages des tests (pytest.ini) : ceux de production, avec un hachage rapide
+et des fichiers statiques servis sans collectstatic.
+
+Chaque fixture d'utilisateur appelle `set_password` : avec PBKDF2 (1 million
+d'itérations), la suite passait l'essentiel de son temps à hacher. MD5 n'est
+acceptable que pour des mots de passe jetables de test.
+"""
+from .settings import *  # noqa: F401,F403
+
+PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+
+# Pas de manifeste (collectstatic) en test : noms non hachés, et WhiteNoise lit
+# STATIC_ROOT à la demande au lieu de le parcourir au démarrage
+STORAGES = {**STORAGES, 'staticfiles': {  # noqa: F405
+    'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage',
+}}
+WHITENOISE_AUTOREFRESH = True
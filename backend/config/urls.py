@@ -19,11 +19,18 @@ from django.urls import path, include
 from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
 
+from core.views import PrometheusMetricsView, RequestMetricsView
+
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('api/users/', include('users.urls')),
     path('api/customers/', include('customers.urls')),
 
+    # Mesures internes (REQUEST_METRICS), réservées aux administrateurs:
+    path('api/metrics/requests/', RequestMetricsView.as_view(), name='request_metrics'),
+    # Prometheus (réseaux internes ou administrateurs):
+    path('metrics', PrometheusMetricsView.as_view(), name='prometheus_metrics'),
+
     # Swagger UI:
     path('api/schema/', SpectacularAPIView.as_view(), name='schema'),
     path('api/docs/', SpectacularSwaggerView.as_view(url_name='schema'), name='swagger-ui'),
@@ -0,0 +1,11 @@
+from django.apps import AppConfig
+from django.db.backends.signals import connection_created
+
+
+class CoreConfig(AppConfig):
+    name = 'core'
+
+    def ready(self):
+        from .monitoring import count_connection
+
+        connection_created.connect(count_connection, dispatch_uid='core_count_connections')
@@ -0,0 +1,182 @@
+"""
+Benchmark de l'API en processus, via `APIClient` : même pile que la
+production (middlewares, authentification JWT, rendu), sans réseau.
+
+Chaque scénario enchaîne des appels dont on garde la durée ; les résultats
+(médiane, p95, moyenne, débit séquentiel) se comparent à une référence
+enregistrée : une médiane qui dépasse la référence de plus de la tolérance
+est une régression.
+"""
+import itertools
+import platform
+import random
+import statistics
+import time
+from dataclasses import dataclass
+
+import django
+from django.db import connection
+from django.db.models import Max
+from rest_framework.test import APIClient
+
+from core.dataset import LAST_NAMES, build_customers
+from customers.models import Customer
+from users.models import User
+
+
+@dataclass
+class Scenario:
+    name: str
+    description: str
+    # Part des itérations demandées (la connexion hache le mot de passe : coûteuse)
+    share: float = 1.0
+
+
+SCENARIOS = (
+    Scenario('list', 'GET /api/customers/ (page de 50)'),
+    Scenario('search', 'GET /api/customers/?search=<début de nom>'),
+    Scenario('retrieve', 'GET /api/customers/<id>/ (ids différents, cache froid)'),
+    Scenario('retrieve_cached', 'GET /api/customers/<id>/ (même id, cache chaud)'),
+    Scenario('create', 'POST /api/customers/'),
+    Scenario('token_obtain', 'POST /api/token/', share=0.1),
+    Scenario('token_refresh', 'POST /api/token/refresh/ (rotation)', share=0.5),
+)
+SCENARIO_NAMES = tuple(scenario.name for scenario in SCENARIOS)
+
+
+def summarize(timings):
+    """Statistiques en millisecondes d'une liste de durées en secondes."""
+    ordered = sorted(timings)
+    mean = statistics.fmean(ordered)
+    return {
+        'iterations': len(ordered),
+        'p50_ms': round(statistics.median(ordered) * 1000, 3),
+        'p95_ms': round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000, 3),
+        'mean_ms': round(mean * 1000, 3),
+        'rps': round(1 / mean, 1) if mean else None,
+    }
+
+
+class ApiBenchmark:
+    """
+    Exécute les scénarios contre la base courante, qui doit contenir le jeu
+    de données (`core.dataset`) et l'utilisateur `email` / `password`.
+    """
+
+    def __init__(self, email, password, iterations=200, warmup=20, seed=0):
+        self.email = email
+        self.password = password
+        self.iterations = iterations
+        self.warmup = warmup
+        self.seed = seed
+        self.client = APIClient()
+
+    def login(self):
+        response = self.client.post('/api/token/', {'email': self.email, 'password': self.password}, format='json')
+        return self._check(response).data
+
+    def run(self, names=SCENARIO_NAMES, progress=None):
+        tokens = self.login()
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {tokens['access']}")
+        self.refresh = tokens['refresh']
+
+        rng = random.Random(self.seed)
+        ids = list(Customer.objects.order_by('id').values_list('id', flat=True))
+        ids = rng.sample(ids, min(len(ids), self.iterations + self.warmup))
+        self.ids = itertools.cycle(ids)
+        self.first_id = ids[0]
+        self.terms = itertools.cycle(name[:3].lower() for name in LAST_NAMES)
+        # Emails numérotés après le plus grand id : jamais en conflit avec le jeu de données
+        self.new_customers = iter(build_customers(
+            self.iterations + self.warmup, seed=self.seed + 1,
+            start=Customer.objects.aggregate(start=Max('id'))['start'] or 0,
+        ))
+
+        results = {}
+        for scenario in SCENARIOS:
+            if scenario.name not in names:
+                continue
+            call = getattr(self, f'call_{scenario.name}')
+            iterations = max(int(self.iterations * scenario.share), 5)
+            for _ in range(max(int(self.warmup * scenario.share), 1)):
+                call()
+            timings = []
+            for _ in range(iterations):
+                start = time.perf_counter()
+                call()
+                timings.append(time.perf_counter() - start)
+            results[scenario.name] = summarize(timings)
+            if progress is not None:
+                progress(scenario, results[scenario.name])
+        return results
+
+    def _check(self, response, expected=200):
+        # Un appel en erreur fausserait les mesures : on s'arrête
+        if response.status_code != expected:
+            raise RuntimeError(f'{response.request["PATH_INFO"]} : {response.status_code} {response.content[:200]!r}')
+        return response
+
+    # --- Scénarios ---------------------------------------------------------------
+
+    def call_list(self):
+        self._check(self.client.get('/api/customers/', {'page_size': 50}))
+
+    def call_search(self):
+        self._check(self.client.get('/api/customers/', {'search': next(self.terms)}))
+
+    def call_retrieve(self):
+        self._check(self.client.get(f'/api/customers/{next(self.ids)}/'))
+
+    def call_retrieve_cached(self):
+        self._check(self.client.get(f'/api/customers/{self.first_id}/'))
+
+    def call_create(self):
+        customer = next(self.new_customers)
+        self._check(self.client.post('/api/customers/', {
+            'lastName': customer.last_name,
+            'firstName': customer.first_name,
+            'email': customer.email,
+            'phoneNumber': customer.phone_number,
+            'street': customer.street,
+            'zipCode': customer.zip_code,
+            'city': customer.city,
+        }, format='json'), 201)
+
+    def call_token_obtain(self):
+        self._check(APIClient().post(
+            '/api/token/', {'email': self.email, 'password': self.password}, format='json'
+        ))
+
+    def call_token_refresh(self):
+        # Comme le client web : le jeton renvoyé par la rotation remplace l'ancien
+        response = self._check(APIClient().post('/api/token/refresh/', {'refresh': self.refresh}, format='json'))
+        self.refresh = response.data['refresh']
+
+
+def environment():
+    """Contexte d'exécution enregistré avec les résultats."""
+    return {
+        'python': platform.python_version(),
+        'django': django.get_version(),
+        'database': connection.vendor,
+        'machine': platform.machine(),
+        'customers': Customer.objects.count(),
+        'users': User.objects.count(),
+    }
+
+
+def compare(results, baseline, tolerance):
+    """
+    Compare les médianes à la référence. Retourne `(lignes, régressions)` :
+    une ligne par scénario commun, `(nom, référence, actuel, écart relatif)`.
+    """
+    rows, regressions = [], []
+    for name, current in results.items():
+        reference = baseline.get(name)
+        if reference is None:
+            continue
+        change = current['p50_ms'] / reference['p50_ms'] - 1
+        rows.append((name, reference['p50_ms'], current['p50_ms'], change))
+        if change > tolerance:
+            regressions.append(name)
+    return rows, regressions
@@ -0,0 +1,76 @@
+"""
+Conversion snake_case ↔ camelCase des clés, avec mise en cache par clé.
+
+Mêmes règles que `djangorestframework_camel_case.util`, mais chaque nom de
+clé n'est converti qu'une seule fois par processus : le rendu d'une liste de
+10 000 clients ne repasse plus 10 000 fois les mêmes expressions régulières.
+Les options `ignore_fields` / `ignore_keys` de JSON_CAMEL_CASE ne sont pas
+prises en charge : le projet ne les utilise pas.
+"""
+from functools import lru_cache
+
+from django.http import QueryDict
+from django.utils.datastructures import MultiValueDict
+from django.utils.encoding import force_str
+from django.utils.functional import Promise
+from djangorestframework_camel_case.settings import api_settings
+from djangorestframework_camel_case.util import camel_to_underscore, camelize_re, underscore_to_camel
+
+UNDERSCOREIZE_OPTIONS = api_settings.JSON_UNDERSCOREIZE
+KEY_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=KEY_CACHE_SIZE)
+def camelize_key(key):
+    return camelize_re.sub(underscore_to_camel, key) if '_' in key else key
+
+
+@lru_cache(maxsize=KEY_CACHE_SIZE)
+def underscoreize_key(key):
+    return camel_to_underscore(key, **UNDERSCOREIZE_OPTIONS)
+
+
+def camelize(data):
+    """Renomme récursivement les clés des dictionnaires en camelCase."""
+    if isinstance(data, dict):
+        camelized = {}
+        for key, value in data.items():
+            if isinstance(key, Promise):
+                key = force_str(key)
+            camelized[camelize_key(key) if isinstance(key, str) else key] = camelize(value)
+        return camelized
+    if isinstance(data, (list, tuple)):
+        return [camelize(item) for item in data]
+    return data
+
+
+def underscoreize(data):
+    """Renomme récursivement les clés d'un document JSON en snake_case."""
+    if isinstance(data, dict):
+        return {
+            underscoreize_key(key) if isinstance(key, str) else key: underscoreize(value)
+            for key, value in data.items()
+        }
+    if isinstance(data, list):
+        return [underscoreize(item) for item in data]
+    return data
+
+
+def underscoreize_multivalue(data):
+    """
+    Renomme les clés d'un `QueryDict` / `MultiValueDict` (paramètres d'URL,
+    formulaires, fichiers). Retourne l'objet d'origine si aucune clé ne change,
+    ce qui évite de reconstruire le dictionnaire à chaque requête.
+    """
+    renamed = [(underscoreize_key(key), key) for key in data]
+    if all(new_key == key for new_key, key in renamed):
+        return data
+    if isinstance(data, QueryDict):
+        result = QueryDict(mutable=True, encoding=data.encoding)
+    else:
+        result = MultiValueDict()
+    for new_key, key in renamed:
+        result.setlist(new_key, data.getlist(key))
+    if isinstance(data, QueryDict):
+        result._mutable = data._mutable
+    return result
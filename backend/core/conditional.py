@@ -0,0 +1,171 @@
+import copy
+import hashlib
+import re
+from calendar import timegm
+from contextlib import nullcontext
+
+from django.db import router, transaction
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
+from rest_framework.response import Response
+
+from core.serializers import get_sparse_fieldset
+
+# Suffixe des ETag de détail propres à une représentation partielle (`?fields=` / `?omit=`)
+FIELDSET_SUFFIX = re.compile(r';fs-[0-9a-f]+(?=")')
+
+
+class ConditionalGetMixin:
+    """
+    Requêtes conditionnelles HTTP (ETag / Last-Modified) pour un ModelViewSet
+    dont le modèle a un champ `updated_at`.
+
+    Les validateurs sont calculés avant toute sérialisation : `(pk, updated_at)`
+    lu par une requête légère pour un détail ; pour une liste, l'empreinte des
+    couples `(pk, updated_at)` de la page déjà chargée par la pagination (sans
+    COUNT(*) : une création, une modification ou une suppression dans la page
+    change l'empreinte). `If-None-Match` / `If-Modified-Since` répondent alors
+    304 sans sérialiser, et `If-Match` / `If-Unmodified-Since` protègent les
+    écritures (412 si l'objet a changé entre-temps) : la vérification et
+    l'écriture se font dans une même transaction, la ligne verrouillée par
+    `SELECT … FOR UPDATE`, pour que deux clients porteurs du même ETag ne
+    puissent pas écrire tous les deux.
+
+    L'ETag d'un détail partiel (`?fields=` / `?omit=`) porte en plus
+    l'empreinte des champs demandés : chaque représentation a le sien.
+
+    Les listes n'ont pas de `Last-Modified` : une suppression ne fait pas
+    avancer `max(updated_at)`, seul l'ETag en rend compte.
+    """
+    version_field = 'updated_at'
+
+    # --- Validateurs -----------------------------------------------------------
+
+    def get_object_version(self, lock=False):
+        """
+        `(pk, updated_at)` de l'objet ciblé, ou `None` s'il n'existe pas ; avec
+        `lock`, la ligne reste verrouillée jusqu'à la fin de la transaction.
+        """
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        queryset = self.filter_queryset(self.get_queryset())
+        if lock:
+            queryset = queryset.select_for_update()
+        return queryset.filter(
+            **{self.lookup_field: self.kwargs[lookup_url_kwarg]}
+        ).values_list('pk', self.version_field).first()
+
+    def get_object_validators(self, pk, updated_at):
+        etag = f'{pk}-{updated_at.timestamp():.6f}'
+        fields, omit = get_sparse_fieldset(self.request)
+        if fields is not None or omit is not None:
+            fieldset = f'{sorted(fields or ())}|{sorted(omit or ())}'
+            etag += f';fs-{hashlib.md5(fieldset.encode(), usedforsecurity=False).hexdigest()[:12]}'
+        return quote_etag(etag), timegm(updated_at.utctimetuple())
+
+    def get_list_etag(self, request, objects):
+        digest = hashlib.md5(request.get_full_path().encode(), usedforsecurity=False)
+        for obj in objects:
+            digest.update(f'|{obj.pk}-{getattr(obj, self.version_field).timestamp():.6f}'.encode())
+        return quote_etag(digest.hexdigest())
+
+    # --- Réponses ----------------------------------------------------------------
+
+    def conditional_response(self, request, etag, last_modified=None):
+        """Réponse 304 / 412 si une précondition le demande, sinon `None`."""
+        response = get_conditional_response(request._request, etag=etag, last_modified=last_modified)
+        if response is not None and response.status_code == 304:
+            self.set_validators(response, etag, last_modified)
+        return response
+
+    def set_validators(self, response, etag, last_modified=None):
+        response['ETag'] = etag
+        if last_modified is not None:
+            response['Last-Modified'] = http_date(last_modified)
+        # Le navigateur garde la réponse mais la revalide à chaque fois
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
+
+    @staticmethod
+    def has_write_preconditions(request):
+        return 'HTTP_IF_MATCH' in request.META or 'HTTP_IF_UNMODIFIED_SINCE' in request.META
+
+    def check_write_preconditions(self, request):
+        """
+        Réponse 412 si `If-Match` / `If-Unmodified-Since` ne correspondent plus.
+        À appeler dans la transaction de l'écriture (`write_transaction`) : la
+        ligne lue reste verrouillée jusqu'à l'enregistrement.
+        """
+        if not self.has_write_preconditions(request):
+            return None
+        version = self.get_object_version(lock=True)
+        if version is None:
+            return None
+        http_request = request._request
+        if 'HTTP_IF_MATCH' in request.META:
+            # Une écriture vise l'objet, pas une représentation : l'ETag d'un détail
+            # partiel vaut celui du détail complet. Comparé sur une copie, la
+            # requête reste intacte pour la suite (middlewares, journaux)
+            http_request = copy.copy(http_request)
+            http_request.META = {
+                **request.META, 'HTTP_IF_MATCH': FIELDSET_SUFFIX.sub('', request.META['HTTP_IF_MATCH']),
+            }
+        etag, last_modified = self.get_object_validators(*version)
+        return get_conditional_response(http_request, etag=etag, last_modified=last_modified)
+
+    def write_transaction(self, request):
+        """Transaction de l'écriture conditionnelle ; sans précondition, rien à verrouiller."""
+        if not self.has_write_preconditions(request):
+            return nullcontext()
+        return transaction.atomic(using=router.db_for_write(self.get_queryset().model))
+
+    # --- Actions -----------------------------------------------------------------
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queryset)
+        objects = page if page is not None else list(queryset)
+
+        etag = self.get_list_etag(request, objects)
+        conditional = self.conditional_response(request, etag)
+        if conditional is not None:
+            return conditional
+
+        serializer = self.get_serializer(objects, many=True)
+        if page is not None:
+            response = self.get_paginated_response(serializer.data)
+        else:
+            response = Response(serializer.data)
+        return self.set_validators(response, etag)
+
+    def retrieve(self, request, *args, **kwargs):
+        # Gardée sur la vue pour les mixins suivants (cache du détail)
+        self.object_version = version = self.get_object_version()
+        if version is None:
+            return super().retrieve(request, *args, **kwargs)
+        validators = self.get_object_validators(*version)
+        conditional = self.conditional_response(request, *validators)
+        if conditional is not None:
+            return conditional
+        return self.set_validators(super().retrieve(request, *args, **kwargs), *validators)
+
+    def update(self, request, *args, **kwargs):
+        with self.write_transaction(request):
+            conditional = self.check_write_preconditions(request)
+            if conditional is not None:
+                return conditional
+            response = super().update(request, *args, **kwargs)
+        instance = getattr(self, 'updated_instance', None)
+        if instance is not None:
+            self.set_validators(response, *self.get_object_validators(instance.pk, instance.updated_at))
+        return response
+
+    def perform_update(self, serializer):
+        super().perform_update(serializer)
+        self.updated_instance = serializer.instance
+
+    def destroy(self, request, *args, **kwargs):
+        with self.write_transaction(request):
+            conditional = self.check_write_preconditions(request)
+            if conditional is not None:
+                return conditional
+            return super().destroy(request, *args, **kwargs)
@@ -0,0 +1,130 @@
+"""
+Jeu de données synthétique d'une clinique : clients et personnel avec des
+noms, adresses et téléphones français plausibles.
+
+Tout est tiré d'un `random.Random(seed)` : une même graine donne exactement
+les mêmes lignes (benchmarks reproductibles).
+"""
+import random
+import unicodedata
+
+from django.contrib.auth.hashers import make_password
+from django.db.models import Max
+
+from customers.models import Customer
+from users.models import User
+
+LAST_NAMES = (
+    'Martin', 'Bernard', 'Thomas', 'Petit', 'Robert', 'Richard', 'Durand', 'Dubois', 'Moreau', 'Laurent',
+    'Simon', 'Michel', 'Lefèvre', 'Leroy', 'Roux', 'David', 'Bertrand', 'Morel', 'Fournier', 'Girard',
+    'Bonnet', 'Dupont', 'Lambert', 'Fontaine', 'Rousseau', 'Vincent', 'Müller', 'Lefebvre', 'Faure', 'André',
+    'Mercier', 'Blanc', 'Guérin', 'Boyer', 'Garnier', 'Chevalier', 'François', 'Legrand', 'Gauthier', 'Garcia',
+    'Perrin', 'Robin', 'Clément', 'Morin', 'Nicolas', 'Henry', 'Roussel', 'Mathieu', 'Gautier', 'Masson',
+    'Marchand', 'Duval', 'Denis', 'Dumont', 'Marie', 'Lemaire', 'Noël', 'Meyer', 'Dufour', 'Meunier',
+    'Brun', 'Blanchard', 'Giraud', 'Joly', 'Rivière', 'Lucas', 'Brunet', 'Gaillard', 'Barbier', 'Arnaud',
+    'Le Gall', 'Le Goff', 'Hérault', "N'Diaye", 'Da Silva', 'Bénard', 'Lévêque', 'Œuvrard', 'Zéphir', 'Castex',
+)
+FIRST_NAMES = (
+    'Jean', 'Marie', 'Pierre', 'Nathalie', 'Michel', 'Isabelle', 'André', 'Sylvie', 'Philippe', 'Catherine',
+    'Alain', 'Françoise', 'Nicolas', 'Sandrine', 'Christophe', 'Véronique', 'Stéphane', 'Céline', 'Frédéric',
+    'Hélène', 'Julien', 'Léa', 'Lucas', 'Chloé', 'Hugo', 'Manon', 'Théo', 'Camille', 'Louis', 'Inès',
+    'Gabriel', 'Zoé', 'Raphaël', 'Jade', 'Arthur', 'Louise', 'Noé', 'Anaïs', 'Maël', 'Éloïse',
+    'Jérôme', 'Aurélie', 'Benoît', 'Gaëlle', 'François', 'Agnès', 'Loïc', 'Maëlys', 'Jean-Luc', 'Marie-Claire',
+)
+STREET_TYPES = ('rue', 'avenue', 'boulevard', 'place', 'impasse', 'allée', 'chemin', 'quai')
+STREET_NAMES = (
+    'de la République', 'Victor Hugo', 'Jean Jaurès', 'de la Paix', 'Pasteur', 'du Général de Gaulle',
+    'des Lilas', 'de la Gare', 'Émile Zola', 'des Écoles', 'du Moulin', 'Jules Ferry', 'de l’Église',
+    'des Tilleuls', 'Gambetta', 'du Maréchal Foch', 'Saint-Exupéry', 'des Acacias', 'de Verdun', 'Molière',
+)
+# (code postal, ville)
+CITIES = (
+    ('75011', 'Paris'), ('75015', 'Paris'), ('69003', 'Lyon'), ('13006', 'Marseille'), ('31000', 'Toulouse'),
+    ('06000', 'Nice'), ('44000', 'Nantes'), ('67000', 'Strasbourg'), ('34000', 'Montpellier'),
+    ('33000', 'Bordeaux'), ('59000', 'Lille'), ('35000', 'Rennes'), ('51100', 'Reims'), ('42000', 'Saint-Étienne'),
+    ('83000', 'Toulon'), ('38000', 'Grenoble'), ('21000', 'Dijon'), ('49000', 'Angers'), ('30000', 'Nîmes'),
+    ('63000', 'Clermont-Ferrand'), ('72000', 'Le Mans'), ('29200', 'Brest'), ('37000', 'Tours'),
+    ('80000', 'Amiens'), ('87000', 'Limoges'), ('74000', 'Annecy'), ('64000', 'Pau'), ('20000', 'Ajaccio'),
+)
+EMAIL_DOMAINS = ('gmail.com', 'orange.fr', 'free.fr', 'laposte.net', 'sfr.fr', 'outlook.fr', 'wanadoo.fr')
+DESCRIPTIONS = (
+    '', '', '', 'Chat européen, vacciné.', 'Chien anxieux chez le vétérinaire, prévoir une muselière.',
+    'Deux chats et un lapin nain.', 'Allergie aux antibiotiques (amoxicilline).',
+    'Préfère être contacté par SMS.', 'Berger allemand, suivi dysplasie de la hanche.',
+    'Nouvelle adoption, premier rappel de vaccins à prévoir.',
+)
+STAFF_ROLES = (User.Role.VETERINARIAN,) * 2 + (User.Role.SECRETARY,) * 2 + (User.Role.ADMIN,)
+
+
+def _ascii(value):
+    value = unicodedata.normalize('NFKD', value).encode('ascii', 'ignore').decode()
+    return ''.join(char for char in value.lower() if char.isalnum() or char == '-')
+
+
+def _phone(rng):
+    return f"0{rng.choice('1234567')} " + ' '.join(f'{rng.randrange(100):02d}' for _ in range(4))
+
+
+def _address(rng):
+    zip_code, city = rng.choice(CITIES)
+    number = rng.randint(1, 180)
+    suffix = rng.choice(('', '', '', '', ' bis', ' ter'))
+    return f'{number}{suffix} {rng.choice(STREET_TYPES)} {rng.choice(STREET_NAMES)}', zip_code, city
+
+
+def build_customers(count, seed=0, start=0):
+    """`count` clients non enregistrés ; emails uniques grâce à leur numéro."""
+    rng = random.Random(seed)
+    customers = []
+    for index in range(start, start + count):
+        last_name, first_name = rng.choice(LAST_NAMES), rng.choice(FIRST_NAMES)
+        street, zip_code, city = _address(rng)
+        customers.append(Customer(
+            last_name=last_name,
+            first_name=first_name,
+            email=f'{_ascii(first_name)}.{_ascii(last_name)}.{index}@{rng.choice(EMAIL_DOMAINS)}',
+            phone_number=_phone(rng),
+            street=street,
+            zip_code=zip_code,
+            city=city,
+            archive=rng.random() < 0.05,
+            description=rng.choice(DESCRIPTIONS),
+        ))
+    return customers
+
+
+def build_users(count, password, seed=0, start=0):
+    """
+    `count` membres du personnel (vétérinaires, secrétaires, administrateurs),
+    tous avec le même mot de passe : il n'est haché qu'une fois.
+    """
+    rng = random.Random(seed)
+    hashed = make_password(password)
+    users = []
+    for index in range(start, start + count):
+        last_name, first_name = rng.choice(LAST_NAMES), rng.choice(FIRST_NAMES)
+        street, zip_code, city = _address(rng)
+        users.append(User(
+            email=f'{_ascii(first_name)}.{_ascii(last_name)}.{index}@clinique-veto.fr',
+            first_name=first_name[:30],
+            last_name=last_name[:30],
+            role=STAFF_ROLES[index % len(STAFF_ROLES)],
+            phone_number=_phone(rng),
+            street=street,
+            zip_code=zip_code,
+            city=city,
+            password=hashed,
+        ))
+    return users
+
+
+def generate_dataset(customers, users, password, seed=0, batch_size=1000):
+    """Enregistre le jeu de données ; retourne `(clients créés, utilisateurs créés)`."""
+    # Numérotation après le plus grand id : la commande peut être relancée sans doublon d'email
+    customer_start = Customer.objects.aggregate(start=Max('id'))['start'] or 0
+    user_start = User.objects.aggregate(start=Max('id'))['start'] or 0
+    created_customers = Customer.objects.bulk_create(
+        build_customers(customers, seed, customer_start), batch_size=batch_size
+    )
+    created_users = User.objects.bulk_create(build_users(users, password, seed, user_start), batch_size=batch_size)
+    return len(created_customers), len(created_users)
@@ -0,0 +1,63 @@
+import re
+
+from drf_spectacular.utils import OpenApiParameter
+from rest_framework.filters import BaseFilterBackend
+
+from core.serializers import FIELDS_PARAM, OMIT_PARAM, get_sparse_fieldset, select_field_names
+
+DISPLAY_SOURCE_RE = re.compile(r'^get_(\w+)_display$')
+
+
+class SparseFieldsetFilter(BaseFilterBackend):
+    """
+    Ne charge en base que les colonnes des champs demandés par `?fields=` /
+    `?omit=` (`.only()`), en conservant la clé primaire, les colonnes de tri
+    dont la pagination a besoin et le champ de version de la vue.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        requested, omitted = get_sparse_fieldset(request)
+        if requested is None and omitted is None:
+            return queryset
+
+        readable = {name: field for name, field in view.get_serializer().fields.items() if not field.write_only}
+        columns = self.get_columns(queryset.model, readable, select_field_names(readable, requested, omitted))
+        if columns is None:
+            return queryset
+
+        opts = queryset.model._meta
+        ordering = queryset.query.order_by or opts.ordering
+        columns |= {opts.pk.name} | {name.lstrip('-') for name in ordering if isinstance(name, str)}
+        # Champ de version lu par ConditionalGetMixin pour calculer l'ETag
+        if getattr(view, 'version_field', None):
+            columns.add(view.version_field)
+        concrete = {field.name for field in opts.concrete_fields}
+        return queryset.only(*(columns & concrete))
+
+    def get_columns(self, model, fields, selected):
+        """Colonnes nécessaires aux champs retenus, ou `None` si une source est inconnue."""
+        concrete = {field.name for field in model._meta.concrete_fields}
+        columns = set()
+        for name in selected:
+            source = fields[name].source.split('.')[0]
+            match = DISPLAY_SOURCE_RE.match(source)
+            if source in concrete:
+                columns.add(source)
+            elif match and match.group(1) in concrete:
+                columns.add(match.group(1))
+            else:
+                return None
+        return columns
+
+
+# Paramètres documentés dans le schéma OpenAPI des actions `list` et `retrieve`
+SPARSE_FIELDSET_PARAMETERS = [
+    OpenApiParameter(
+        FIELDS_PARAM, str,
+        description='Champs à renvoyer, séparés par des virgules (ex. `id,lastName,firstName`).',
+    ),
+    OpenApiParameter(
+        OMIT_PARAM, str,
+        description='Champs à exclure, séparés par des virgules (ex. `description`).',
+    ),
+]
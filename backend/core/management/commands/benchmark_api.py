@@ -0,0 +1,133 @@
+import json
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import override_settings, setup_databases, teardown_databases
+from django.utils import timezone
+
+from core.benchmark import SCENARIO_NAMES, ApiBenchmark, compare, environment
+from core.dataset import generate_dataset
+from users.models import User
+
+BENCHMARK_EMAIL = 'benchmark@clinique-veto.fr'
+BENCHMARK_PASSWORD = 'benchmark-password'
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark de l'API (liste, recherche, détail, création, jetons) sur une base "
+        "de test neuve remplie par le générateur de données, comparé à une référence."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--customers', type=int, default=2000, help='Clients générés.')
+        parser.add_argument('--users', type=int, default=20, help='Utilisateurs générés.')
+        parser.add_argument('--iterations', type=int, default=200, help='Appels mesurés par scénario.')
+        parser.add_argument('--warmup', type=int, default=20, help='Appels non mesurés avant chaque scénario.')
+        parser.add_argument('--seed', type=int, default=0, help='Graine du jeu de données.')
+        parser.add_argument(
+            '--scenario', action='append', choices=SCENARIO_NAMES, dest='scenarios',
+            help='Scénario à exécuter (répétable ; défaut : tous).',
+        )
+        parser.add_argument('--output', help='Fichier JSON où écrire les résultats.')
+        parser.add_argument(
+            '--baseline', default=str(settings.BASE_DIR / 'benchmarks' / 'baseline.json'),
+            help='Référence à laquelle comparer les médianes.',
+        )
+        parser.add_argument(
+            '--tolerance', type=float, default=0.25,
+            help='Dégradation relative tolérée de la médiane (0.25 : +25 %%).',
+        )
+        parser.add_argument(
+            '--save-baseline', action='store_true',
+            help='Enregistre les résultats comme nouvelle référence au lieu de comparer.',
+        )
+
+    def handle(self, *args, **options):
+        report = self.run(options)
+
+        if options['output']:
+            self.write_json(Path(options['output']), report)
+        baseline_path = Path(options['baseline'])
+        if options['save_baseline']:
+            self.write_json(baseline_path, report)
+            self.stdout.write(self.style.SUCCESS(f"Référence enregistrée dans {baseline_path}"))
+            return
+        if not baseline_path.exists():
+            self.stdout.write(self.style.WARNING(f"Pas de référence ({baseline_path}) : aucune comparaison."))
+            return
+        self.check_baseline(report, json.loads(baseline_path.read_text()), options['tolerance'])
+
+    def run(self, options):
+        # Bases de test jetables pour tous les alias : le réplica éventuel devient un
+        # miroir de la base de test (TEST.MIRROR), le benchmark ne touche jamais aux vraies données
+        old_config = setup_databases(verbosity=0, interactive=False, serialized_aliases=())
+        try:
+            with override_settings(
+                DEBUG=False,
+                ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, 'testserver'],
+                CACHES=self.private_caches(),
+                THROTTLE_CACHE='benchmark_throttle',
+            ):
+                generate_dataset(options['customers'], options['users'], 'vetogest', seed=options['seed'])
+                User.objects.create_user(
+                    email=BENCHMARK_EMAIL, first_name='Banc', last_name="D'essai",
+                    password=BENCHMARK_PASSWORD, role=User.Role.ADMIN,
+                )
+                self.stdout.write(
+                    f"{options['customers']} clients, {options['users']} utilisateurs ({connection.vendor})"
+                )
+                benchmark = ApiBenchmark(
+                    BENCHMARK_EMAIL, BENCHMARK_PASSWORD,
+                    iterations=options['iterations'], warmup=options['warmup'], seed=options['seed'],
+                )
+                env = environment()
+                results = benchmark.run(options['scenarios'] or SCENARIO_NAMES, progress=self.report_scenario)
+        finally:
+            teardown_databases(old_config, verbosity=0)
+        return {'created_at': timezone.now().isoformat(), 'environment': env, 'results': results}
+
+    def private_caches(self):
+        """
+        Caches en mémoire propres au benchmark à la place de tous les alias
+        configurés : les utilisateurs, fiches et marqueurs de la base de test
+        ne doivent jamais atteindre le cache partagé (Redis) de production, où
+        leurs identifiants désignent de vrais comptes.
+        """
+        aliases = {*settings.CACHES, 'default', settings.CUSTOMERS_DETAIL_CACHE}
+        return {
+            **{alias: {
+                'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+                'LOCATION': f'benchmark-{alias}',
+            } for alias in aliases},
+            # Cache factice pour les compteurs : la connexion répétée n'est pas limitée
+            'benchmark_throttle': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'},
+        }
+
+    def report_scenario(self, scenario, stats):
+        self.stdout.write(
+            f"{scenario.name:<16} médiane {stats['p50_ms']:8.2f} ms  p95 {stats['p95_ms']:8.2f} ms  "
+            f"{stats['rps']:8.1f} req/s  ({scenario.description})"
+        )
+
+    def write_json(self, path, report):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(report, indent=2, ensure_ascii=False) + '\n')
+
+    def check_baseline(self, report, baseline, tolerance):
+        for key in ('database', 'machine', 'python'):
+            if baseline['environment'].get(key) != report['environment'].get(key):
+                self.stdout.write(self.style.WARNING(
+                    f"Référence mesurée avec {key}={baseline['environment'].get(key)} : comparaison indicative."
+                ))
+        rows, regressions = compare(report['results'], baseline['results'], tolerance)
+        for name, reference, current, change in rows:
+            line = f"{name:<16} référence {reference:8.2f} ms  actuel {current:8.2f} ms  {change:+7.1%}"
+            self.stdout.write(self.style.ERROR(line) if name in regressions else line)
+        if regressions:
+            raise CommandError(
+                f"Régression de plus de {tolerance:.0%} sur la médiane : {', '.join(regressions)}"
+            )
+        self.stdout.write(self.style.SUCCESS(f"Aucune régression au-delà de {tolerance:.0%}."))
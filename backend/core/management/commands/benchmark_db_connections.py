@@ -0,0 +1,69 @@
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.core.signals import request_finished, request_started
+from django.db import connection
+from django.db.backends.signals import connection_created
+
+from users.models import User
+
+
+class Command(BaseCommand):
+    help = (
+        "Mesure la latence d'une requête simple avec et sans connexion persistante "
+        "(cycle request_started / request_finished comme dans un vrai worker)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=500, help='Requêtes simulées par configuration.')
+        parser.add_argument(
+            '--conn-max-age', type=int, default=None,
+            help='CONN_MAX_AGE de la configuration persistante (défaut : réglage actuel, ou 60 s s\'il vaut 0).',
+        )
+
+    def handle(self, *args, **options):
+        configured = connection.settings_dict['CONN_MAX_AGE']
+        persistent = options['conn_max_age'] or configured or 60
+        pooled = bool(connection.settings_dict.get('OPTIONS', {}).get('pool'))
+        self.stdout.write(
+            f"Base : {connection.vendor}, {options['requests']} requêtes par configuration"
+            + (" (pool psycopg actif)" if pooled else "")
+        )
+
+        try:
+            for label, conn_max_age in (
+                ('Sans persistance (CONN_MAX_AGE=0)', 0),
+                (f'Persistante (CONN_MAX_AGE={persistent})', persistent),
+            ):
+                timings, connects = self.measure(conn_max_age, options['requests'])
+                self.stdout.write(
+                    f"{label:<38} médiane {statistics.median(timings) * 1000:6.2f} ms  "
+                    f"p95 {statistics.quantiles(timings, n=20)[-1] * 1000:6.2f} ms  "
+                    f"connexions ouvertes : {connects}"
+                )
+        finally:
+            connection.close()
+            connection.settings_dict['CONN_MAX_AGE'] = configured
+
+    def measure(self, conn_max_age, count):
+        connection.close()
+        connection.settings_dict['CONN_MAX_AGE'] = conn_max_age
+        connects = []
+
+        def count_connection(sender, connection, **kwargs):
+            connects.append(connection)
+
+        connection_created.connect(count_connection)
+        try:
+            timings = []
+            for _ in range(count):
+                start = time.perf_counter()
+                # Les signaux déclenchent close_old_connections(), comme le gestionnaire de requêtes
+                request_started.send(sender=self.__class__)
+                User.objects.filter(pk=0).exists()
+                request_finished.send(sender=self.__class__)
+                timings.append(time.perf_counter() - start)
+        finally:
+            connection_created.disconnect(count_connection)
+        return timings, len(connects)
@@ -0,0 +1,57 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from djangorestframework_camel_case.render import CamelCaseJSONRenderer
+
+from core.renderers import CamelCaseORJSONRenderer
+from customers.models import Customer
+from customers.serializers import CustomerSerializer
+
+
+class Command(BaseCommand):
+    help = "Compare le rendu JSON camelCase d'origine et le rendu orjson sur une liste de clients."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--customers', type=int, default=10_000, help='Nombre de clients par réponse.')
+        parser.add_argument('--repeat', type=int, default=5, help='Nombre de rendus mesurés par moteur.')
+
+    def handle(self, *args, **options):
+        now = timezone.now()
+        customers = [
+            Customer(
+                id=index,
+                last_name=f"Lefèvre{index}",
+                first_name="Hélène",
+                email=f"client{index}@example.com",
+                phone_number="0611223344",
+                street=f"{index} rue de la République",
+                zip_code="69001",
+                city="Lyon",
+                description="Chat européen, vacciné ; allergie aux antibiotiques.",
+                created_at=now,
+                updated_at=now,
+            )
+            for index in range(options['customers'])
+        ]
+        # Le rendu est mesuré seul : la sérialisation est faite une fois pour toutes.
+        payload = {'next': None, 'previous': None, 'results': CustomerSerializer(customers, many=True).data}
+
+        results = {}
+        for label, renderer in (
+            ('CamelCaseJSONRenderer', CamelCaseJSONRenderer()),
+            ('CamelCaseORJSONRenderer', CamelCaseORJSONRenderer()),
+        ):
+            timings = []
+            for _ in range(options['repeat']):
+                start = time.perf_counter()
+                body = renderer.render(payload)
+                timings.append(time.perf_counter() - start)
+            results[label] = (min(timings), body)
+            self.stdout.write(f"{label:<26} meilleur {min(timings) * 1000:8.1f} ms  ({len(body) / 1024:.0f} Kio)")
+
+        (baseline, expected), (fast, body) = results.values()
+        if body != expected:
+            self.stderr.write(self.style.ERROR("Les sorties diffèrent !"))
+            return
+        self.stdout.write(self.style.SUCCESS(f"Sorties identiques, accélération x{baseline / fast:.1f}"))
@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+
+from core.dataset import generate_dataset
+
+
+class Command(BaseCommand):
+    help = (
+        "Crée des clients et des membres du personnel fictifs (noms, adresses et "
+        "téléphones français), reproductibles d'une exécution à l'autre."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--customers', type=int, default=1000, help='Nombre de clients à créer.')
+        parser.add_argument('--users', type=int, default=20, help="Nombre d'utilisateurs à créer.")
+        parser.add_argument('--password', default='vetogest', help='Mot de passe commun des utilisateurs créés.')
+        parser.add_argument('--seed', type=int, default=0, help='Graine du générateur aléatoire.')
+
+    def handle(self, *args, **options):
+        customers, users = generate_dataset(
+            options['customers'], options['users'], options['password'], seed=options['seed']
+        )
+        self.stdout.write(self.style.SUCCESS(f"{customers} clients et {users} utilisateurs créés."))
@@ -0,0 +1,99 @@
+"""
+Agrégats par route des mesures de `core.middleware.RequestMetricsMiddleware`
+(REQUEST_METRICS) : nombre d'appels, histogramme des durées, requêtes SQL,
+temps SQL, de sérialisation et de rendu.
+
+Les agrégats vivent dans la mémoire du processus : sous gunicorn, chaque
+worker a les siens. Ils sont lus par `GET /api/metrics/requests/`.
+"""
+import threading
+from bisect import bisect_left
+from dataclasses import dataclass, field
+
+# Bornes supérieures (s) des classes de l'histogramme des durées
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+# Étapes de core.timing reprises dans les agrégats
+STAGES = ('sql', 'serialize', 'render')
+
+# Méthodes mesurées sous leur nom ; les autres, choisies par le client, sont regroupées
+# pour borner le nombre de séries (agrégats, libellés Prometheus)
+HTTP_METHODS = frozenset({'GET', 'HEAD', 'POST', 'PUT', 'PATCH', 'DELETE', 'OPTIONS'})
+OTHER_METHOD = 'OTHER'
+
+
+def metric_method(method):
+    """Méthode HTTP à utiliser comme libellé : `OTHER` hors HTTP_METHODS."""
+    return method if method in HTTP_METHODS else OTHER_METHOD
+
+
+@dataclass
+class RouteStats:
+    count: int = 0
+    duration: float = 0.0
+    max_duration: float = 0.0
+    queries: int = 0
+    max_queries: int = 0
+    stages: dict = field(default_factory=lambda: dict.fromkeys(STAGES, 0.0))
+    # Une case de plus pour les durées au-delà de la dernière borne
+    buckets: list = field(default_factory=lambda: [0] * (len(DURATION_BUCKETS) + 1))
+
+    def add(self, duration, queries, timings):
+        self.count += 1
+        self.duration += duration
+        self.max_duration = max(self.max_duration, duration)
+        self.queries += queries
+        self.max_queries = max(self.max_queries, queries)
+        for stage in STAGES:
+            self.stages[stage] += timings.get(stage, 0.0)
+        self.buckets[bisect_left(DURATION_BUCKETS, duration)] += 1
+
+    def as_dict(self, route):
+        cumulative = 0
+        histogram = []
+        for bound, count in zip((*DURATION_BUCKETS, None), self.buckets):
+            cumulative += count
+            histogram.append({'le': bound, 'count': cumulative})
+        return {
+            'route': route,
+            'count': self.count,
+            'duration_ms': {
+                'mean': round(self.duration / self.count * 1000, 3),
+                'max': round(self.max_duration * 1000, 3),
+            },
+            'queries': {'mean': round(self.queries / self.count, 2), 'max': self.max_queries},
+            'stage_ms': {stage: round(total / self.count * 1000, 3) for stage, total in self.stages.items()},
+            'histogram': histogram,
+        }
+
+
+class RequestMetrics:
+    """Registre des `RouteStats`, un par `"<méthode> <nom de route>"`."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._routes = {}
+
+    def record(self, route, duration, queries, timings):
+        with self._lock:
+            stats = self._routes.get(route)
+            if stats is None:
+                stats = self._routes[route] = RouteStats()
+            stats.add(duration, queries, timings)
+
+    def snapshot(self):
+        with self._lock:
+            return [stats.as_dict(route) for route, stats in sorted(self._routes.items())]
+
+    def reset(self):
+        with self._lock:
+            self._routes.clear()
+
+
+request_metrics = RequestMetrics()
+
+
+def route_name(request):
+    """`GET customer-detail` ; les URL non résolues et les méthodes inconnues sont regroupées."""
+    match = getattr(request, 'resolver_match', None)
+    return f'{metric_method(request.method)} {match.view_name if match is not None else "<non résolue>"}'
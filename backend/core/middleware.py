@@ -0,0 +1,156 @@
+import time
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.db import connections
+
+from core.camel_case import underscoreize_multivalue
+from core.metrics import request_metrics, route_name
+from core.monitoring import observe_request, view_labels
+from core.routers import current_routing, mark_primary, replica_configured, reset_routing, routing
+from core.timing import add_count, add_timing, format_server_timing, get_counts, get_timings, timed
+
+
+class PrometheusMiddleware:
+    """
+    Durée, statut et taille de réponse de chaque requête, par vue et action,
+    pour `/metrics` (voir `core.monitoring`).
+
+    Activé par le réglage PROMETHEUS_METRICS. À placer en tête de MIDDLEWARE.
+    """
+    view_attr = '_prometheus_view'
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not settings.PROMETHEUS_METRICS:
+            return self.get_response(request)
+
+        start = time.perf_counter()
+        response = self.get_response(request)
+        observe_request(request.method, getattr(request, self.view_attr, None), response, time.perf_counter() - start)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        if settings.PROMETHEUS_METRICS:
+            setattr(request, self.view_attr, view_labels(view_func, request.method))
+
+
+class ServerTimingMiddleware:
+    """
+    Publie les durées collectées pendant la requête dans `Server-Timing`
+    (visible dans l'onglet Réseau du navigateur), plus la durée totale `app`.
+
+    Activé par le réglage `SERVER_TIMING` (ou REQUEST_METRICS). À placer en
+    tête de MIDDLEWARE.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not (settings.SERVER_TIMING or settings.REQUEST_METRICS):
+            return self.get_response(request)
+
+        start = time.perf_counter()
+        response = self.get_response(request)
+        add_timing(request, 'app', time.perf_counter() - start)
+        response['Server-Timing'] = format_server_timing(get_timings(request), get_counts(request))
+        return response
+
+
+class QueryCounter:
+    """`execute_wrapper` qui compte les requêtes SQL et cumule leur durée."""
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.seconds += time.perf_counter() - start
+            self.count += 1
+
+
+class RequestMetricsMiddleware:
+    """
+    Mesure, pour chaque requête, le nombre de requêtes SQL et leur durée
+    d'exécution (toutes bases confondues, hors lecture des lignes par le
+    curseur), en plus des durées de sérialisation et de rendu
+    déjà collectées par `core.timing`. Le tout part dans `Server-Timing`
+    (`sql;desc="<nombre>"`) et dans les agrégats par route de `core.metrics`.
+
+    Activé par le réglage REQUEST_METRICS. À placer juste après
+    `ServerTimingMiddleware`. Les réponses en streaming (export,
+    synchronisation) lisent la base après son passage : leurs requêtes ne
+    sont pas comptées.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not settings.REQUEST_METRICS:
+            return self.get_response(request)
+
+        counter = QueryCounter()
+        start = time.perf_counter()
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(counter))
+            response = self.get_response(request)
+        duration = time.perf_counter() - start
+
+        add_timing(request, 'sql', counter.seconds)
+        add_count(request, 'sql', counter.count)
+        request_metrics.record(route_name(request), duration, counter.count, get_timings(request))
+        return response
+
+
+class CamelCaseQueryParamsMiddleware:
+    """
+    Convertit les clés des paramètres d'URL en snake_case (`?pageSize=` →
+    `page_size`). Les corps de requête sont convertis par les parseurs de
+    `core.parsers` : chaque donnée n'est traduite qu'une fois, via le cache de
+    clés de `core.camel_case`.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if request.GET:
+            with timed(request, 'camel'):
+                request.GET = underscoreize_multivalue(request.GET)
+        return self.get_response(request)
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Active `core.routers.PrimaryReplicaRouter` pour la requête : lectures sur
+    le réplica pour les méthodes sûres, base principale après une écriture,
+    pour la requête puis pour l'utilisateur (DATABASE_REPLICA_STICKINESS).
+
+    Sans DATABASE_REPLICA_URL, ne fait rien.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not replica_configured():
+            return self.get_response(request)
+
+        token = routing(request)
+        try:
+            response = self.get_response(request)
+            state = current_routing()
+            if state.wrote and state.user is not None and response.status_code < 400:
+                mark_primary(state.user)
+        finally:
+            reset_routing(token)
+        return response
@@ -0,0 +1,101 @@
+"""
+Métriques Prometheus, exposées sur `/metrics` (`core.views.PrometheusMetricsView`).
+
+Chaque mesure coûte un incrément sous le verrou de sa série, sans E/S. Sous
+gunicorn, définir PROMETHEUS_MULTIPROC_DIR (répertoire partagé, vidé au
+démarrage par `gunicorn.conf.py`) : chaque worker écrit ses compteurs dans
+des fichiers mmap de ce répertoire, et `/metrics` les agrège tous, quel que
+soit le worker qui répond.
+"""
+import os
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+from core.metrics import metric_method
+
+MULTIPROC_DIR = os.environ.get('PROMETHEUS_MULTIPROC_DIR')
+if MULTIPROC_DIR:
+    # Créé ici aussi hors gunicorn (runserver, commandes)
+    os.makedirs(MULTIPROC_DIR, exist_ok=True)
+
+REQUEST_DURATION = Histogram(
+    'vetogest_http_request_duration_seconds', 'Durée des requêtes HTTP par vue et action.',
+    ['method', 'view', 'action'],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+RESPONSE_SIZE = Histogram(
+    'vetogest_http_response_size_bytes', 'Taille des corps de réponse (hors streaming).',
+    ['method', 'view', 'action'],
+    buckets=(256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304),
+)
+REQUESTS = Counter(
+    'vetogest_http_requests', 'Requêtes HTTP par vue, action et statut.',
+    ['method', 'view', 'action', 'status'],
+)
+DB_CONNECTIONS = Counter(
+    'vetogest_db_connections_opened', 'Connexions ouvertes (ou prises dans le pool) par Django.', ['alias'],
+)
+THROTTLED = Counter(
+    'vetogest_throttle_rejections', 'Requêtes refusées par limitation de débit.', ['scope'],
+)
+JWT_EVENTS = Counter(
+    'vetogest_jwt_events', 'Jetons émis, rafraîchis, mis en liste noire ou refusés.', ['event'],
+)
+
+UNRESOLVED_VIEW = '<non résolue>'
+
+
+def view_labels(view_func, method):
+    """`(vue, action)` : `('CustomerViewSet', 'retrieve')`, action vide hors viewset."""
+    cls = getattr(view_func, 'cls', None) or getattr(view_func, 'view_class', None)
+    name = cls.__name__ if cls is not None else f'{view_func.__module__}.{view_func.__name__}'
+    actions = getattr(view_func, 'actions', None) or {}
+    return name, actions.get(method.lower(), '')
+
+
+# Séries déjà résolues : `labels()` valide et trie les libellés sous verrou à chaque appel
+_request_series = {}
+
+
+def _series(method, view, action, status):
+    key = (method, view, action, status)
+    series = _request_series.get(key)
+    if series is None:
+        series = _request_series[key] = (
+            REQUEST_DURATION.labels(method, view, action),
+            REQUESTS.labels(method, view, action, status),
+            RESPONSE_SIZE.labels(method, view, action),
+        )
+    return series
+
+
+def observe_request(method, labels, response, seconds):
+    view, action = labels or (UNRESOLVED_VIEW, '')
+    duration, requests, size = _series(metric_method(method), view, action, response.status_code)
+    duration.observe(seconds)
+    requests.inc()
+    if not response.streaming:
+        size.observe(len(response.content))
+
+
+def count_connection(sender, connection, **kwargs):
+    """Récepteur `connection_created`."""
+    DB_CONNECTIONS.labels(connection.alias).inc()
+
+
+def render_metrics():
+    """`(contenu, content_type)` au format texte de Prometheus."""
+    if MULTIPROC_DIR:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
@@ -0,0 +1,66 @@
+import json
+import time
+
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import DataAndFiles, FormParser, JSONParser, MultiPartParser
+
+from core.camel_case import underscoreize, underscoreize_multivalue
+from core.timing import add_timing
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson est une dépendance du projet
+    orjson = None
+
+
+class CamelCaseORJSONParser(JSONParser):
+    """
+    Lecture d'un corps JSON camelCase, clés converties en snake_case via le
+    cache de `core.camel_case`. Décodage par orjson quand il est disponible.
+    """
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+        request = parser_context.get('request')
+
+        start = time.perf_counter()
+        try:
+            body = stream.read()
+            if orjson is not None and encoding.lower().replace('-', '') == 'utf8':
+                data = orjson.loads(body)
+            else:
+                data = json.loads(body.decode(encoding))
+        except ValueError as exc:
+            raise ParseError('JSON parse error - %s' % str(exc))
+        decoded = time.perf_counter()
+        data = underscoreize(data)
+        end = time.perf_counter()
+
+        add_timing(request, 'parse', end - start)
+        add_timing(request, 'camel', end - decoded)
+        return data
+
+
+class CamelCaseFormParser(FormParser):
+    """Formulaire `application/x-www-form-urlencoded`, clés en snake_case."""
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        start = time.perf_counter()
+        data = underscoreize_multivalue(super().parse(stream, media_type, parser_context))
+        add_timing(parser_context.get('request'), 'parse', time.perf_counter() - start)
+        return data
+
+
+class CamelCaseMultiPartParser(MultiPartParser):
+    """Formulaire multipart (fichiers compris), clés en snake_case."""
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        start = time.perf_counter()
+        parsed = super().parse(stream, media_type, parser_context)
+        data = DataAndFiles(underscoreize_multivalue(parsed.data), underscoreize_multivalue(parsed.files))
+        add_timing(parser_context.get('request'), 'parse', time.perf_counter() - start)
+        return data
@@ -0,0 +1,25 @@
+import ipaddress
+
+from django.conf import settings
+from rest_framework.permissions import BasePermission
+
+
+class IsInternalNetwork(BasePermission):
+    """
+    Autorise les appels directs depuis METRICS_ALLOWED_NETWORKS (boucle
+    locale par défaut, scraper Prometheus ajouté explicitement). Une requête passée par le proxy
+    (`X-Forwarded-For`) est toujours considérée comme externe : derrière
+    Railway ou nginx, REMOTE_ADDR est l'adresse privée du proxy.
+    """
+
+    def has_permission(self, request, view):
+        if 'HTTP_X_FORWARDED_FOR' in request.META:
+            return False
+        try:
+            address = ipaddress.ip_address(request.META.get('REMOTE_ADDR', ''))
+        except ValueError:
+            return False
+        return any(
+            address in ipaddress.ip_network(network, strict=False)
+            for network in settings.METRICS_ALLOWED_NETWORKS
+        )
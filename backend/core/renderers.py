@@ -0,0 +1,58 @@
+import time
+
+from rest_framework.renderers import BrowsableAPIRenderer, JSONRenderer
+from rest_framework.utils import encoders
+
+from core.camel_case import camelize
+from core.timing import add_timing
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson est une dépendance du projet
+    orjson = None
+
+
+class CamelCaseORJSONRenderer(JSONRenderer):
+    """
+    Rendu JSON camelCase, octet pour octet identique à
+    `djangorestframework_camel_case.render.CamelCaseJSONRenderer`.
+
+    Les clés sont converties via le cache de `core.camel_case`, puis encodées
+    par orjson (encodeur C). Les types qu'orjson ne connaît pas, ainsi que les
+    dates (DRF les tronque à la milliseconde), passent par l'encodeur de DRF.
+    Sans orjson, ou pour une sortie indentée, on retombe sur le rendu standard.
+    """
+    _encoder = encoders.JSONEncoder()
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        renderer_context = renderer_context or {}
+        request = renderer_context.get('request')
+        start = time.perf_counter()
+        data = camelize(data)
+        add_timing(request, 'camel', time.perf_counter() - start)
+
+        if (
+            orjson is None
+            or self.ensure_ascii
+            or not self.compact
+            or self.get_indent(accepted_media_type, renderer_context) is not None
+        ):
+            ret = super().render(data, accepted_media_type, renderer_context)
+        else:
+            ret = orjson.dumps(
+                data,
+                default=self._encoder.default,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME,
+            )
+            # Même échappement que DRF pour rester un sous-ensemble strict de JavaScript
+            ret = ret.replace('\u2028'.encode(), b'\\u2028').replace('\u2029'.encode(), b'\\u2029')
+        add_timing(request, 'render', time.perf_counter() - start)
+        return ret
+
+
+class CamelCaseBrowsableAPIRenderer(BrowsableAPIRenderer):
+    def render(self, data, *args, **kwargs):
+        return super().render(camelize(data), *args, **kwargs)
@@ -0,0 +1,102 @@
+"""
+Routage des lectures vers un réplica PostgreSQL (DATABASE_REPLICA_URL).
+
+Seules les requêtes HTTP de lecture (GET, HEAD, OPTIONS) lisent sur le
+réplica, et seulement tant qu'elles n'ont rien écrit. Après une écriture
+réussie, l'utilisateur reste collé à la base principale pendant
+DATABASE_REPLICA_STICKINESS secondes (marqueur dans le cache partagé) : il
+relit toujours ce qu'il vient d'enregistrer, malgré le retard du réplica.
+Hors requête (commandes, shell), tout passe par la base principale.
+"""
+import contextvars
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.utils.functional import SimpleLazyObject
+from rest_framework.permissions import SAFE_METHODS
+
+REPLICA_DB_ALIAS = 'replica'
+
+_routing = contextvars.ContextVar('db_routing', default=None)
+
+
+def replica_configured():
+    return REPLICA_DB_ALIAS in connections.settings
+
+
+def sticky_key(user_id):
+    return f'db:primary:{user_id}'
+
+
+class RoutingState:
+    """État de routage de la requête HTTP en cours."""
+
+    def __init__(self, request):
+        self.request = request
+        self.wrote = request.method not in SAFE_METHODS
+        self._sticky = None
+
+    @property
+    def user(self):
+        # Utilisateur posé par DRF une fois authentifié ; l'objet paresseux de
+        # AuthenticationMiddleware n'est pas évalué (il lirait la session)
+        user = self.request.__dict__.get('user')
+        if user is None or isinstance(user, SimpleLazyObject) or not user.is_authenticated:
+            return None
+        return user
+
+    def is_sticky(self):
+        if self._sticky is None:
+            user = self.user
+            if user is None:
+                return False
+            self._sticky = bool(cache.get(sticky_key(user.pk)))
+        return self._sticky
+
+    def use_replica(self):
+        return not (
+            self.wrote
+            or connections[DEFAULT_DB_ALIAS].in_atomic_block
+            or self.is_sticky()
+        )
+
+
+def routing(request):
+    """Active le routage pour `request` ; retourne le jeton à passer à `reset_routing`."""
+    return _routing.set(RoutingState(request))
+
+
+def current_routing():
+    return _routing.get()
+
+
+def reset_routing(token):
+    _routing.reset(token)
+
+
+def mark_primary(user):
+    """Colle `user` à la base principale après une écriture."""
+    cache.set(sticky_key(user.pk), True, settings.DATABASE_REPLICA_STICKINESS)
+
+
+class PrimaryReplicaRouter:
+    def db_for_read(self, model, **hints):
+        state = _routing.get()
+        if state is None or not replica_configured() or not state.use_replica():
+            return None
+        return REPLICA_DB_ALIAS
+
+    def db_for_write(self, model, **hints):
+        state = _routing.get()
+        if state is not None:
+            state.wrote = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Mêmes données des deux côtés
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # Le réplica suit la base principale par réplication, jamais par migrate
+        return db != REPLICA_DB_ALIAS
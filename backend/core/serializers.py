@@ -0,0 +1,76 @@
+import time
+
+from djangorestframework_camel_case.util import camel_to_underscore
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.serializers import ListSerializer
+
+from core.timing import add_timing
+
+FIELDS_PARAM = 'fields'
+OMIT_PARAM = 'omit'
+
+
+def _parse_field_list(value):
+    return {camel_to_underscore(name.strip()) for name in value.split(',') if name.strip()}
+
+
+def get_sparse_fieldset(request):
+    """
+    Lit `?fields=` / `?omit=` (noms en camelCase ou snake_case, séparés par des
+    virgules) et retourne `(fields, omit)` en snake_case, `None` si absents.
+
+    Ne s'applique qu'aux lectures : une écriture doit toujours valider et
+    renvoyer l'objet complet.
+    """
+    if request is None or request.method not in SAFE_METHODS:
+        return None, None
+    fields = request.query_params.get(FIELDS_PARAM)
+    omit = request.query_params.get(OMIT_PARAM)
+    return (
+        _parse_field_list(fields) if fields else None,
+        _parse_field_list(omit) if omit else None,
+    )
+
+
+def select_field_names(available, fields, omit):
+    """Noms de `available` retenus par `fields` puis retirés par `omit`."""
+    selected = [name for name in available if fields is None or name in fields]
+    if fields is not None and not selected:
+        # Aucun nom reconnu : on ignore le filtre plutôt que de renvoyer des objets vides
+        selected = list(available)
+    return [name for name in selected if not omit or name not in omit]
+
+
+class SparseFieldsetMixin:
+    """
+    Restreint les champs sérialisés selon `?fields=` / `?omit=`.
+
+    À combiner avec `core.filters.SparseFieldsetFilter` côté vue pour que la
+    requête SQL ne charge, elle aussi, que les colonnes utiles.
+    """
+
+    def get_fields(self):
+        fields = super().get_fields()
+        requested, omitted = get_sparse_fieldset(self.context.get('request'))
+        if requested is None and omitted is None:
+            return fields
+        keep = select_field_names(fields, requested, omitted)
+        return {name: field for name, field in fields.items() if name in keep}
+
+
+class TimedRepresentationMixin:
+    """
+    Ajoute la durée de `to_representation` à l'étape `serialize` de la requête
+    (Server-Timing, métriques par route). Pour une liste, chaque élément est
+    mesuré ; l'itération du queryset (SQL) n'est pas comptée.
+    """
+
+    def to_representation(self, instance):
+        if self.parent is not None and not isinstance(self.parent, ListSerializer):
+            # Serializer imbriqué : déjà compté par son parent
+            return super().to_representation(instance)
+        start = time.perf_counter()
+        try:
+            return super().to_representation(instance)
+        finally:
+            add_timing(self.context.get('request'), 'serialize', time.perf_counter() - start)
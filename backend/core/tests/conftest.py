@@ -0,0 +1,80 @@
+import pytest
+
+from rest_framework.test import APIClient
+
+from customers.models import Customer
+from users.models import User
+
+
+# ============================================================
+# API Fixtures
+# ============================================================
+
+@pytest.fixture
+def api_client():
+    """Client API pour les tests de vues."""
+    return APIClient()
+
+
+# ============================================================
+# User Fixtures
+# ============================================================
+
+@pytest.fixture
+def admin_user(db):
+    """Utilisateur avec le rôle administrateur (non superuser)."""
+    return User.objects.create_user(
+        email="admin@example.com",
+        first_name="Admin",
+        last_name="User",
+        password="adminpass123",
+        role=User.Role.ADMIN
+    )
+
+
+@pytest.fixture
+def veterinarian_user(db):
+    """Utilisateur avec le rôle vétérinaire."""
+    return User.objects.create_user(
+        email="vet@example.com",
+        first_name="Vet",
+        last_name="User",
+        password="vetpass123",
+        role=User.Role.VETERINARIAN
+    )
+
+
+# ============================================================
+# Customer Fixtures
+# ============================================================
+
+@pytest.fixture
+def customer(db):
+    """Un client de test."""
+    return Customer.objects.create(
+        last_name="Dupont",
+        first_name="Jean",
+        email="jean@dupont.com",
+        phone_number="0123456789",
+        street="10 rue de la Paix",
+        zip_code="75000",
+        city="Paris",
+        archive=False,
+        description="Client régulier"
+    )
+
+
+@pytest.fixture
+def customer_data():
+    """Données pour créer un nouveau client."""
+    return {
+        "lastName": "Martin",
+        "firstName": "Marie",
+        "email": "marie@martin.com",
+        "phoneNumber": "0987654321",
+        "street": "20 avenue des Champs",
+        "zipCode": "75008",
+        "city": "Paris",
+        "archive": False,
+        "description": "Nouveau client"
+    }
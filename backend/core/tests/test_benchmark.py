@@ -0,0 +1,92 @@
+import pytest
+from django.core.cache import caches
+from django.core.management import call_command
+
+from core.benchmark import ApiBenchmark, compare
+from core.dataset import build_customers, generate_dataset
+from customers.models import Customer
+from users.models import User
+
+
+@pytest.mark.django_db
+class TestDataset:
+    """Tests du générateur de données de clinique."""
+
+    def test_same_seed_gives_same_rows(self):
+        """Test que la graine rend le jeu de données reproductible."""
+        first = [(c.last_name, c.first_name, c.email, c.street, c.city) for c in build_customers(20, seed=3)]
+        second = [(c.last_name, c.first_name, c.email, c.street, c.city) for c in build_customers(20, seed=3)]
+        assert first == second
+
+    def test_generated_rows_are_valid(self):
+        """Test que les clients et utilisateurs générés respectent le modèle."""
+        generate_dataset(50, 5, "motdepasse")
+
+        customer = Customer.objects.first()
+        customer.full_clean()
+        user = User.objects.first()
+        user.full_clean()
+        assert user.check_password("motdepasse")
+        assert Customer.objects.count() == 50
+        assert User.objects.count() == 5
+
+    def test_command_can_be_run_twice(self):
+        """Test que la commande peut être relancée sans conflit d'email."""
+        call_command("generate_dataset", customers=30, users=3)
+        call_command("generate_dataset", customers=30, users=3)
+
+        assert Customer.objects.count() == 60
+        assert User.objects.count() == 6
+
+
+@pytest.mark.django_db
+class TestApiBenchmark:
+    """Tests du benchmark de l'API et de la comparaison à la référence."""
+
+    def test_runs_scenarios(self, settings):
+        """Test que les scénarios s'exécutent et renvoient leurs statistiques."""
+        settings.CACHES = {**settings.CACHES, "off": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}}
+        settings.THROTTLE_CACHE = "off"
+        generate_dataset(30, 2, "motdepasse")
+        User.objects.create_user(
+            email="bench@example.com", first_name="Banc", last_name="Essai", password="motdepasse",
+            role=User.Role.ADMIN,
+        )
+
+        results = ApiBenchmark("bench@example.com", "motdepasse", iterations=5, warmup=1).run(
+            ["list", "search", "retrieve", "create", "token_refresh"]
+        )
+
+        assert set(results) == {"list", "search", "retrieve", "create", "token_refresh"}
+        assert all(stats["iterations"] == 5 and stats["p50_ms"] > 0 for stats in results.values())
+
+    def test_compare_flags_slower_medians(self):
+        """Test qu'une médiane au-delà de la tolérance est une régression."""
+        baseline = {"list": {"p50_ms": 10.0}, "create": {"p50_ms": 4.0}}
+        results = {"list": {"p50_ms": 13.0}, "create": {"p50_ms": 4.2}, "search": {"p50_ms": 40.0}}
+
+        rows, regressions = compare(results, baseline, tolerance=0.25)
+
+        assert regressions == ["list"]
+        assert [row[0] for row in rows] == ["list", "create"]
+
+
+@pytest.mark.django_db
+class TestBenchmarkCommand:
+    """Tests de la commande benchmark_api."""
+
+    def test_leaves_the_real_caches_untouched(self, mocker, tmp_path, admin_user):
+        """Test que le benchmark n'écrit ni n'efface rien dans les caches configurés."""
+        # La base de test de pytest tient lieu de base jetable
+        mocker.patch("core.management.commands.benchmark_api.setup_databases", return_value=[])
+        mocker.patch("core.management.commands.benchmark_api.teardown_databases")
+        real_cache = caches["default"]
+        real_cache.clear()
+        real_cache.set("sentinel", "valeur")
+
+        call_command(
+            "benchmark_api", customers=10, users=1, iterations=2, warmup=0, scenario=["retrieve", "token_refresh"],
+            baseline=str(tmp_path / "absente.json"), stdout=mocker.MagicMock(),
+        )
+
+        assert list(real_cache._cache) == [real_cache.make_key("sentinel")]
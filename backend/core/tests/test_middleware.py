@@ -0,0 +1,137 @@
+import pytest
+from django.http import QueryDict
+from rest_framework import status
+
+from core.camel_case import underscoreize_multivalue
+from core.metrics import request_metrics
+from customers.models import Customer
+
+
+class TestUnderscoreizeMultivalue:
+    """Tests de la conversion des clés de paramètres d'URL."""
+
+    def test_keys_are_converted_and_lists_kept(self):
+        """Test que les clés sont converties et les valeurs multiples conservées."""
+        data = underscoreize_multivalue(QueryDict("pageSize=2&lastName=a&lastName=b"))
+        assert data["page_size"] == "2"
+        assert data.getlist("last_name") == ["a", "b"]
+        assert not data._mutable
+
+    def test_unchanged_keys_return_same_object(self):
+        """Test qu'aucun dictionnaire n'est reconstruit si les clés sont déjà en snake_case."""
+        query = QueryDict("search=lea&page_size=2")
+        assert underscoreize_multivalue(query) is query
+
+
+@pytest.mark.django_db
+class TestCamelCaseQueryParamsMiddleware:
+    """Tests de la conversion des paramètres d'URL au niveau des vues."""
+
+    def test_camel_case_query_param_is_understood(self, api_client, admin_user, customer):
+        """Test que `?pageSize=` est compris comme `page_size`."""
+        api_client.force_authenticate(user=admin_user)
+        Customer.objects.create(
+            last_name="Zola", first_name="Émile", email="emile@example.com", phone_number="01",
+            street="1 rue Test", zip_code="75000", city="Paris",
+        )
+        response = api_client.get("/api/customers/", {"pageSize": 1})
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data["results"]) == 1
+
+
+@pytest.mark.django_db
+class TestServerTimingMiddleware:
+    """Tests de l'en-tête Server-Timing."""
+
+    def test_header_reports_parse_camel_and_render(self, api_client, admin_user, customer_data, settings):
+        """Test que l'en-tête détaille parsing, conversion de clés, rendu et total."""
+        settings.SERVER_TIMING = True
+        api_client.force_authenticate(user=admin_user)
+        response = api_client.post("/api/customers/", customer_data, format="json")
+        assert response.status_code == status.HTTP_201_CREATED
+        names = {metric.split(";")[0].strip() for metric in response["Server-Timing"].split(",")}
+        assert {"parse", "camel", "render", "app"} <= names
+
+    def test_header_absent_when_disabled(self, api_client, admin_user, settings):
+        """Test que l'en-tête n'est pas émis si SERVER_TIMING est désactivé."""
+        settings.SERVER_TIMING = False
+        api_client.force_authenticate(user=admin_user)
+        response = api_client.get("/api/customers/")
+        assert "Server-Timing" not in response
+
+
+@pytest.fixture
+def request_metrics_enabled(settings):
+    settings.REQUEST_METRICS = True
+    request_metrics.reset()
+    yield
+    request_metrics.reset()
+
+
+@pytest.mark.django_db
+class TestRequestMetricsMiddleware:
+    """Tests des mesures SQL / sérialisation / rendu par requête."""
+
+    def test_server_timing_reports_queries_and_stages(self, api_client, admin_user, customer, request_metrics_enabled):
+        """Test que Server-Timing détaille requêtes SQL, sérialisation et rendu."""
+        api_client.force_authenticate(user=admin_user)
+
+        response = api_client.get(f"/api/customers/{customer.id}/")
+
+        metrics = {metric.split(";")[0].strip(): metric for metric in response["Server-Timing"].split(",")}
+        assert {"sql", "serialize", "render", "app"} <= set(metrics)
+        # Version (id, updated_at) puis client
+        assert 'desc="2"' in metrics["sql"]
+
+    def test_metrics_aggregated_per_route(self, api_client, admin_user, customer, request_metrics_enabled):
+        """Test que les mesures sont agrégées par méthode et route."""
+        api_client.force_authenticate(user=admin_user)
+        for _ in range(3):
+            api_client.get("/api/customers/")
+
+        response = api_client.get("/api/metrics/requests/")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["enabled"] is True
+        routes = {route["route"]: route for route in response.data["routes"]}
+        listing = routes["GET customer-list"]
+        assert listing["count"] == 3
+        assert listing["queries"] == {"mean": 1, "max": 1}
+        assert listing["histogram"][-1] == {"le": None, "count": 3}
+        assert set(listing["stage_ms"]) == {"sql", "serialize", "render"}
+
+    def test_unknown_methods_share_one_route(self, api_client, admin_user, request_metrics_enabled):
+        """Test que les méthodes arbitraires d'un client sont agrégées sous OTHER."""
+        api_client.force_authenticate(user=admin_user)
+        for index in range(3):
+            api_client.generic(f"X{index}", "/api/customers/")
+
+        assert [(route["route"], route["count"]) for route in request_metrics.snapshot()] == [
+            ("OTHER customer-list", 3)
+        ]
+
+    def test_metrics_can_be_reset(self, api_client, admin_user, request_metrics_enabled):
+        """Test que DELETE remet les agrégats à zéro."""
+        api_client.force_authenticate(user=admin_user)
+        api_client.get("/api/customers/")
+
+        assert api_client.delete("/api/metrics/requests/").status_code == status.HTTP_204_NO_CONTENT
+        # Seul reste l'appel DELETE lui-même, enregistré après la remise à zéro
+        assert [route["route"] for route in request_metrics.snapshot()] == ["DELETE request_metrics"]
+
+    def test_metrics_endpoint_is_admin_only(self, api_client, customer, veterinarian_user, request_metrics_enabled):
+        """Test que les agrégats sont réservés aux administrateurs."""
+        api_client.force_authenticate(user=veterinarian_user)
+        assert api_client.get("/api/metrics/requests/").status_code == status.HTTP_403_FORBIDDEN
+
+    def test_disabled_by_default(self, api_client, admin_user, settings):
+        """Test que rien n'est mesuré sans REQUEST_METRICS."""
+        settings.REQUEST_METRICS = False
+        settings.SERVER_TIMING = False
+        request_metrics.reset()
+        api_client.force_authenticate(user=admin_user)
+
+        response = api_client.get("/api/customers/")
+
+        assert "Server-Timing" not in response
+        assert request_metrics.snapshot() == []
@@ -0,0 +1,120 @@
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.db.backends.signals import connection_created
+from prometheus_client import REGISTRY
+from rest_framework import status
+
+from core.monitoring import UNRESOLVED_VIEW, _request_series
+
+
+def _sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.mark.django_db
+class TestPrometheusMetrics:
+    """Tests de l'endpoint /metrics et des métriques collectées."""
+
+    def test_requests_are_measured_per_view_and_action(self, api_client, admin_user, customer):
+        """Test que durée, statut et taille sont mesurés par vue et action."""
+        labels = {"method": "GET", "view": "CustomerViewSet", "action": "retrieve"}
+        before = _sample("vetogest_http_request_duration_seconds_count", **labels)
+        api_client.force_authenticate(user=admin_user)
+
+        api_client.get(f"/api/customers/{customer.id}/")
+
+        assert _sample("vetogest_http_request_duration_seconds_count", **labels) == before + 1
+        assert _sample("vetogest_http_response_size_bytes_sum", **labels) > 0
+        assert _sample("vetogest_http_requests_total", status="200", **labels) >= 1
+
+    def test_unknown_methods_share_one_series(self, api_client):
+        """Test que les méthodes arbitraires d'un client ne créent pas de nouvelles séries."""
+        labels = {"method": "OTHER", "view": UNRESOLVED_VIEW, "action": "", "status": "400"}
+        before = _sample("vetogest_http_requests_total", **labels)
+        series = len(_request_series)
+
+        for index in range(5):
+            api_client.generic(f"X{index}", "/api/customers/", HTTP_HOST="inconnu.example.com")
+
+        assert _sample("vetogest_http_requests_total", **labels) == before + 5
+        assert len(_request_series) <= series + 1
+        assert not _sample("vetogest_http_requests_total", **{**labels, "method": "X0"})
+
+    def test_internal_network_can_scrape_without_authentication(self, api_client, admin_user, customer):
+        """Test qu'un appel local lit les métriques sans jeton, au format Prometheus."""
+        api_client.force_authenticate(user=admin_user)
+        api_client.get("/api/customers/")
+        api_client.force_authenticate(user=None)
+
+        response = api_client.get("/metrics")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"].startswith("text/plain")
+        assert (
+            b'vetogest_http_request_duration_seconds_bucket{action="list",le="0.005",method="GET",'
+            b'view="CustomerViewSet"}' in response.content
+        )
+
+    def test_proxied_requests_need_an_admin(self, api_client, admin_user):
+        """Test qu'une requête passée par le proxy n'est pas considérée comme interne, erreur en texte brut."""
+        response = api_client.get("/metrics", HTTP_X_FORWARDED_FOR="203.0.113.7")
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        assert response.content.decode() == str(response.data["detail"])
+
+        api_client.force_authenticate(user=admin_user)
+        response = api_client.get("/metrics", HTTP_X_FORWARDED_FOR="203.0.113.7")
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_external_address_needs_an_admin(self, api_client, veterinarian_user):
+        """Test qu'une adresse hors METRICS_ALLOWED_NETWORKS est refusée."""
+        api_client.force_authenticate(user=veterinarian_user)
+        response = api_client.get("/metrics", REMOTE_ADDR="203.0.113.7")
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_docker_gateway_is_not_internal_by_default(self, api_client):
+        """Test qu'un appel arrivé par un port publié (passerelle Docker) exige une authentification."""
+        response = api_client.get("/metrics", REMOTE_ADDR="172.17.0.1")
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_throttle_rejections_are_counted(self, api_client, mocker):
+        """Test que les refus de throttling sont comptés par portée."""
+        # Horloge figée : les six appels tombent dans la même fenêtre
+        mocker.patch("core.throttling.FixedWindowAnonRateThrottle.timer", return_value=1_000_000.0)
+        before = _sample("vetogest_throttle_rejections_total", scope="anon")
+        for _ in range(6):
+            response = api_client.post("/api/token/", {"email": "x@example.com", "password": "x"}, format="json")
+
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        assert _sample("vetogest_throttle_rejections_total", scope="anon") == before + 1
+
+    def test_jwt_events_are_counted(self, api_client, admin_user):
+        """Test que connexions, rafraîchissements et mises en liste noire sont comptés."""
+        before = {
+            event: _sample("vetogest_jwt_events_total", event=event)
+            for event in ("obtained", "refreshed", "blacklisted", "rejected")
+        }
+        tokens = api_client.post(
+            "/api/token/", {"email": "admin@example.com", "password": "adminpass123"}, format="json"
+        ).data
+        api_client.post("/api/token/refresh/", {"refresh": tokens["refresh"]}, format="json")
+        api_client.post("/api/token/refresh/", {"refresh": tokens["refresh"]}, format="json")
+
+        after = {event: _sample("vetogest_jwt_events_total", event=event) - count for event, count in before.items()}
+        assert after == {"obtained": 1, "refreshed": 1, "blacklisted": 1, "rejected": 1}
+
+    def test_new_connections_are_counted(self):
+        """Test que les ouvertures de connexion sont comptées par base."""
+        before = _sample("vetogest_db_connections_opened_total", alias="default")
+
+        # Signal émis par Django à chaque connexion (la base de test en mémoire n'est jamais fermée)
+        connection_created.send(sender=connection.__class__, connection=connection)
+
+        assert _sample("vetogest_db_connections_opened_total", alias="default") == before + 1
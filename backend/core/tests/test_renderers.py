@@ -0,0 +1,77 @@
+import datetime
+import io
+from decimal import Decimal
+
+import pytest
+from djangorestframework_camel_case.parser import CamelCaseJSONParser
+from djangorestframework_camel_case.render import CamelCaseJSONRenderer
+from rest_framework.exceptions import ParseError
+
+from core.parsers import CamelCaseORJSONParser
+from core.renderers import CamelCaseORJSONRenderer
+from customers.models import Customer
+from customers.serializers import CustomerSerializer
+
+
+@pytest.fixture
+def payload(db):
+    """Réponse paginée réelle, enrichie de valeurs délicates à encoder."""
+    customer = Customer.objects.create(
+        last_name="Lefèvre",
+        first_name="Léa",
+        email="lea@example.com",
+        phone_number="0611223344",
+        street="1 rue de l'Église",
+        zip_code="75000",
+        city="Paris",
+        description="Ligne\u2028séparée \"citée\" 🐶",
+    )
+    return {
+        "next": None,
+        "previous": "http://testserver/api/customers/?cursor=abc",
+        "results": CustomerSerializer([customer], many=True).data,
+        "extra_values": {
+            "decimal_value": Decimal("12.50"),
+            "naive_datetime": datetime.datetime(2026, 1, 2, 3, 4, 5, 678901),
+            "aware_datetime": datetime.datetime(2026, 1, 2, 3, 4, 5, 678901, tzinfo=datetime.timezone.utc),
+            "day_date": datetime.date(2026, 1, 2),
+            "float_value": 0.1,
+            "nested_list": [{"snake_key": 1}, ("tuple_item", None)],
+            "v2_key": True,
+        },
+    }
+
+
+class TestCamelCaseORJSONRenderer:
+    """Tests de compatibilité du rendu rapide avec le rendu camelCase d'origine."""
+
+    def test_output_is_byte_identical(self, payload):
+        """Test que la sortie est identique octet pour octet à CamelCaseJSONRenderer."""
+        assert CamelCaseORJSONRenderer().render(payload) == CamelCaseJSONRenderer().render(payload)
+
+    def test_indented_output_is_identical(self, payload):
+        """Test que la sortie indentée (repli sur DRF) reste identique."""
+        media_type = "application/json; indent=4"
+        assert (
+            CamelCaseORJSONRenderer().render(payload, media_type)
+            == CamelCaseJSONRenderer().render(payload, media_type)
+        )
+
+    def test_none_renders_empty_body(self):
+        """Test qu'une réponse sans données produit un corps vide."""
+        assert CamelCaseORJSONRenderer().render(None) == b""
+
+
+class TestCamelCaseORJSONParser:
+    """Tests de compatibilité de la lecture rapide avec le parseur camelCase d'origine."""
+
+    def test_parsed_data_matches_original_parser(self):
+        """Test que les clés sont converties exactement comme par CamelCaseJSONParser."""
+        body = '{"lastName": "Léa", "zipCode": "75000", "nested": [{"phoneNumber": "06"}], "address2": 1}'.encode()
+        expected = CamelCaseJSONParser().parse(io.BytesIO(body))
+        assert CamelCaseORJSONParser().parse(io.BytesIO(body)) == expected
+
+    def test_invalid_json_raises_parse_error(self):
+        """Test qu'un JSON invalide lève une ParseError."""
+        with pytest.raises(ParseError):
+            CamelCaseORJSONParser().parse(io.BytesIO(b"{invalid"))
@@ -0,0 +1,102 @@
+import pytest
+from django.core.cache import cache
+from django.db import connections
+from rest_framework import status
+
+from core.routers import REPLICA_DB_ALIAS
+from customers.models import Customer
+from users.models import User
+
+
+@pytest.fixture(scope="module", autouse=True)
+def replica(tmp_path_factory, django_db_setup, django_db_blocker):
+    """
+    Deuxième base SQLite jouant le réplica, avec les tables utiles aux tests.
+    Déclarée pour tout le module, avant que pytest-django ne valide les bases
+    autorisées de chaque test.
+    """
+    connections.settings[REPLICA_DB_ALIAS] = {
+        **connections["default"].settings_dict,
+        "NAME": str(tmp_path_factory.mktemp("replica") / "replica.sqlite3"),
+        "TEST": {**connections["default"].settings_dict["TEST"], "MIRROR": None},
+    }
+    with django_db_blocker.unblock():
+        with connections[REPLICA_DB_ALIAS].schema_editor() as editor:
+            editor.create_model(User)
+            editor.create_model(Customer)
+    yield REPLICA_DB_ALIAS
+    with django_db_blocker.unblock():
+        connections[REPLICA_DB_ALIAS].close()
+    del connections[REPLICA_DB_ALIAS]
+    del connections.settings[REPLICA_DB_ALIAS]
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def diverging_customer(replica):
+    """Même client dans les deux bases, avec un nom différent pour savoir où l'on a lu."""
+    values = {
+        "first_name": "Jean", "email": "jean@dupont.com", "phone_number": "0123456789",
+        "street": "10 rue de la Paix", "zip_code": "75000", "city": "Paris",
+    }
+    customer = Customer.objects.create(last_name="Principal", **values)
+    Customer.objects.using(replica).create(id=customer.id, last_name="Replica", **values)
+    yield customer
+    # flush ignore le réplica (allow_migrate le refuse) : nettoyage à la main
+    Customer.objects.using(replica).all().delete()
+
+
+@pytest.mark.django_db(transaction=True, databases=["default", REPLICA_DB_ALIAS])
+class TestPrimaryReplicaRouter:
+    """Tests du routage lecture/écriture entre base principale et réplica."""
+
+    def test_safe_requests_read_from_replica(self, api_client, admin_user, diverging_customer):
+        """Test qu'un GET lit sur le réplica."""
+        api_client.force_authenticate(user=admin_user)
+
+        response = api_client.get(f"/api/customers/{diverging_customer.id}/")
+
+        assert response.data["last_name"] == "Replica"
+
+    def test_writes_go_to_primary(self, api_client, admin_user, diverging_customer):
+        """Test qu'une écriture, et les lectures de la même requête, vont sur la base principale."""
+        api_client.force_authenticate(user=admin_user)
+
+        response = api_client.patch(f"/api/customers/{diverging_customer.id}/", {"city": "Lyon"}, format="json")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["last_name"] == "Principal"
+        assert Customer.objects.using("default").get().city == "Lyon"
+        assert Customer.objects.using(REPLICA_DB_ALIAS).get().city == "Paris"
+
+    def test_user_sticks_to_primary_after_write(self, api_client, admin_user, veterinarian_user, diverging_customer):
+        """Test que l'auteur d'une écriture relit sur la base principale, les autres sur le réplica."""
+        api_client.force_authenticate(user=admin_user)
+        api_client.patch(f"/api/customers/{diverging_customer.id}/", {"city": "Lyon"}, format="json")
+
+        response = api_client.get(f"/api/customers/{diverging_customer.id}/")
+        assert response.data["city"] == "Lyon"
+
+        api_client.force_authenticate(user=veterinarian_user)
+        response = api_client.get(f"/api/customers/{diverging_customer.id}/")
+        assert response.data["last_name"] == "Replica"
+
+    def test_stickiness_expires(self, api_client, admin_user, diverging_customer, settings):
+        """Test qu'une fois la fenêtre écoulée, l'utilisateur relit sur le réplica."""
+        settings.DATABASE_REPLICA_STICKINESS = 0
+        api_client.force_authenticate(user=admin_user)
+        api_client.patch(f"/api/customers/{diverging_customer.id}/", {"city": "Lyon"}, format="json")
+
+        response = api_client.get(f"/api/customers/{diverging_customer.id}/")
+
+        assert response.data["last_name"] == "Replica"
+
+    def test_outside_requests_use_primary(self, diverging_customer):
+        """Test que les lectures hors requête HTTP restent sur la base principale."""
+        assert Customer.objects.get().last_name == "Principal"
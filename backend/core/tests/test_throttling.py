@@ -0,0 +1,104 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+import pytest
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from rest_framework.test import APIRequestFactory
+
+from core.throttling import FixedWindowAnonRateThrottle, FixedWindowUserRateThrottle
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def _anon_request(ip="10.0.0.1"):
+    request = APIRequestFactory().get("/api/customers/", REMOTE_ADDR=ip)
+    request.user = AnonymousUser()
+    return request
+
+
+class FakeTimer:
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class TestFixedWindowThrottle:
+    """Tests du throttling par fenêtre fixe."""
+
+    def _throttle(self, timer, rate="5/min"):
+        throttle = FixedWindowAnonRateThrottle()
+        throttle.rate = rate
+        throttle.num_requests, throttle.duration = throttle.parse_rate(rate)
+        throttle.timer = timer
+        return throttle
+
+    def test_allows_up_to_the_limit(self):
+        """Test que la limite est atteinte exactement, puis que l'attente est indiquée."""
+        timer = FakeTimer(now=60 * 1000 + 15)
+
+        results = [self._throttle(timer).allow_request(_anon_request(), None) for _ in range(6)]
+
+        assert results == [True] * 5 + [False]
+        throttle = self._throttle(timer)
+        assert throttle.allow_request(_anon_request(), None) is False
+        assert throttle.wait() == 45
+
+    def test_new_window_resets_the_counter(self):
+        """Test qu'une nouvelle fenêtre repart de zéro."""
+        timer = FakeTimer(now=60 * 1000)
+        for _ in range(5):
+            self._throttle(timer).allow_request(_anon_request(), None)
+
+        timer.now += 60
+
+        assert self._throttle(timer).allow_request(_anon_request(), None) is True
+
+    def test_clients_are_counted_separately(self):
+        """Test que chaque client a son propre compteur."""
+        timer = FakeTimer()
+        for _ in range(5):
+            self._throttle(timer).allow_request(_anon_request("10.0.0.1"), None)
+
+        assert self._throttle(timer).allow_request(_anon_request("10.0.0.2"), None) is True
+
+    def test_stores_a_single_counter(self):
+        """Test que l'état d'un client est un entier, pas un historique d'horodatages."""
+        timer = FakeTimer(now=60 * 1000)
+        for _ in range(3):
+            self._throttle(timer).allow_request(_anon_request(), None)
+
+        throttle = self._throttle(timer)
+        key = throttle.get_cache_key(_anon_request(), None)
+        assert cache.get(f"{key}:1000") == 3
+
+    def test_concurrent_workers_share_the_limit(self):
+        """Test que des workers concurrents partageant le cache n'acceptent pas plus que la limite."""
+        timer = FakeTimer()
+        barrier = threading.Barrier(8)
+
+        def worker(_):
+            # Une instance par « worker », comme autant de processus derrière le même cache
+            throttle = self._throttle(timer, rate="50/min")
+            barrier.wait()
+            return sum(throttle.allow_request(_anon_request(), None) for _ in range(20))
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            allowed = sum(executor.map(worker, range(8)))
+
+        assert allowed == 50
+
+    def test_user_throttle_uses_user_id(self):
+        """Test que le throttle utilisateur compte par identifiant d'utilisateur."""
+        throttle = FixedWindowUserRateThrottle()
+        request = Mock(user=Mock(is_authenticated=True, pk=42))
+        assert throttle.get_cache_key(request, None) == "throttle_user_42"
+        assert throttle.allow_request(request, None) is True
@@ -0,0 +1,61 @@
+from django.conf import settings
+from django.core.cache import caches
+from rest_framework.throttling import AnonRateThrottle, UserRateThrottle
+
+from core.monitoring import THROTTLED
+
+
+class FixedWindowThrottleMixin:
+    """
+    Limitation par fenêtre fixe pour les throttles DRF : un compteur par
+    client et par fenêtre (`<clé>:<n° de fenêtre>`), incrémenté atomiquement.
+
+    Chaque requête coûte un `add()` ou un `incr()` (INCR sous Redis), au lieu
+    de relire et réécrire l'historique complet des horodatages. Le compteur vit
+    dans le cache THROTTLE_CACHE : partagé (Redis), la limite vaut pour
+    l'ensemble des workers. Contrepartie de la fenêtre fixe : jusqu'à deux fois
+    la limite peut passer à cheval sur deux fenêtres.
+    """
+
+    def get_cache(self):
+        return caches[settings.THROTTLE_CACHE]
+
+    def allow_request(self, request, view):
+        if self.rate is None:
+            return True
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+
+        self.now = self.timer()
+        window = int(self.now // self.duration)
+        self.window_end = (window + 1) * self.duration
+        key = f'{self.key}:{window}'
+        cache = self.get_cache()
+        if cache.add(key, 1, self.duration):
+            count = 1
+        else:
+            try:
+                count = cache.incr(key)
+            except ValueError:
+                # Compteur expiré entre add() et incr() : nouvelle fenêtre
+                cache.set(key, 1, self.duration)
+                count = 1
+        if count > self.num_requests:
+            return self.throttle_failure()
+        return True
+
+    def throttle_failure(self):
+        THROTTLED.labels(self.scope).inc()
+        return False
+
+    def wait(self):
+        return max(self.window_end - self.now, 0)
+
+
+class FixedWindowAnonRateThrottle(FixedWindowThrottleMixin, AnonRateThrottle):
+    pass
+
+
+class FixedWindowUserRateThrottle(FixedWindowThrottleMixin, UserRateThrottle):
+    pass
@@ -0,0 +1,62 @@
+"""
+Mesures par requête exposées dans l'en-tête `Server-Timing`.
+
+Chaque étape ajoute sa durée sur la requête Django via `add_timing` ;
+`core.middleware.ServerTimingMiddleware` les publie en fin de requête.
+"""
+import time
+from contextlib import contextmanager
+
+TIMINGS_ATTR = '_server_timings'
+COUNTS_ATTR = '_server_timing_counts'
+
+
+def _http_request(request):
+    # Une `rest_framework.request.Request` enveloppe la HttpRequest Django
+    return getattr(request, '_request', request)
+
+
+def add_timing(request, name, seconds):
+    """Ajoute `seconds` au compteur `name` de la requête."""
+    if request is None:
+        return
+    timings = _http_request(request).__dict__.setdefault(TIMINGS_ATTR, {})
+    timings[name] = timings.get(name, 0.0) + seconds
+
+
+def get_timings(request):
+    return _http_request(request).__dict__.get(TIMINGS_ATTR, {})
+
+
+def add_count(request, name, count):
+    """Ajoute `count` au nombre d'opérations `name` (ex. requêtes SQL) de la requête."""
+    if request is None:
+        return
+    counts = _http_request(request).__dict__.setdefault(COUNTS_ATTR, {})
+    counts[name] = counts.get(name, 0) + count
+
+
+def get_counts(request):
+    return _http_request(request).__dict__.get(COUNTS_ATTR, {})
+
+
+@contextmanager
+def timed(request, name):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        add_timing(request, name, time.perf_counter() - start)
+
+
+def format_server_timing(timings, counts=None):
+    """
+    `{'parse': 0.0012}` → `parse;dur=1.200` (durées en millisecondes) ; un
+    nombre d'opérations passe en description : `sql;desc="3";dur=0.450`.
+    """
+    counts = counts or {}
+    return ', '.join(
+        f'{name};desc="{counts[name]}";dur={seconds * 1000:.3f}' if name in counts
+        else f'{name};dur={seconds * 1000:.3f}'
+        for name, seconds in timings.items()
+    )
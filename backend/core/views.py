@@ -0,0 +1,66 @@
+import json
+
+from django.conf import settings
+from django.http import HttpResponse
+from drf_spectacular.utils import extend_schema
+from rest_framework import status
+from rest_framework.renderers import BaseRenderer
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from core.metrics import request_metrics
+from core.monitoring import render_metrics
+from core.permissions import IsInternalNetwork
+from users.permissions import IsAdmin
+
+
+class PlainTextRenderer(BaseRenderer):
+    media_type = 'text/plain'
+    format = 'txt'
+    charset = 'utf-8'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        # Erreurs de DRF (401, 403…) : le message seul, pas la représentation du dict
+        if isinstance(data, dict) and 'detail' in data:
+            data = data['detail']
+        if data is None:
+            return b''
+        if not isinstance(data, str):
+            data = json.dumps(data, ensure_ascii=False)
+        return data.encode(self.charset)
+
+
+class RequestMetricsView(APIView):
+    """
+    Agrégats par route de REQUEST_METRICS (processus courant) : appels,
+    durées, histogramme, requêtes SQL et durées par étape. `DELETE` remet les
+    compteurs à zéro.
+    """
+    permission_classes = [IsAdmin]
+
+    @extend_schema(responses={200: {'type': 'object', 'properties': {
+        'enabled': {'type': 'boolean'},
+        'routes': {'type': 'array', 'items': {'type': 'object'}},
+    }}})
+    def get(self, request):
+        return Response({'enabled': settings.REQUEST_METRICS, 'routes': request_metrics.snapshot()})
+
+    @extend_schema(responses={204: None})
+    def delete(self, request):
+        request_metrics.reset()
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class PrometheusMetricsView(APIView):
+    """
+    Métriques au format texte de Prometheus : depuis METRICS_ALLOWED_NETWORKS
+    sans authentification, ou pour un administrateur. Jamais limité en débit.
+    """
+    permission_classes = [IsInternalNetwork | IsAdmin]
+    renderer_classes = [PlainTextRenderer]
+    throttle_classes = []
+
+    @extend_schema(responses={(200, 'text/plain'): str})
+    def get(self, request):
+        content, content_type = render_metrics()
+        return HttpResponse(content, content_type=content_type)
@@ -1,5 +1,22 @@
 from django.apps import AppConfig
+from django.db.backends.signals import connection_created
+from django.db.models.signals import post_delete, post_save
 
 
 class CustomersConfig(AppConfig):
     name = 'customers'
+
+    def ready(self):
+        from .cache import invalidate_cached_detail
+        from .search import register_sqlite_functions
+        from .signals import record_customer_deletion
+
+        connection_created.connect(register_sqlite_functions, dispatch_uid='customers_sqlite_functions')
+        customer_model = self.get_model('Customer')
+        post_delete.connect(
+            record_customer_deletion, sender=customer_model, dispatch_uid='customers_tombstones'
+        )
+        post_save.connect(invalidate_cached_detail, sender=customer_model, dispatch_uid='customers_detail_cache_save')
+        post_delete.connect(
+            invalidate_cached_detail, sender=customer_model, dispatch_uid='customers_detail_cache_delete'
+        )
@@ -0,0 +1,118 @@
+"""
+Cache de la fiche client (`GET /api/customers/<id>/`).
+
+On garde la réponse déjà rendue (JSON camelCase, en octets) : un succès ne
+passe ni par le serializer ni par le renderer, et ne relit pas le client en
+base. L'entrée n'est valable que pour la version `(id, updated_at)` lue par
+`ConditionalGetMixin` : une modification qui contourne les signaux
+(`QuerySet.update()`, `bulk_update`) pose un nouvel `updated_at` et rend
+l'entrée caduque. `post_save` / `post_delete` l'effacent en plus tout de suite.
+
+Le cache est l'alias CUSTOMERS_DETAIL_CACHE de CACHES (mémoire locale par
+défaut, Redis via CACHE_URL). Les compteurs de succès / d'échecs y vivent
+aussi, partagés par les workers si le cache l'est.
+"""
+from django.conf import settings
+from django.core.cache import caches
+from django.http import HttpResponse
+
+from core.serializers import get_sparse_fieldset
+
+HITS_KEY = 'customers:detail:hits'
+MISSES_KEY = 'customers:detail:misses'
+
+
+def get_detail_cache():
+    return caches[settings.CUSTOMERS_DETAIL_CACHE]
+
+
+def detail_cache_key(pk):
+    return f'customers:detail:{pk}'
+
+
+def version_token(updated_at):
+    return f'{updated_at.timestamp():.6f}'
+
+
+def _count(key):
+    cache = get_detail_cache()
+    try:
+        cache.incr(key)
+    except ValueError:
+        # Premier passage (ou compteur évincé) ; au pire un coup perdu en concurrence
+        cache.add(key, 1, None)
+
+
+def get_cached_detail(pk, updated_at):
+    """`(content_type, contenu)` mis en cache pour cette version, sinon `None`."""
+    entry = get_detail_cache().get(detail_cache_key(pk))
+    if entry is not None and entry[0] == version_token(updated_at):
+        _count(HITS_KEY)
+        return entry[1:]
+    _count(MISSES_KEY)
+    return None
+
+
+def set_cached_detail(pk, updated_at, content_type, content):
+    get_detail_cache().set(
+        detail_cache_key(pk),
+        (version_token(updated_at), content_type, content),
+        settings.CUSTOMERS_DETAIL_CACHE_TIMEOUT,
+    )
+
+
+def invalidate_cached_detail(sender, instance, **kwargs):
+    """Récepteur post_save / post_delete de `Customer`."""
+    get_detail_cache().delete(detail_cache_key(instance.pk))
+
+
+def detail_cache_stats():
+    cache = get_detail_cache()
+    counts = cache.get_many([HITS_KEY, MISSES_KEY])
+    hits, misses = counts.get(HITS_KEY, 0), counts.get(MISSES_KEY, 0)
+    return {
+        'hits': hits,
+        'misses': misses,
+        'hit_ratio': round(hits / (hits + misses), 4) if hits + misses else None,
+    }
+
+
+class CachedDetailMixin:
+    """
+    Sert `retrieve` depuis le cache de la fiche client. À placer après
+    `ConditionalGetMixin`, qui fournit la version de l'objet
+    (`object_version`).
+
+    Seule la représentation complète en JSON compact est mise en cache : pas
+    avec `?fields=` / `?omit=`, ni pour l'API navigable. Un succès ne
+    rappelle pas `get_object()` : le viewset ne doit pas dépendre de
+    permissions au niveau de l'objet.
+    """
+
+    def detail_cacheable(self, request):
+        renderer = request.accepted_renderer
+        return (
+            settings.CUSTOMERS_DETAIL_CACHE_TIMEOUT > 0
+            and renderer.format == 'json'
+            and renderer.get_indent(request.accepted_media_type, {}) is None
+            and get_sparse_fieldset(request) == (None, None)
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        version = getattr(self, 'object_version', None)
+        if version is None or not self.detail_cacheable(request):
+            return super().retrieve(request, *args, **kwargs)
+
+        cached = get_cached_detail(*version)
+        if cached is not None:
+            content_type, content = cached
+            return HttpResponse(content, content_type=content_type)
+
+        response = super().retrieve(request, *args, **kwargs)
+
+        def store(response):
+            if response.status_code == 200:
+                set_cached_detail(*version, response['Content-Type'], response.content)
+
+        response.add_post_render_callback(store)
+        return response
@@ -0,0 +1,99 @@
+import csv
+
+from rest_framework import serializers
+
+from core.camel_case import camelize_key
+from core.renderers import CamelCaseORJSONRenderer
+
+# Colonnes exportées, dans l'ordre des fichiers produits
+EXPORT_FIELDS = (
+    'id', 'last_name', 'first_name', 'email', 'phone_number',
+    'street', 'zip_code', 'city', 'archive', 'description',
+    'created_at', 'updated_at',
+)
+CHUNK_SIZE = 2000
+# Premiers caractères qu'Excel ou LibreOffice interprètent comme une formule
+FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+# Préfixe qui force une cellule texte ; doublé devant une valeur qui commence déjà par lui
+FORMULA_ESCAPE = "'"
+
+_datetime_field = serializers.DateTimeField()
+
+
+class _Echo:
+    """Pseudo-fichier pour `csv.writer` : renvoie la ligne au lieu de l'écrire."""
+
+    def write(self, value):
+        return value
+
+
+def _format_row(columns, row):
+    """Dates au format de l'API (fuseau local, ISO 8601) ; le reste tel quel."""
+    return [
+        _datetime_field.to_representation(value) if column in ('created_at', 'updated_at') else value
+        for column, value in zip(columns, row)
+    ]
+
+
+def escape_formula(value):
+    """
+    Neutralise une cellule CSV qui serait exécutée comme formule à l'ouverture
+    du fichier (injection CSV) : `'` en tête. `unescape_formula` la restaure
+    à l'import.
+    """
+    if isinstance(value, str) and value.startswith((*FORMULA_PREFIXES, FORMULA_ESCAPE)):
+        return FORMULA_ESCAPE + value
+    return value
+
+
+def unescape_formula(value):
+    """Inverse de `escape_formula`."""
+    if len(value) > 1 and value[0] == FORMULA_ESCAPE and value[1] in (*FORMULA_PREFIXES, FORMULA_ESCAPE):
+        return value[1:]
+    return value
+
+
+def _rows(queryset, columns):
+    """Tuples lus par curseur serveur, sans instancier de modèles."""
+    return queryset.values_list(*columns).iterator(chunk_size=CHUNK_SIZE)
+
+
+def stream_csv(queryset, columns):
+    """
+    Génère le CSV des clients par paquets de CHUNK_SIZE lignes, en-tête en
+    camelCase comme les clés de l'API. Les booléens sont écrits `true`/`false`,
+    les textes qui ressemblent à une formule sont préfixés (`escape_formula`).
+    """
+    writer = csv.writer(_Echo())
+    yield writer.writerow([camelize_key(column) for column in columns])
+
+    chunk = []
+    for row in _rows(queryset, columns):
+        chunk.append(writer.writerow([
+            ('true' if value else 'false') if isinstance(value, bool) else escape_formula(value)
+            for value in _format_row(columns, row)
+        ]))
+        if len(chunk) >= CHUNK_SIZE:
+            yield ''.join(chunk)
+            chunk = []
+    if chunk:
+        yield ''.join(chunk)
+
+
+def stream_ndjson(queryset, columns):
+    """Génère un objet JSON par ligne et par client (NDJSON), clés en camelCase."""
+    render = CamelCaseORJSONRenderer().render
+    chunk = []
+    for row in _rows(queryset, columns):
+        chunk.append(render(dict(zip(columns, _format_row(columns, row)))) + b'\n')
+        if len(chunk) >= CHUNK_SIZE:
+            yield b''.join(chunk)
+            chunk = []
+    if chunk:
+        yield b''.join(chunk)
+
+
+EXPORT_FORMATS = {
+    'csv': (stream_csv, 'text/csv; charset=utf-8'),
+    'ndjson': (stream_ndjson, 'application/x-ndjson'),
+}
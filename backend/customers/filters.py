@@ -0,0 +1,31 @@
+from rest_framework.filters import BaseFilterBackend
+
+from .search import search_customers
+
+
+class CustomerSearchFilter(BaseFilterBackend):
+    """
+    Recherche `?search=` sur le nom, le prénom, l'email et le téléphone,
+    insensible à la casse et aux accents, triée par pertinence.
+    """
+    search_param = 'search'
+
+    def get_search_term(self, request):
+        return request.query_params.get(self.search_param, '').replace('\x00', '')
+
+    def filter_queryset(self, request, queryset, view):
+        term = self.get_search_term(request)
+        if not term.strip():
+            return queryset
+        return search_customers(queryset, term)
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                'name': self.search_param,
+                'required': False,
+                'in': 'query',
+                'description': 'Recherche partielle (nom, prénom, email, téléphone), insensible aux accents.',
+                'schema': {'type': 'string'},
+            },
+        ]
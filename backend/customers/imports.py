@@ -0,0 +1,136 @@
+import csv
+import io
+import json
+import time
+from dataclasses import dataclass
+
+from django.db import IntegrityError, connection, transaction
+from django.db.backends.postgresql.psycopg_any import is_psycopg3
+from django.utils import timezone
+
+from core.camel_case import underscoreize_key
+from customers.export import unescape_formula
+from customers.models import Customer
+from customers.serializers import CustomerBulkSerializer
+
+# Colonnes chargées par COPY, dans l'ordre du flux envoyé à PostgreSQL
+COPY_COLUMNS = (
+    'last_name', 'first_name', 'email', 'phone_number', 'street', 'zip_code',
+    'city', 'archive', 'description', 'created_at', 'updated_at',
+)
+
+
+@dataclass
+class ImportStats:
+    rows: int = 0
+    imported: int = 0
+    rejected: int = 0
+    seconds: float = 0.0
+
+    @property
+    def rows_per_second(self):
+        return self.rows / self.seconds if self.seconds else 0.0
+
+
+def read_batches(file, batch_size, delimiter=','):
+    """
+    Lit le CSV ligne à ligne et le découpe en paquets de `(numéro de ligne,
+    valeurs)`. Les en-têtes sont acceptés en camelCase (fichiers d'export) ou
+    en snake_case ; les colonnes inconnues sont ignorées par le serializer.
+    Les cellules protégées contre l'injection de formules par l'export sont
+    restaurées.
+    """
+    reader = csv.DictReader(file, delimiter=delimiter, restval='')
+    batch = []
+    for row in reader:
+        batch.append((reader.line_num, {
+            underscoreize_key(key): unescape_formula(value) for key, value in row.items() if key
+        }))
+        if len(batch) >= batch_size:
+            yield reader.fieldnames, batch
+            batch = []
+    if batch:
+        yield reader.fieldnames, batch
+
+
+def copy_customers(rows):
+    """Charge des lignes déjà validées par `COPY ... FROM STDIN` (PostgreSQL)."""
+    now = timezone.now()
+    buffer = io.StringIO()
+    # Tout est entre guillemets : en CSV, COPY lit une valeur vide non citée comme NULL
+    writer = csv.writer(buffer, quoting=csv.QUOTE_ALL)
+    for attrs in rows:
+        values = {'archive': False, 'description': '', **attrs, 'created_at': now, 'updated_at': now}
+        writer.writerow([
+            values[column].isoformat() if column in ('created_at', 'updated_at') else values[column]
+            for column in COPY_COLUMNS
+        ])
+    sql = f'COPY {Customer._meta.db_table} ({", ".join(COPY_COLUMNS)}) FROM STDIN WITH (FORMAT csv)'
+    # COPY passe par le curseur du pilote, hors de la conversion d'erreurs de Django :
+    # sans wrap_database_errors, un doublon lèverait l'IntegrityError du pilote
+    with transaction.atomic(), connection.cursor() as cursor, connection.wrap_database_errors:
+        if is_psycopg3:
+            # psycopg 3 (nécessaire au pool de connexions, voir DB_POOL)
+            with cursor.copy(sql) as copy:
+                copy.write(buffer.getvalue())
+        else:
+            buffer.seek(0)
+            cursor.copy_expert(sql, buffer)
+
+
+class CustomerImporter:
+    """
+    Import d'un fichier CSV de clients, en flux et par paquets.
+
+    Chaque paquet est validé par `CustomerBulkSerializer` (mêmes règles que
+    l'API, unicité des emails vérifiée en une requête par paquet) puis chargé
+    par COPY sous PostgreSQL, ou par `bulk_create` ailleurs et quand COPY bute
+    sur une contrainte. Les lignes refusées sont écrites dans `rejects` avec
+    leur numéro de ligne et leurs erreurs.
+    """
+
+    def __init__(self, batch_size=1000, rejects=None, delimiter=',', use_copy=None, progress=None):
+        self.batch_size = batch_size
+        self.rejects = rejects
+        self.delimiter = delimiter
+        self.use_copy = connection.vendor == 'postgresql' if use_copy is None else use_copy
+        self.progress = progress
+        self._rejects_writer = None
+
+    def run(self, file):
+        stats = ImportStats()
+        start = time.perf_counter()
+        for fieldnames, batch in read_batches(file, self.batch_size, self.delimiter):
+            serializer = CustomerBulkSerializer(data=[values for _, values in batch], many=True)
+            serializer.is_valid(raise_exception=True)
+            self.load(serializer)
+
+            for index, errors in sorted(serializer.row_errors.items()):
+                self.write_reject(fieldnames, *batch[index], errors)
+            stats.rows += len(batch)
+            stats.rejected += len(serializer.row_errors)
+            stats.imported = stats.rows - stats.rejected
+            stats.seconds = time.perf_counter() - start
+            if self.progress is not None:
+                self.progress(stats)
+        stats.seconds = time.perf_counter() - start
+        return stats
+
+    def load(self, serializer):
+        if self.use_copy and serializer.valid_rows:
+            try:
+                copy_customers(attrs for _, _, attrs in serializer.valid_rows)
+                return
+            except IntegrityError:
+                # Email inséré entre la validation et le chargement : repli ligne à ligne
+                pass
+        serializer.save()
+
+    def write_reject(self, fieldnames, line, values, errors):
+        if self.rejects is None:
+            return
+        if self._rejects_writer is None:
+            self._rejects_writer = csv.writer(self.rejects, delimiter=self.delimiter)
+            self._rejects_writer.writerow(['line', 'errors', *fieldnames])
+        raw = [values.get(underscoreize_key(name), '') for name in fieldnames]
+        self._rejects_writer.writerow([line, json.dumps(errors, ensure_ascii=False), *raw])
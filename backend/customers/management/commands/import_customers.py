@@ -0,0 +1,52 @@
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from customers.imports import CustomerImporter
+
+
+class Command(BaseCommand):
+    help = "Importe des clients depuis un fichier CSV (en-têtes de l'export, camelCase ou snake_case)."
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', type=Path, help='Fichier CSV à importer.')
+        parser.add_argument(
+            '--rejects', type=Path,
+            help='Fichier des lignes refusées (défaut : <fichier>.rejets.csv à côté du fichier importé).',
+        )
+        parser.add_argument('--batch-size', type=int, default=1000, help='Lignes validées et chargées par paquet.')
+        parser.add_argument('--delimiter', default=',', help='Séparateur de colonnes.')
+        parser.add_argument('--no-copy', action='store_true', help='Charger par bulk_create même sous PostgreSQL.')
+
+    def handle(self, *args, **options):
+        path = options['path']
+        if not path.is_file():
+            raise CommandError(f"Fichier introuvable : {path}")
+        batch_size = options['batch_size']
+        if not 0 < batch_size <= settings.CUSTOMERS_BULK_MAX_ROWS:
+            raise CommandError(f"--batch-size doit être compris entre 1 et {settings.CUSTOMERS_BULK_MAX_ROWS}.")
+        rejects_path = options['rejects'] or path.with_name(f'{path.stem}.rejets.csv')
+
+        with path.open(encoding='utf-8-sig', newline='') as file, \
+                rejects_path.open('w', encoding='utf-8', newline='') as rejects:
+            importer = CustomerImporter(
+                batch_size=batch_size,
+                rejects=rejects,
+                delimiter=options['delimiter'],
+                use_copy=False if options['no_copy'] else None,
+                progress=self.report_progress,
+            )
+            stats = importer.run(file)
+
+        if not stats.rejected:
+            rejects_path.unlink()
+        self.stdout.write(self.style.SUCCESS(
+            f"{stats.imported} clients importés, {stats.rejected} refusés sur {stats.rows} lignes "
+            f"en {stats.seconds:.1f} s ({stats.rows_per_second:.0f} lignes/s)."
+        ))
+        if stats.rejected:
+            self.stdout.write(self.style.WARNING(f"Lignes refusées : {rejects_path}"))
+
+    def report_progress(self, stats):
+        self.stdout.write(f"{stats.rows} lignes traitées ({stats.rows_per_second:.0f} lignes/s)")
@@ -0,0 +1,22 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from customers.sync import prune_tombstones
+
+
+class Command(BaseCommand):
+    help = (
+        "Supprime les traces de clients supprimés plus anciennes que CUSTOMERS_TOMBSTONE_RETENTION_DAYS "
+        "(à planifier, ex. chaque nuit)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000, help='Lignes supprimées par transaction.')
+
+    def handle(self, *args, **options):
+        if options['batch_size'] < 1:
+            raise CommandError("--batch-size doit être positif.")
+        deleted = prune_tombstones(batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(
+            f"{deleted} traces de suppression de plus de {settings.CUSTOMERS_TOMBSTONE_RETENTION_DAYS} jours supprimées."
+        ))
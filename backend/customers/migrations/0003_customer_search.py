@@ -0,0 +1,46 @@
+# Generated by Django 6.0 on 2026-10-18 10:47
+
+from django.contrib.postgres.operations import TrigramExtension, UnaccentExtension
+from django.db import migrations
+
+SEARCH_FIELDS = ('last_name', 'first_name', 'email', 'phone_number')
+
+# `unaccent` n'est pas IMMUTABLE et ne peut donc pas servir dans un index :
+# on l'enveloppe dans une fonction qui fixe explicitement le dictionnaire.
+CREATE_F_UNACCENT = """
+CREATE OR REPLACE FUNCTION f_unaccent(text) RETURNS text
+LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT
+AS $$ SELECT public.unaccent('public.unaccent'::regdictionary, $1) $$;
+"""
+
+
+def create_search_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(CREATE_F_UNACCENT)
+    for field in SEARCH_FIELDS:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS customer_{field}_trgm_idx ON customers_customer '
+            f'USING gin (f_unaccent(lower({field})) gin_trgm_ops)'
+        )
+
+
+def drop_search_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for field in SEARCH_FIELDS:
+        schema_editor.execute(f'DROP INDEX IF EXISTS customer_{field}_trgm_idx')
+    schema_editor.execute('DROP FUNCTION IF EXISTS f_unaccent(text)')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('customers', '0002_customer_indexes'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        UnaccentExtension(),
+        migrations.RunPython(create_search_indexes, drop_search_indexes),
+    ]
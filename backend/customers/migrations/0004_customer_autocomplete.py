@@ -0,0 +1,33 @@
+# Generated by Django 6.0 on 2026-10-18 11:34
+
+from django.db import migrations
+
+PREFIX_FIELDS = ('last_name', 'first_name')
+
+
+def create_prefix_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for field in PREFIX_FIELDS:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS customer_{field}_prefix_idx ON customers_customer '
+            f'(f_unaccent(lower({field})) text_pattern_ops) WHERE archive = false'
+        )
+
+
+def drop_prefix_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for field in PREFIX_FIELDS:
+        schema_editor.execute(f'DROP INDEX IF EXISTS customer_{field}_prefix_idx')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('customers', '0003_customer_search'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_prefix_indexes, drop_prefix_indexes),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 6.0 on 2026-10-18 14:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('customers', '0004_customer_autocomplete'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='customer',
+            index=models.Index(fields=['updated_at', 'id'], name='customer_updated_idx'),
+        ),
+        migrations.CreateModel(
+            name='CustomerTombstone',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('customer_id', models.BigIntegerField(verbose_name='Client')),
+                ('deleted_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+            ],
+            options={
+                'verbose_name': 'Client supprimé',
+                'verbose_name_plural': 'Clients supprimés',
+                'ordering': ['deleted_at'],
+            },
+        ),
+    ]
@@ -23,6 +23,33 @@ class Customer(models.Model):
         verbose_name = "Client"
         verbose_name_plural = "Clients"
         ordering = ['last_name', 'first_name']
+        indexes = [
+            # Ordre de la liste paginée (keyset sur nom, prénom, id)
+            models.Index(fields=['last_name', 'first_name', 'id'], name='customer_name_idx'),
+            # Même ordre restreint aux clients actifs, les plus consultés
+            models.Index(
+                fields=['last_name', 'first_name', 'id'],
+                condition=models.Q(archive=False),
+                name='customer_active_name_idx',
+            ),
+            models.Index(fields=['city', 'zip_code'], name='customer_city_zip_idx'),
+            # Synchronisation incrémentale (?updated_since=)
+            models.Index(fields=['updated_at', 'id'], name='customer_updated_idx'),
+        ]
 
     def __str__(self):
-        return f"{self.last_name.upper()} {self.first_name}"
\ No newline at end of file
+        return f"{self.last_name.upper()} {self.first_name}"
+
+
+class CustomerTombstone(models.Model):
+    """Trace d'un client supprimé, pour la synchronisation incrémentale des clients."""
+    customer_id = models.BigIntegerField("Client")
+    deleted_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    class Meta:
+        verbose_name = "Client supprimé"
+        verbose_name_plural = "Clients supprimés"
+        ordering = ['deleted_at']
+
+    def __str__(self):
+        return f"Client {self.customer_id} supprimé le {self.deleted_at:%d/%m/%Y}"
@@ -0,0 +1,171 @@
+import base64
+import binascii
+import json
+
+from django.conf import settings
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, _positive_int
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    Pagination par curseur (keyset) sur l'ordre composite du modèle.
+
+    Le curseur encode les valeurs de tri de la dernière ligne vue : chaque page
+    est une recherche par plage sur l'index, sans OFFSET ni COUNT(*), donc son
+    coût ne dépend pas de la profondeur. L'ordre est celui du queryset (ou à
+    défaut `Meta.ordering`), complété par la clé primaire pour départager les
+    doublons.
+    """
+    page_size = 50
+    max_page_size = 200
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'page_size'
+    invalid_cursor_message = 'Curseur invalide.'
+
+    def get_page_size(self, request):
+        try:
+            return _positive_int(
+                request.query_params[self.page_size_query_param],
+                strict=True,
+                cutoff=self.max_page_size,
+            )
+        except (KeyError, ValueError):
+            return self.page_size
+
+    def get_ordering(self, queryset):
+        # Un tri explicite (ex. pertinence de la recherche) prime sur Meta.ordering
+        ordering = queryset.query.order_by or queryset.model._meta.ordering
+        pk_name = queryset.model._meta.pk.name
+        ordering = [f for f in ordering if f.lstrip('-') not in ('pk', pk_name)]
+        return tuple(ordering) + (pk_name,)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(queryset)
+        page_size = self.get_page_size(request)
+        cursor = self.decode_cursor(request)
+        reverse = bool(cursor and cursor['reverse'])
+
+        queryset = queryset.order_by(*(self._flip(f) if reverse else f for f in self.ordering))
+        if cursor:
+            queryset = queryset.filter(self._keyset_filter(cursor['position'], reverse))
+
+        results = list(queryset[:page_size + 1])
+        has_more = len(results) > page_size
+        results = results[:page_size]
+        if reverse:
+            results.reverse()
+            self.has_next, self.has_previous = True, has_more
+        else:
+            self.has_next, self.has_previous = has_more, cursor is not None
+        self.first_position = self._position(results[0]) if results else None
+        self.last_position = self._position(results[-1]) if results else None
+        return results
+
+    def get_paginated_response(self, data):
+        return Response({
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        })
+
+    def get_next_link(self):
+        if not self.has_next or self.last_position is None:
+            return None
+        return self.encode_cursor(self.last_position, reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous or self.first_position is None:
+            return None
+        return self.encode_cursor(self.first_position, reverse=True)
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(encoded.encode('ascii')))
+            position, reverse = payload['p'], bool(payload['r'])
+        except (binascii.Error, ValueError, KeyError, TypeError, UnicodeError):
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(position, list) or len(position) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+        return {'position': position, 'reverse': reverse}
+
+    def encode_cursor(self, position, reverse):
+        payload = json.dumps({'p': position, 'r': int(reverse)}, separators=(',', ':'))
+        encoded = base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii')
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def _position(self, instance):
+        return [getattr(instance, field.lstrip('-')) for field in self.ordering]
+
+    @staticmethod
+    def _flip(field):
+        return field[1:] if field.startswith('-') else f'-{field}'
+
+    def _keyset_filter(self, position, reverse):
+        """
+        Construit `(a, b, id) > (x, y, z)` sous forme de Q portable.
+
+        La borne large sur la première colonne permet au planificateur de
+        démarrer un parcours d'index par plage au lieu de tout filtrer.
+        """
+        lookups = []
+        for field in self.ordering:
+            descending = field.startswith('-')
+            lookups.append((field.lstrip('-'), 'lt' if descending != reverse else 'gt'))
+
+        condition = Q()
+        for index, (name, op) in enumerate(lookups):
+            equal = {prev: value for (prev, _), value in zip(lookups[:index], position)}
+            condition |= Q(**equal, **{f'{name}__{op}': position[index]})
+
+        first_name, first_op = lookups[0]
+        return Q(**{f'{first_name}__{first_op}e': position[0]}) & condition
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                'name': self.cursor_query_param,
+                'required': False,
+                'in': 'query',
+                'description': 'Curseur de pagination renvoyé dans `next` / `previous`.',
+                'schema': {'type': 'string'},
+            },
+            {
+                'name': self.page_size_query_param,
+                'required': False,
+                'in': 'query',
+                'description': 'Nombre de résultats par page.',
+                'schema': {'type': 'integer'},
+            },
+        ]
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'previous': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
+
+
+class CustomerPagination(KeysetPagination):
+    """Pagination de la liste des clients sur (nom, prénom, id)."""
+
+    @property
+    def page_size(self):
+        return settings.CUSTOMERS_PAGE_SIZE
+
+    @property
+    def max_page_size(self):
+        return settings.CUSTOMERS_MAX_PAGE_SIZE
@@ -0,0 +1,90 @@
+import unicodedata
+
+from django.db import connection
+from django.db.models import Case, F, FloatField, Func, Q, Value, When
+from django.db.models.functions import Greatest, Lower
+
+# Colonnes couvertes par la recherche, chacune indexée en trigramme
+# (voir la migration 0003_customer_search) sur `f_unaccent(lower(col))`.
+SEARCH_FIELDS = ('last_name', 'first_name', 'email', 'phone_number')
+
+
+class Unaccent(Func):
+    """
+    Appel à `f_unaccent`, variante IMMUTABLE de `unaccent` créée par migration
+    sous PostgreSQL (condition pour pouvoir l'indexer) et enregistrée comme
+    fonction Python sur les connexions SQLite.
+    """
+    function = 'f_unaccent'
+
+
+def normalize(expression):
+    """Forme comparable d'une colonne ou d'une valeur : minuscules, sans accents."""
+    return Unaccent(Lower(expression))
+
+
+def unaccent(value):
+    """Équivalent Python de `f_unaccent`, utilisé par SQLite."""
+    if value is None:
+        return None
+    decomposed = unicodedata.normalize('NFKD', value)
+    return ''.join(char for char in decomposed if not unicodedata.combining(char))
+
+
+def register_sqlite_functions(sender, connection, **kwargs):
+    """Récepteur `connection_created` : expose `f_unaccent` aux connexions SQLite."""
+    if connection.vendor == 'sqlite':
+        connection.connection.create_function('f_unaccent', 1, unaccent, deterministic=True)
+
+
+def search_customers(queryset, term):
+    """
+    Filtre les clients dont un champ de `SEARCH_FIELDS` contient `term`,
+    sans tenir compte de la casse ni des accents, triés par pertinence.
+
+    Sous PostgreSQL, `f_unaccent(lower(col)) LIKE '%terme%'` est servi par les
+    index GIN trigrammes et le score vient de `word_similarity`. Sous SQLite
+    (tests), la même requête parcourt la table et le score se limite à
+    favoriser les noms qui commencent par le terme.
+    """
+    term = term.strip()
+    if not term:
+        return queryset
+
+    needle = normalize(Value(term))
+    condition = Q()
+    for field in SEARCH_FIELDS:
+        condition |= Q(**{f'search_{field}__contains': needle})
+
+    queryset = queryset.alias(
+        **{f'search_{field}': normalize(F(field)) for field in SEARCH_FIELDS}
+    ).filter(condition)
+
+    if connection.vendor == 'postgresql':
+        from django.contrib.postgres.search import TrigramWordSimilarity
+
+        rank = Greatest(*(TrigramWordSimilarity(needle, F(f'search_{field}')) for field in SEARCH_FIELDS))
+    else:
+        rank = Case(
+            When(Q(search_last_name__startswith=needle) | Q(search_first_name__startswith=needle), then=Value(1.0)),
+            default=Value(0.5),
+            output_field=FloatField(),
+        )
+    return queryset.annotate(rank=rank).order_by('-rank', 'last_name', 'first_name')
+
+
+def autocomplete_customers(queryset, term):
+    """
+    Clients actifs dont le nom ou le prénom commence par `term` (sans accents ni
+    casse), réduits aux colonnes nécessaires au libellé.
+
+    Le préfixe est servi sous PostgreSQL par les index `text_pattern_ops` de la
+    migration 0004_customer_autocomplete.
+    """
+    needle = normalize(Value(term.strip()))
+    return queryset.filter(archive=False).alias(
+        search_last_name=normalize(F('last_name')),
+        search_first_name=normalize(F('first_name')),
+    ).filter(
+        Q(search_last_name__startswith=needle) | Q(search_first_name__startswith=needle)
+    ).order_by('last_name', 'first_name', 'id').only('id', 'last_name', 'first_name')
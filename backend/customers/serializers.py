@@ -1,9 +1,14 @@
+from django.conf import settings
+from django.db import DatabaseError, IntegrityError, transaction
+from django.utils import timezone
 from rest_framework import serializers
+from rest_framework.settings import api_settings
 
+from core.serializers import SparseFieldsetMixin, TimedRepresentationMixin
 from customers.models import Customer
 
 
-class CustomerSerializer(serializers.ModelSerializer):
+class CustomerSerializer(SparseFieldsetMixin, TimedRepresentationMixin, serializers.ModelSerializer):
     class Meta:
         model = Customer
         fields = '__all__'
@@ -14,4 +19,156 @@ class CustomerSerializer(serializers.ModelSerializer):
                     'invalid': 'Cette valeur doit être un booléen (true ou false).'
                 }
             }
-        }
\ No newline at end of file
+        }
+
+
+class CustomerAutocompleteSerializer(serializers.ModelSerializer):
+    """Représentation minimale d'un client pour l'autocomplétion."""
+    label = serializers.CharField(source='__str__', read_only=True)
+
+    class Meta:
+        model = Customer
+        fields = ['id', 'label']
+
+
+class CustomerBulkListSerializer(serializers.ListSerializer):
+    """
+    Création / mise à jour en masse de clients, avec erreurs par ligne.
+
+    Une ligne invalide n'empêche pas l'écriture des autres : elle est reportée
+    dans `row_errors` (index → erreurs). L'unicité des emails est contrôlée
+    pour tout le lot en une seule requête, et l'écriture se fait par
+    `bulk_create` / `bulk_update` en transactions de CUSTOMERS_BULK_BATCH_SIZE
+    lignes.
+    """
+    duplicate_email_message = 'Un client avec cet email existe déjà.'
+    not_found_message = 'Client introuvable.'
+    rejected_message = 'Ligne refusée par la base de données.'
+
+    def to_internal_value(self, data):
+        if not isinstance(data, list):
+            raise serializers.ValidationError({
+                api_settings.NON_FIELD_ERRORS_KEY: ['Une liste de clients est attendue.']
+            })
+        if len(data) > settings.CUSTOMERS_BULK_MAX_ROWS:
+            raise serializers.ValidationError({
+                api_settings.NON_FIELD_ERRORS_KEY: [
+                    f'Au plus {settings.CUSTOMERS_BULK_MAX_ROWS} clients par envoi.'
+                ]
+            })
+
+        instances = {instance.pk: instance for instance in self.instance or []}
+        self.row_errors = {}
+        rows = []
+        for index, item in enumerate(data):
+            instance = None
+            if self.instance is not None:
+                pk = item.get('id') if isinstance(item, dict) else None
+                # True == 1 en Python : un booléen n'est pas un identifiant
+                instance = None if isinstance(pk, bool) else instances.get(pk)
+                if instance is None:
+                    self.row_errors[index] = {'id': [self.not_found_message]}
+                    continue
+            self.child.instance = instance
+            try:
+                rows.append((index, instance, self.child.run_validation(item)))
+            except serializers.ValidationError as exc:
+                self.row_errors[index] = exc.detail
+        self.child.instance = None
+
+        self.check_email_uniqueness(rows)
+        self.valid_rows = [row for row in rows if row[0] not in self.row_errors]
+        return [attrs for _, _, attrs in self.valid_rows]
+
+    def check_email_uniqueness(self, rows):
+        """Emails déjà pris en base ou en double dans le lot : une seule requête."""
+        emails = {attrs['email'] for _, _, attrs in rows if 'email' in attrs}
+        owners = dict(Customer.objects.filter(email__in=emails).values_list('email', 'pk'))
+        seen = set()
+        for index, instance, attrs in rows:
+            email = attrs.get('email')
+            if email is None:
+                continue
+            own_pk = instance.pk if instance is not None else None
+            if owners.get(email, own_pk) != own_pk or email in seen:
+                self.row_errors[index] = {'email': [self.duplicate_email_message]}
+            seen.add(email)
+
+    def create(self, validated_data):
+        objs = [(index, Customer(**attrs)) for index, _, attrs in self.valid_rows]
+        return self._write(
+            objs, lambda chunk: Customer.objects.bulk_create(chunk), lambda obj: obj.save(force_insert=True),
+        )
+
+    def update(self, instances, validated_data):
+        now = timezone.now()
+        fields = {'updated_at'}
+        objs = []
+        for index, instance, attrs in self.valid_rows:
+            for attr, value in attrs.items():
+                setattr(instance, attr, value)
+            # bulk_update ne déclenche pas auto_now : la date sert à la synchro et aux ETag
+            instance.updated_at = now
+            fields.update(attrs)
+            objs.append((index, instance))
+        # Rejeu en UPDATE seul : un client supprimé entre-temps ne doit pas être recréé
+        return self._write(
+            objs, lambda chunk: Customer.objects.bulk_update(chunk, sorted(fields)),
+            lambda obj: obj.save(update_fields=sorted(fields), force_update=True),
+        )
+
+    def _write(self, objs, write_chunk, write_row):
+        """
+        Écrit par paquets, chacun dans sa transaction. Si un paquet viole une
+        contrainte (email inséré entre-temps), ses lignes sont rejouées une à
+        une avec `write_row` pour n'écarter que les fautives.
+        """
+        written = []
+        batch_size = settings.CUSTOMERS_BULK_BATCH_SIZE
+        for start in range(0, len(objs), batch_size):
+            chunk = objs[start:start + batch_size]
+            try:
+                with transaction.atomic():
+                    write_chunk([obj for _, obj in chunk])
+                written.extend(obj for _, obj in chunk)
+            except IntegrityError:
+                for index, obj in chunk:
+                    try:
+                        with transaction.atomic():
+                            write_row(obj)
+                        written.append(obj)
+                    except IntegrityError:
+                        self.row_errors[index] = self._integrity_error(obj)
+                    except DatabaseError:
+                        # UPDATE forcé sans ligne touchée : client supprimé entre-temps
+                        if obj.pk is None or Customer.objects.filter(pk=obj.pk).exists():
+                            raise
+                        self.row_errors[index] = {'id': [self.not_found_message]}
+        return written
+
+    def _integrity_error(self, obj):
+        """Erreur d'une ligne refusée par une contrainte : doublon d'email ou autre."""
+        if Customer.objects.filter(email=obj.email).exclude(pk=obj.pk).exists():
+            return {'email': [self.duplicate_email_message]}
+        return {api_settings.NON_FIELD_ERRORS_KEY: [self.rejected_message]}
+
+    def get_row_errors(self):
+        return [{'index': index, 'errors': errors} for index, errors in sorted(self.row_errors.items())]
+
+
+class CustomerBulkSerializer(CustomerSerializer):
+    """Ligne d'un envoi en masse : l'email est contrôlé pour tout le lot."""
+
+    class Meta(CustomerSerializer.Meta):
+        list_serializer_class = CustomerBulkListSerializer
+        extra_kwargs = {**CustomerSerializer.Meta.extra_kwargs, 'email': {'validators': []}}
+
+
+class CustomerArchiveSerializer(serializers.Serializer):
+    """Ids des clients à archiver en une seule requête."""
+    ids = serializers.ListField(child=serializers.IntegerField(min_value=1), allow_empty=False)
+
+    def validate_ids(self, value):
+        if len(value) > settings.CUSTOMERS_BULK_MAX_ROWS:
+            raise serializers.ValidationError(f'Au plus {settings.CUSTOMERS_BULK_MAX_ROWS} clients par envoi.')
+        return value
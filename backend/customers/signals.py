@@ -0,0 +1,6 @@
+from customers.models import CustomerTombstone
+
+
+def record_customer_deletion(sender, instance, **kwargs):
+    """Récepteur `post_delete` : garde une trace de la suppression pour /changes/."""
+    CustomerTombstone.objects.create(customer_id=instance.pk)
@@ -0,0 +1,106 @@
+import datetime
+
+from django.conf import settings
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from rest_framework import serializers
+
+from core.renderers import CamelCaseORJSONRenderer
+from customers.models import CustomerTombstone
+
+CHUNK_SIZE = 500
+
+
+def tombstone_cutoff():
+    """Date avant laquelle les traces de suppression ont pu être purgées."""
+    return timezone.now() - datetime.timedelta(days=settings.CUSTOMERS_TOMBSTONE_RETENTION_DAYS)
+
+
+def parse_watermark(value):
+    """
+    Date ISO 8601 de `?updated_since=` ; une date sans fuseau est lue en UTC.
+    Un filigrane antérieur à la conservation des suppressions est refusé :
+    des suppressions purgées manqueraient, le client doit tout recharger.
+    """
+    try:
+        watermark = parse_datetime(value)
+    except ValueError:
+        watermark = None
+    if watermark is None:
+        raise serializers.ValidationError({'updated_since': 'Date ISO 8601 invalide.'})
+    if timezone.is_naive(watermark):
+        watermark = timezone.make_aware(watermark, datetime.timezone.utc)
+    if watermark < tombstone_cutoff():
+        raise serializers.ValidationError({'updated_since': (
+            f'Filigrane antérieur à la conservation des suppressions '
+            f'({settings.CUSTOMERS_TOMBSTONE_RETENTION_DAYS} jours) : resynchroniser sans updated_since.'
+        )})
+    return watermark
+
+
+def next_watermark():
+    """
+    Filigrane à renvoyer au client, pris avant la lecture et reculé de
+    CUSTOMERS_SYNC_WATERMARK_MARGIN : `updated_at` est posé à l'écriture, pas
+    au commit. Une transaction qui a daté une ligne avant la lecture mais l'a
+    validée après est invisible maintenant ; le recul garantit qu'elle sera
+    relue au prochain appel, si elle n'a pas duré plus longtemps que la marge.
+    """
+    return timezone.now() - datetime.timedelta(seconds=settings.CUSTOMERS_SYNC_WATERMARK_MARGIN)
+
+
+def get_changes(queryset, since):
+    """
+    Clients créés ou modifiés depuis `since` (tous si `None`) et ids supprimés.
+
+    Le filtre est inclusif et le filigrane reculé (`next_watermark`) : une
+    ligne peut être renvoyée plusieurs fois plutôt que perdue. Le client
+    applique donc les changements de façon idempotente (upsert par id).
+    """
+    customers = queryset.order_by('updated_at', 'id')
+    if since is None:
+        return customers, []
+    customers = customers.filter(updated_at__gte=since)
+    deleted_ids = CustomerTombstone.objects.filter(deleted_at__gte=since).values_list('customer_id', flat=True)
+    return customers, list(deleted_ids)
+
+
+def prune_tombstones(batch_size=1000):
+    """
+    Supprime les traces plus anciennes que CUSTOMERS_TOMBSTONE_RETENTION_DAYS,
+    par paquets de `batch_size` lignes (transactions courtes) ; retourne le
+    nombre supprimé.
+    """
+    cutoff = tombstone_cutoff()
+    deleted = 0
+    while True:
+        ids = list(CustomerTombstone.objects.filter(deleted_at__lt=cutoff).values_list('pk', flat=True)[:batch_size])
+        if not ids:
+            return deleted
+        deleted += CustomerTombstone.objects.filter(pk__in=ids).delete()[0]
+
+
+def stream_changes(serializer, customers, deleted_ids, watermark):
+    """
+    Génère le document `{"watermark", "deleted", "updated"}` par morceaux.
+
+    Les clients sont lus par curseur serveur (`.iterator()`) et encodés par
+    paquets de CHUNK_SIZE : la mémoire reste constante quel que soit le volume.
+    """
+    render = CamelCaseORJSONRenderer().render
+    watermark = serializers.DateTimeField().to_representation(watermark)
+    yield b''.join((
+        b'{"watermark":', render(watermark),
+        b',"deleted":', render(deleted_ids),
+        b',"updated":[',
+    ))
+
+    chunk, separator = [], b''
+    for customer in customers.iterator(chunk_size=CHUNK_SIZE):
+        chunk.append(separator + render(serializer.to_representation(customer)))
+        separator = b','
+        if len(chunk) >= CHUNK_SIZE:
+            yield b''.join(chunk)
+            chunk = []
+    chunk.append(b']}')
+    yield b''.join(chunk)
@@ -1,6 +1,10 @@
 import pytest
+from contextlib import ExitStack, contextmanager
 from unittest.mock import Mock
 
+from django.core.cache import cache
+from django.db import connections
+
 from rest_framework.test import APIClient, APIRequestFactory
 
 from customers.models import Customer
@@ -11,12 +15,45 @@ from users.models import User
 # API Fixtures
 # ============================================================
 
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Vide le cache (fiches clients, throttling) entre les tests."""
+    cache.clear()
+    yield
+    cache.clear()
+
+
 @pytest.fixture
 def api_client():
     """Client API pour les tests de vues."""
     return APIClient()
 
 
+@pytest.fixture
+def query_budget():
+    """
+    Plafond de requêtes SQL (toutes bases) d'un bloc : `with query_budget(2): ...`.
+    Échoue en listant les requêtes exécutées si le budget est dépassé.
+    """
+    @contextmanager
+    def budget(max_queries):
+        queries = []
+
+        def record(execute, sql, params, many, context):
+            queries.append(sql)
+            return execute(sql, params, many, context)
+
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(record))
+            yield queries
+        assert len(queries) <= max_queries, (
+            f"{len(queries)} requêtes SQL pour un budget de {max_queries} :\n" + "\n".join(queries)
+        )
+
+    return budget
+
+
 @pytest.fixture
 def api_request_factory():
     """Factory pour créer des requêtes API (utile pour les serializers)."""
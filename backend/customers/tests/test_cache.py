@@ -0,0 +1,97 @@
+import json
+
+import pytest
+from django.utils import timezone
+from rest_framework import status
+
+from customers.cache import detail_cache_key, get_detail_cache
+from customers.models import Customer
+
+
+@pytest.mark.django_db
+class TestCustomerDetailCache:
+    """Tests du cache de la fiche client."""
+
+    def test_second_read_is_served_from_cache(self, api_client, admin_user, customer, django_assert_num_queries):
+        """Test qu'une fiche relue sort du cache, sans relire le client ni le sérialiser."""
+        api_client.force_authenticate(user=admin_user)
+        first = api_client.get(f"/api/customers/{customer.id}/")
+
+        # Seule reste la lecture de la version (id, updated_at)
+        with django_assert_num_queries(1):
+            second = api_client.get(f"/api/customers/{customer.id}/")
+
+        assert second.status_code == status.HTTP_200_OK
+        assert second.content == first.content
+        assert second["Content-Type"] == first["Content-Type"]
+        assert second["ETag"] == first["ETag"]
+        assert json.loads(second.content)["lastName"] == "Dupont"
+
+    def test_save_invalidates_entry(self, api_client, admin_user, customer):
+        """Test qu'un enregistrement du client efface son entrée."""
+        api_client.force_authenticate(user=admin_user)
+        api_client.get(f"/api/customers/{customer.id}/")
+        assert get_detail_cache().get(detail_cache_key(customer.id)) is not None
+
+        response = api_client.patch(f"/api/customers/{customer.id}/", {"city": "Lyon"}, format="json")
+        assert response.status_code == status.HTTP_200_OK
+        assert get_detail_cache().get(detail_cache_key(customer.id)) is None
+
+        response = api_client.get(f"/api/customers/{customer.id}/")
+        assert json.loads(response.content)["city"] == "Lyon"
+
+    def test_update_without_signals_is_not_served_stale(self, api_client, admin_user, customer):
+        """Test qu'une modification par QuerySet.update() n'est pas masquée par le cache."""
+        api_client.force_authenticate(user=admin_user)
+        api_client.get(f"/api/customers/{customer.id}/")
+
+        Customer.objects.filter(pk=customer.pk).update(city="Lyon", updated_at=timezone.now())
+        response = api_client.get(f"/api/customers/{customer.id}/")
+
+        assert json.loads(response.content)["city"] == "Lyon"
+
+    def test_delete_invalidates_entry(self, api_client, admin_user, customer):
+        """Test qu'une suppression efface l'entrée."""
+        api_client.force_authenticate(user=admin_user)
+        api_client.get(f"/api/customers/{customer.id}/")
+
+        api_client.delete(f"/api/customers/{customer.id}/")
+
+        assert get_detail_cache().get(detail_cache_key(customer.id)) is None
+        assert api_client.get(f"/api/customers/{customer.id}/").status_code == status.HTTP_404_NOT_FOUND
+
+    def test_sparse_fieldset_is_not_cached(self, api_client, admin_user, customer):
+        """Test que ?fields= n'utilise ni ne remplit le cache."""
+        api_client.force_authenticate(user=admin_user)
+        response = api_client.get(f"/api/customers/{customer.id}/?fields=lastName")
+        assert set(response.data) == {"last_name"}
+        assert get_detail_cache().get(detail_cache_key(customer.id)) is None
+
+        api_client.get(f"/api/customers/{customer.id}/")
+        response = api_client.get(f"/api/customers/{customer.id}/?fields=lastName")
+        assert set(response.data) == {"last_name"}
+
+    def test_disabled_with_zero_timeout(self, api_client, admin_user, customer, settings):
+        """Test que CUSTOMERS_DETAIL_CACHE_TIMEOUT=0 désactive le cache."""
+        settings.CUSTOMERS_DETAIL_CACHE_TIMEOUT = 0
+        api_client.force_authenticate(user=admin_user)
+        api_client.get(f"/api/customers/{customer.id}/")
+
+        assert get_detail_cache().get(detail_cache_key(customer.id)) is None
+
+    def test_stats_count_hits_and_misses(self, api_client, admin_user, customer):
+        """Test que les compteurs de succès et d'échecs sont exposés."""
+        api_client.force_authenticate(user=admin_user)
+        for _ in range(3):
+            api_client.get(f"/api/customers/{customer.id}/")
+
+        response = api_client.get("/api/customers/cache-stats/")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert json.loads(response.content) == {"hits": 2, "misses": 1, "hitRatio": 0.6667}
+
+    def test_stats_are_admin_only(self, api_client, veterinarian_user):
+        """Test que seuls les administrateurs lisent les compteurs."""
+        api_client.force_authenticate(user=veterinarian_user)
+        response = api_client.get("/api/customers/cache-stats/")
+        assert response.status_code == status.HTTP_403_FORBIDDEN
@@ -0,0 +1,113 @@
+import csv
+import io
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.db.backends.utils import CursorWrapper
+
+from customers.imports import CustomerImporter
+from customers.models import Customer
+
+HEADER = "lastName,firstName,email,phoneNumber,street,zipCode,city,archive,description\n"
+
+
+def _line(index, **overrides):
+    values = {
+        "last_name": f"Nom{index}", "first_name": "Prénom", "email": f"client{index}@example.com",
+        "phone_number": "0102030405", "street": "1 rue Test", "zip_code": "75000", "city": "Paris",
+        "archive": "false", "description": "",
+    }
+    values.update(overrides)
+    return ",".join(values.values()) + "\n"
+
+
+@pytest.mark.django_db
+class TestCustomerImporter:
+    """Tests du pipeline d'import CSV."""
+
+    def test_imports_valid_rows_in_batches(self):
+        """Test que toutes les lignes valides sont importées, paquet par paquet."""
+        content = HEADER + "".join(_line(index) for index in range(5))
+        progress = []
+
+        stats = CustomerImporter(batch_size=2, progress=progress.append).run(io.StringIO(content))
+
+        assert (stats.rows, stats.imported, stats.rejected) == (5, 5, 0)
+        assert Customer.objects.count() == 5
+        assert len(progress) == 3
+
+    def test_rejects_invalid_rows_with_line_numbers(self, customer):
+        """Test que les lignes invalides sont écrites dans le fichier de rejets avec leur numéro."""
+        content = HEADER + _line(0) + _line(1, email=customer.email) + _line(2, last_name="") \
+            + _line(3, email="client0@example.com")
+        rejects = io.StringIO()
+
+        stats = CustomerImporter(batch_size=2, rejects=rejects).run(io.StringIO(content))
+
+        assert (stats.imported, stats.rejected) == (1, 3)
+        rows = list(csv.reader(io.StringIO(rejects.getvalue())))
+        assert rows[0][:3] == ["line", "errors", "lastName"]
+        assert [row[0] for row in rows[1:]] == ["3", "4", "5"]
+        assert "email" in rows[1][1]
+        assert "last_name" in rows[2][1]
+
+    def test_accepts_export_files(self, api_client, admin_user, customer):
+        """Test qu'un fichier produit par l'export est réimportable tel quel, formules neutralisées comprises."""
+        api_client.force_authenticate(user=admin_user)
+        customer.phone_number = "+33102030405"
+        customer.save()
+        exported = b"".join(api_client.get("/api/customers/export/csv/").streaming_content).decode()
+        customer.delete()
+
+        stats = CustomerImporter().run(io.StringIO(exported))
+
+        assert stats.imported == 1
+        assert Customer.objects.get().email == "jean@dupont.com"
+        assert Customer.objects.get().phone_number == "+33102030405"
+
+    def test_copy_driver_integrity_error_falls_back_to_bulk_create(self, mocker):
+        """Test qu'un doublon signalé par le pilote pendant COPY déclenche le repli ligne à ligne."""
+        duplicate = connection.Database.IntegrityError("duplicate key value violates unique constraint")
+        # Le curseur du pilote lève sa propre exception, comme psycopg pendant un COPY
+        copy = mocker.patch.object(CursorWrapper, "copy", create=True, side_effect=duplicate)
+        copy_expert = mocker.patch.object(CursorWrapper, "copy_expert", create=True, side_effect=duplicate)
+        content = HEADER + "".join(_line(index) for index in range(3))
+
+        stats = CustomerImporter(use_copy=True).run(io.StringIO(content))
+
+        assert copy.called or copy_expert.called
+        assert (stats.imported, stats.rejected) == (3, 0)
+        assert Customer.objects.count() == 3
+
+
+@pytest.mark.django_db
+class TestImportCustomersCommand:
+    """Tests de la commande import_customers."""
+
+    def test_command_reports_throughput_and_rejects(self, tmp_path, customer):
+        """Test que la commande affiche le débit et écrit le fichier de rejets."""
+        path = tmp_path / "clients.csv"
+        path.write_text(HEADER + _line(0) + _line(1, email=customer.email), encoding="utf-8")
+        out = io.StringIO()
+
+        call_command("import_customers", str(path), stdout=out)
+
+        assert "1 clients importés, 1 refusés" in out.getvalue()
+        assert "lignes/s" in out.getvalue()
+        assert (tmp_path / "clients.rejets.csv").exists()
+
+    def test_command_removes_empty_rejects_file(self, tmp_path):
+        """Test qu'aucun fichier de rejets ne reste quand tout est importé."""
+        path = tmp_path / "clients.csv"
+        path.write_text(HEADER + _line(0), encoding="utf-8")
+
+        call_command("import_customers", str(path), stdout=io.StringIO())
+
+        assert not (tmp_path / "clients.rejets.csv").exists()
+
+    def test_command_rejects_missing_file(self, tmp_path):
+        """Test qu'un fichier absent lève une CommandError."""
+        with pytest.raises(CommandError):
+            call_command("import_customers", str(tmp_path / "absent.csv"))
@@ -1,5 +1,5 @@
 import pytest
-from django.db import IntegrityError
+from django.db import IntegrityError, connection
 
 from customers.models import Customer
 
@@ -110,3 +110,38 @@ class TestCustomerModel:
         assert customers[1].last_name == "Alpha"
         assert customers[1].first_name == "Zoe"
         assert customers[2].last_name == "Zebra"
+
+
+@pytest.mark.django_db
+class TestCustomerIndexes:
+    """Tests du plan d'exécution des requêtes de liste."""
+
+    @pytest.fixture(autouse=True)
+    def _force_index_usage(self, db):
+        """Sur une table quasi vide, PostgreSQL préfère un seq scan : on le désactive."""
+        if connection.vendor == "postgresql":
+            with connection.cursor() as cursor:
+                cursor.execute("SET enable_seqscan = off")
+
+    def _plan(self, queryset):
+        return queryset.explain().lower()
+
+    def test_default_list_query_uses_name_index_without_sort(self, customer):
+        """Test que la liste par défaut parcourt l'index (nom, prénom, id) sans tri."""
+        plan = self._plan(Customer.objects.order_by("last_name", "first_name", "id")[:51])
+        assert "customer_name_idx" in plan or "customer_active_name_idx" in plan
+        assert "temp b-tree" not in plan
+        assert "seq scan" not in plan
+        assert "sort" not in plan
+
+    def test_active_list_query_uses_partial_index(self, customer):
+        """Test que la liste des clients actifs utilise l'index partiel."""
+        queryset = Customer.objects.filter(archive=False).order_by("last_name", "first_name", "id")[:51]
+        plan = self._plan(queryset)
+        assert "customer_active_name_idx" in plan
+        assert "temp b-tree" not in plan
+
+    def test_city_filter_uses_city_index(self, customer):
+        """Test que le filtre par ville utilise l'index (ville, code postal)."""
+        plan = self._plan(Customer.objects.filter(city="Paris", zip_code="75000"))
+        assert "customer_city_zip_idx" in plan
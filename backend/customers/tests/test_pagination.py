@@ -0,0 +1,83 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext, override_settings
+from rest_framework import status
+
+from customers.models import Customer
+
+
+@pytest.fixture
+def many_customers(db):
+    """Sept clients, dont des homonymes pour tester le départage par id."""
+    names = [
+        ("Martin", "Paul"), ("Martin", "Paul"), ("Martin", "Anne"),
+        ("Dupont", "Jean"), ("Bernard", "Luc"), ("Petit", "Zoé"), ("Martin", "Paul"),
+    ]
+    return [
+        Customer.objects.create(
+            last_name=last_name,
+            first_name=first_name,
+            email=f"client{index}@example.com",
+            phone_number="0123456789",
+            street="1 rue Test",
+            zip_code="75000",
+            city="Paris",
+        )
+        for index, (last_name, first_name) in enumerate(names)
+    ]
+
+
+def _expected_ids():
+    return list(Customer.objects.order_by("last_name", "first_name", "id").values_list("id", flat=True))
+
+
+@pytest.mark.django_db
+class TestCustomerPagination:
+    """Tests pour la pagination par curseur de la liste des clients."""
+
+    def test_walk_forward_returns_every_customer_once_in_order(self, api_client, admin_user, many_customers):
+        """Test que le parcours page par page retourne chaque client une seule fois, dans l'ordre."""
+        api_client.force_authenticate(user=admin_user)
+        url, seen = "/api/customers/?page_size=2", []
+        while url:
+            response = api_client.get(url)
+            assert response.status_code == status.HTTP_200_OK
+            seen += [item["id"] for item in response.data["results"]]
+            url = response.data["next"]
+        assert seen == _expected_ids()
+
+    def test_previous_link_returns_previous_page(self, api_client, admin_user, many_customers):
+        """Test que le lien `previous` ramène exactement à la page précédente."""
+        api_client.force_authenticate(user=admin_user)
+        first = api_client.get("/api/customers/?page_size=3")
+        second = api_client.get(first.data["next"])
+        back = api_client.get(second.data["previous"])
+        assert [c["id"] for c in back.data["results"]] == [c["id"] for c in first.data["results"]]
+        assert back.data["previous"] is None
+
+    def test_first_page_has_no_previous_link(self, api_client, admin_user, many_customers):
+        """Test que la première page n'a pas de lien `previous`."""
+        api_client.force_authenticate(user=admin_user)
+        response = api_client.get("/api/customers/?page_size=2")
+        assert response.data["previous"] is None
+        assert response.data["next"] is not None
+
+    @override_settings(CUSTOMERS_PAGE_SIZE=4, CUSTOMERS_MAX_PAGE_SIZE=5)
+    def test_page_size_default_and_cutoff(self, api_client, admin_user, many_customers):
+        """Test la taille de page par défaut et le plafond configurés."""
+        api_client.force_authenticate(user=admin_user)
+        assert len(api_client.get("/api/customers/").data["results"]) == 4
+        assert len(api_client.get("/api/customers/?page_size=100").data["results"]) == 5
+
+    def test_invalid_cursor_returns_404(self, api_client, admin_user, many_customers):
+        """Test qu'un curseur invalide renvoie une 404."""
+        api_client.force_authenticate(user=admin_user)
+        response = api_client.get("/api/customers/?cursor=not-a-cursor")
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_no_count_query(self, api_client, admin_user, many_customers):
+        """Test qu'aucune requête COUNT(*) n'est exécutée pour paginer."""
+        api_client.force_authenticate(user=admin_user)
+        with CaptureQueriesContext(connection) as queries:
+            api_client.get("/api/customers/?page_size=2")
+        assert not any("COUNT(" in query["sql"].upper() for query in queries)
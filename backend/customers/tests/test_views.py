@@ -1,7 +1,36 @@
+import csv
+import datetime
+import io
+import json
+
 import pytest
+from django.core.management import call_command
+from django.db import IntegrityError, connection
+from django.db.models import QuerySet
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
 from rest_framework import status
 
-from customers.models import Customer
+from customers.models import Customer, CustomerTombstone
+from customers.serializers import CustomerBulkListSerializer
+from customers.views import CustomerViewSet
+
+# Requêtes SQL maximales par endpoint, quel que soit le nombre de clients :
+# un dépassement signale un N+1 ou une requête ajoutée par mégarde.
+QUERY_BUDGETS = {
+    "list": 1,
+    "search": 1,
+    "autocomplete": 1,
+    "retrieve": 2,
+    "create": 2,
+    "partial_update": 2,
+    "destroy": 3,
+    "changes": 2,
+    "export": 1,
+    "bulk_create": 4,
+    "bulk_update": 4,
+    "bulk_archive": 1,
+}
 
 
 @pytest.mark.django_db
@@ -18,7 +47,7 @@ class TestCustomerViewSetList:
         api_client.force_authenticate(user=veterinarian_user)
         response = api_client.get("/api/customers/")
         assert response.status_code == status.HTTP_200_OK
-        assert len(response.data) == 1
+        assert len(response.data["results"]) == 1
 
     def test_list_returns_customers_in_camel_case(self, api_client, admin_user, customer):
         """Test que la liste retourne les données en camelCase (au niveau JSON)."""
@@ -26,7 +55,7 @@ class TestCustomerViewSetList:
         response = api_client.get("/api/customers/")
         assert response.status_code == status.HTTP_200_OK
 
-        json_data = response.json()
+        json_data = response.json()["results"]
         assert "lastName" in json_data[0]
         assert "firstName" in json_data[0]
         assert "phoneNumber" in json_data[0]
@@ -131,3 +160,696 @@ class TestCustomerViewSetDelete:
         response = api_client.delete(f"/api/customers/{customer_id}/")
         assert response.status_code == status.HTTP_204_NO_CONTENT
         assert not Customer.objects.filter(id=customer_id).exists()
+
+
+@pytest.mark.django_db
+class TestCustomerViewSetSearch:
+    """Tests pour la recherche `?search=` sur les clients."""
+
+    @pytest.fixture
+    def search_customers(self, db):
+        rows = [
+            ("Lefèvre", "Léa", "lea.lefevre@example.com", "0611223344"),
+            ("Dubois", "Hélène", "helene.dubois@example.com", "0655667788"),
+            ("Aléa", "Marc", "marc@example.com", "0699887766"),
+            ("Martin", "Paul", "paul@example.com", "0144556677"),
+        ]
+        return [
+            Customer.objects.create(
+                last_name=last_name, first_name=first_name, email=email, phone_number=phone,
+                street="1 rue Test", zip_code="75000", city="Paris",
+            )
+            for last_name, first_name, email, phone in rows
+        ]
+
+    def _search(self, api_client, user, term):
+        api_client.force_authenticate(user=user)
+        response = api_client.get("/api/customers/", {"search": term})
+        assert response.status_code == status.HTTP_200_OK
+        return [item["email"] for item in response.data["results"]]
+
+    def test_unaccented_term_matches_accented_names(self, api_client, admin_user, search_customers):
+        """Test que « helene » trouve « Hélène »."""
+        assert self._search(api_client, admin_user, "helene") == ["helene.dubois@example.com"]
+
+    def test_accented_term_matches(self, api_client, admin_user, search_customers):
+        """Test que « LÉA » trouve les clients contenant « lea », quelle que soit la casse."""
+        emails = self._search(api_client, admin_user, "LÉA")
+        assert set(emails) == {"lea.lefevre@example.com", "marc@example.com"}
+
+    def test_search_by_partial_phone_and_email(self, api_client, admin_user, search_customers):
+        """Test la recherche partielle sur le téléphone et l'email."""
+        assert self._search(api_client, admin_user, "4455") == ["paul@example.com"]
+        assert self._search(api_client, admin_user, "dubois@") == ["helene.dubois@example.com"]
+
+    def test_results_are_ranked(self, api_client, admin_user, search_customers):
+        """Test qu'un nom commençant par le terme est classé avant une simple inclusion."""
+        emails = self._search(api_client, admin_user, "lea")
+        assert emails[0] == "lea.lefevre@example.com"
+
+    def test_search_results_are_paginated(self, api_client, admin_user, search_customers):
+        """Test que la pagination par curseur fonctionne sur les résultats classés."""
+        api_client.force_authenticate(user=admin_user)
+        url, seen = "/api/customers/?search=e&page_size=1", []
+        while url:
+            response = api_client.get(url)
+            seen += [item["id"] for item in response.data["results"]]
+            url = response.data["next"]
+        assert len(seen) == len(set(seen)) == 4
+
+    def test_no_match_returns_empty_page(self, api_client, admin_user, search_customers):
+        """Test qu'une recherche sans résultat retourne une page vide."""
+        assert self._search(api_client, admin_user, "zzz") == []
+
+
+@pytest.mark.django_db
+class TestCustomerViewSetAutocomplete:
+    """Tests pour l'autocomplétion des clients."""
+
+    @pytest.fixture
+    def named_customers(self, db):
+        rows = [("Lefèvre", "Léa", False), ("Leroy", "Hugo", False), ("Martin", "Lena", False), ("Legrand", "Archivé", True)]
+        return [
+            Customer.objects.create(
+                last_name=last_name, first_name=first_name, email=f"client{index}@example.com",
+                phone_number="0123456789", street="1 rue Test", zip_code="75000", city="Paris",
+                archive=archive, description="Notes longues",
+            )
+            for index, (last_name, first_name, archive) in enumerate(rows)
+        ]
+
+    def test_unauthenticated_user_cannot_autocomplete(self, api_client):
+        """Test qu'un utilisateur non authentifié ne peut pas utiliser l'autocomplétion."""
+        response = api_client.get("/api/customers/autocomplete/", {"search": "le"})
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_returns_only_id_and_label(self, api_client, admin_user, named_customers):
+        """Test que la réponse ne contient que l'id et le libellé `NOM Prénom`."""
+        api_client.force_authenticate(user=admin_user)
+        response = api_client.get("/api/customers/autocomplete/", {"search": "lef"})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == [{"id": named_customers[0].id, "label": "LEFÈVRE Léa"}]
+
+    def test_prefix_on_last_or_first_name_without_accents(self, api_client, admin_user, named_customers):
+        """Test que le préfixe porte sur le nom ou le prénom, sans accents, hors clients archivés."""
+        api_client.force_authenticate(user=admin_user)
+        response = api_client.get("/api/customers/autocomplete/", {"search": "le"})
+        assert [item["label"] for item in response.data] == ["LEFÈVRE Léa", "LEROY Hugo", "MARTIN Lena"]
+
+    def test_results_are_capped(self, api_client, admin_user, named_customers, settings):
+        """Test que le nombre de suggestions est plafonné."""
+        settings.CUSTOMERS_AUTOCOMPLETE_LIMIT = 2
+        api_client.force_authenticate(user=admin_user)
+        response = api_client.get("/api/customers/autocomplete/", {"search": "le"})
+        assert len(response.data) == 2
+
+    def test_empty_term_returns_empty_list(self, api_client, admin_user, named_customers):
+        """Test qu'un terme vide ne déclenche aucune recherche."""
+        api_client.force_authenticate(user=admin_user)
+        response = api_client.get("/api/customers/autocomplete/")
+        assert response.data == []
+
+
+@pytest.mark.django_db
+class TestCustomerViewSetSparseFieldsets:
+    """Tests pour `?fields=` / `?omit=` sur les clients."""
+
+    def test_fields_narrows_output_and_sql_columns(self, api_client, admin_user, customer):
+        """Test que `?fields=` réduit la réponse et les colonnes lues en base."""
+        api_client.force_authenticate(user=admin_user)
+        with CaptureQueriesContext(connection) as queries:
+            response = api_client.get("/api/customers/", {"fields": "id,lastName,firstName"})
+        assert response.status_code == status.HTTP_200_OK
+        assert set(response.json()["results"][0]) == {"id", "lastName", "firstName"}
+        select = next(q["sql"] for q in queries if "customers_customer" in q["sql"])
+        assert '"description"' not in select
+        assert '"email"' not in select
+
+    def test_omit_removes_fields(self, api_client, admin_user, customer):
+        """Test que `?omit=` retire les champs et les colonnes correspondantes."""
+        api_client.force_authenticate(user=admin_user)
+        with CaptureQueriesContext(connection) as queries:
+            response = api_client.get(f"/api/customers/{customer.id}/", {"omit": "description,createdAt"})
+        data = response.json()
+        assert "description" not in data and "createdAt" not in data
+        assert data["email"] == customer.email
+        select = next(q["sql"] for q in queries if "customers_customer" in q["sql"])
+        assert '"description"' not in select
+
+    def test_fields_is_ignored_on_write(self, api_client, admin_user, customer_data):
+        """Test qu'une création ignore `?fields=` et renvoie l'objet complet."""
+        api_client.force_authenticate(user=admin_user)
+        response = api_client.post("/api/customers/?fields=id", customer_data, format="json")
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.json()["email"] == customer_data["email"]
+
+
+@pytest.mark.django_db
+class TestCustomerViewSetConditionalRequests:
+    """Tests des requêtes conditionnelles (ETag / Last-Modified / If-Match)."""
+
+    def test_detail_sends_validators(self, api_client, admin_user, customer):
+        """Test que le détail renvoie un ETag, un Last-Modified et un Cache-Control de revalidation."""
+        api_client.force_authenticate(user=admin_user)
+        response = api_client.get(f"/api/customers/{customer.id}/")
+        assert response["ETag"]
+        assert response["Last-Modified"]
+        assert "no-cache" in response["Cache-Control"]
+
+    def test_detail_if_none_match_returns_304_without_serializing(self, api_client, admin_user, customer, mocker):
+        """Test qu'un ETag à jour donne une 304 sans passer par le serializer."""
+        api_client.force_authenticate(user=admin_user)
+        etag = api_client.get(f"/api/customers/{customer.id}/")["ETag"]
+        to_representation = mocker.patch("customers.serializers.CustomerSerializer.to_representation")
+        response = api_client.get(f"/api/customers/{customer.id}/", HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response["ETag"] == etag
+        to_representation.assert_not_called()
+
+    def test_detail_if_modified_since_returns_304(self, api_client, admin_user, customer):
+        """Test qu'une date `If-Modified-Since` à jour donne une 304."""
+        api_client.force_authenticate(user=admin_user)
+        last_modified = api_client.get(f"/api/customers/{customer.id}/")["Last-Modified"]
+        response = api_client.get(f"/api/customers/{customer.id}/", HTTP_IF_MODIFIED_SINCE=last_modified)
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_detail_etag_changes_after_update(self, api_client, admin_user, customer):
+        """Test qu'une modification invalide l'ETag du détail."""
+        api_client.force_authenticate(user=admin_user)
+        etag = api_client.get(f"/api/customers/{customer.id}/")["ETag"]
+        api_client.patch(f"/api/customers/{customer.id}/", {"city": "Lyon"}, format="json")
+        response = api_client.get(f"/api/customers/{customer.id}/", HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["city"] == "Lyon"
+
+    def test_list_if_none_match_returns_304(self, api_client, admin_user, customer):
+        """Test qu'une liste inchangée donne une 304."""
+        api_client.force_authenticate(user=admin_user)
+        etag = api_client.get("/api/customers/")["ETag"]
+        response = api_client.get("/api/customers/", HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_list_etag_changes_on_create_and_delete(self, api_client, admin_user, customer, customer_data):
+        """Test qu'une création ou une suppression invalide l'ETag de la liste."""
+        api_client.force_authenticate(user=admin_user)
+        first = api_client.get("/api/customers/")["ETag"]
+        created = api_client.post("/api/customers/", customer_data, format="json")
+        second = api_client.get("/api/customers/", HTTP_IF_NONE_MATCH=first)
+        assert second.status_code == status.HTTP_200_OK
+        api_client.delete(f"/api/customers/{created.data['id']}/")
+        third = api_client.get("/api/customers/", HTTP_IF_NONE_MATCH=second["ETag"])
+        assert third.status_code == status.HTTP_200_OK
+
+    def test_update_with_stale_if_match_returns_412(self, api_client, admin_user, customer):
+        """Test qu'une écriture fondée sur une version périmée est refusée (412)."""
+        api_client.force_authenticate(user=admin_user)
+        etag = api_client.get(f"/api/customers/{customer.id}/")["ETag"]
+        api_client.patch(f"/api/customers/{customer.id}/", {"city": "Lyon"}, format="json")
+        response = api_client.patch(
+            f"/api/customers/{customer.id}/", {"city": "Nantes"}, format="json", HTTP_IF_MATCH=etag
+        )
+        assert response.status_code == status.HTTP_412_PRECONDITION_FAILED
+        customer.refresh_from_db()
+        assert customer.city == "Lyon"
+
+    def test_update_with_current_if_match_succeeds(self, api_client, admin_user, customer):
+        """Test qu'une écriture avec l'ETag courant passe et renvoie le nouvel ETag."""
+        api_client.force_authenticate(user=admin_user)
+        etag = api_client.get(f"/api/customers/{customer.id}/")["ETag"]
+        response = api_client.patch(
+            f"/api/customers/{customer.id}/", {"city": "Nantes"}, format="json", HTTP_IF_MATCH=etag
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response["ETag"] != etag
+
+    def test_sparse_detail_has_its_own_etag(self, api_client, admin_user, customer):
+        """Test qu'un détail partiel et le détail complet ne partagent pas leur ETag."""
+        api_client.force_authenticate(user=admin_user)
+        full = api_client.get(f"/api/customers/{customer.id}/")["ETag"]
+        sparse = api_client.get(f"/api/customers/{customer.id}/?fields=id,lastName")["ETag"]
+
+        assert sparse != full
+        assert api_client.get(
+            f"/api/customers/{customer.id}/?fields=id,lastName", HTTP_IF_NONE_MATCH=full
+        ).status_code == status.HTTP_200_OK
+        assert api_client.get(
+            f"/api/customers/{customer.id}/", HTTP_IF_NONE_MATCH=sparse
+        ).status_code == status.HTTP_200_OK
+        assert api_client.get(
+            f"/api/customers/{customer.id}/?fields=lastName,id", HTTP_IF_NONE_MATCH=sparse
+        ).status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_update_accepts_if_match_from_sparse_detail(self, api_client, admin_user, customer, mocker):
+        """Test que l'ETag d'un détail partiel à jour autorise l'écriture."""
+        api_client.force_authenticate(user=admin_user)
+        etag = api_client.get(f"/api/customers/{customer.id}/?fields=id,city")["ETag"]
+        perform_update = mocker.spy(CustomerViewSet, "perform_update")
+        response = api_client.patch(
+            f"/api/customers/{customer.id}/", {"city": "Nantes"}, format="json", HTTP_IF_MATCH=etag
+        )
+        assert response.status_code == status.HTTP_200_OK
+        # L'en-tête reçu n'est pas réécrit sur la requête
+        serializer = perform_update.call_args.args[1]
+        assert serializer.context["request"].META["HTTP_IF_MATCH"] == etag
+
+    def test_conditional_update_locks_row_until_save(self, api_client, admin_user, customer, mocker):
+        """Test que la version est lue FOR UPDATE, dans la transaction de l'écriture."""
+        api_client.force_authenticate(user=admin_user)
+        etag = api_client.get(f"/api/customers/{customer.id}/")["ETag"]
+        select_for_update = mocker.spy(QuerySet, "select_for_update")
+        savepoints = []
+        save = Customer.save
+
+        def tracking_save(instance, *args, **kwargs):
+            savepoints.append(len(connection.savepoint_ids))
+            return save(instance, *args, **kwargs)
+
+        mocker.patch.object(Customer, "save", tracking_save)
+        api_client.patch(f"/api/customers/{customer.id}/", {"city": "Nantes"}, format="json", HTTP_IF_MATCH=etag)
+
+        select_for_update.assert_called_once()
+        # Le test tourne déjà dans une transaction : le bloc de la vue y ouvre un savepoint
+        assert savepoints == [1]
+
+    def test_delete_with_stale_if_match_returns_412(self, api_client, admin_user, customer):
+        """Test qu'une suppression avec un ETag périmé est refusée."""
+        api_client.force_authenticate(user=admin_user)
+        response = api_client.delete(f"/api/customers/{customer.id}/", HTTP_IF_MATCH='"stale"')
+        assert response.status_code == status.HTTP_412_PRECONDITION_FAILED
+        assert Customer.objects.filter(id=customer.id).exists()
+
+
+@pytest.mark.django_db
+class TestCustomerViewSetChanges:
+    """Tests de la synchronisation incrémentale `/api/customers/changes/`."""
+
+    def _changes(self, api_client, **params):
+        response = api_client.get("/api/customers/changes/", params)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.streaming
+        return json.loads(b"".join(response.streaming_content))
+
+    def test_without_watermark_returns_full_copy(self, api_client, admin_user, customer):
+        """Test qu'un premier appel renvoie tous les clients et un filigrane."""
+        api_client.force_authenticate(user=admin_user)
+        data = self._changes(api_client)
+        assert [item["id"] for item in data["updated"]] == [customer.id]
+        assert data["updated"][0]["lastName"] == "Dupont"
+        assert data["deleted"] == []
+        assert data["watermark"]
+
+    def test_returns_only_changes_since_watermark(self, api_client, admin_user, customer, customer_data):
+        """Test qu'un appel avec filigrane ne renvoie que les créations, modifications et suppressions."""
+        api_client.force_authenticate(user=admin_user)
+        other = Customer.objects.create(
+            last_name="Petit", first_name="Zoé", email="zoe@example.com", phone_number="01",
+            street="1 rue Test", zip_code="75000", city="Paris",
+        )
+        watermark = self._changes(api_client)["watermark"]
+
+        created = api_client.post("/api/customers/", customer_data, format="json").data
+        api_client.patch(f"/api/customers/{customer.id}/", {"city": "Lyon"}, format="json")
+        api_client.delete(f"/api/customers/{other.id}/")
+
+        data = self._changes(api_client, updated_since=watermark)
+        assert {item["id"] for item in data["updated"]} == {created["id"], customer.id}
+        assert data["deleted"] == [other.id]
+
+    def test_supports_sparse_fieldsets(self, api_client, admin_user, customer):
+        """Test que `?fields=` réduit aussi les lignes synchronisées."""
+        api_client.force_authenticate(user=admin_user)
+        data = self._changes(api_client, fields="id,updatedAt")
+        assert set(data["updated"][0]) == {"id", "updatedAt"}
+
+    def test_invalid_watermark_returns_400(self, api_client, admin_user):
+        """Test qu'un filigrane invalide est refusé."""
+        api_client.force_authenticate(user=admin_user)
+        response = api_client.get("/api/customers/changes/", {"updated_since": "hier"})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_naive_watermark_is_read_as_utc(self, api_client, admin_user, customer):
+        """Test qu'un filigrane sans fuseau est accepté (lu en UTC)."""
+        api_client.force_authenticate(user=admin_user)
+        yesterday = (timezone.now() - datetime.timedelta(days=1)).replace(tzinfo=None)
+        data = self._changes(api_client, updated_since=yesterday.isoformat())
+        assert [item["id"] for item in data["updated"]] == [customer.id]
+
+    def test_watermark_covers_transactions_committed_after_the_read(self, api_client, admin_user, customer):
+        """Test qu'une ligne datée avant la lecture mais validée après est relue au prochain appel."""
+        api_client.force_authenticate(user=admin_user)
+        read_at = timezone.now()
+        watermark = self._changes(api_client)["watermark"]
+        # Écriture concurrente : updated_at posé juste avant la lecture, commit juste après
+        late = Customer.objects.create(
+            last_name="Tardif", first_name="Léo", email="leo@example.com", phone_number="01",
+            street="1 rue Test", zip_code="75000", city="Paris",
+        )
+        Customer.objects.filter(pk=late.pk).update(updated_at=read_at - datetime.timedelta(seconds=1))
+
+        data = self._changes(api_client, updated_since=watermark)
+        assert late.id in {item["id"] for item in data["updated"]}
+
+    def test_watermark_older_than_tombstone_retention_returns_400(self, api_client, admin_user, settings):
+        """Test qu'un filigrane antérieur à la conservation des suppressions impose une copie complète."""
+        settings.CUSTOMERS_TOMBSTONE_RETENTION_DAYS = 30
+        api_client.force_authenticate(user=admin_user)
+        stale = (timezone.now() - datetime.timedelta(days=31)).isoformat()
+        response = api_client.get("/api/customers/changes/", {"updated_since": stale})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_prune_command_deletes_only_expired_tombstones(self, settings):
+        """Test que la purge supprime les traces plus anciennes que la conservation, par paquets."""
+        settings.CUSTOMERS_TOMBSTONE_RETENTION_DAYS = 30
+        CustomerTombstone.objects.bulk_create([CustomerTombstone(customer_id=index) for index in range(4)])
+        CustomerTombstone.objects.filter(customer_id__lt=3).update(
+            deleted_at=timezone.now() - datetime.timedelta(days=31)
+        )
+        out = io.StringIO()
+
+        call_command("prune_customer_tombstones", "--batch-size", "2", stdout=out)
+
+        assert "3 traces de suppression" in out.getvalue()
+        assert list(CustomerTombstone.objects.values_list("customer_id", flat=True)) == [3]
+
+
+@pytest.mark.django_db
+class TestCustomerViewSetBulk:
+    """Tests des envois en masse (/api/customers/bulk/ et bulk-archive/)."""
+
+    @staticmethod
+    def _row(index, **overrides):
+        row = {
+            "lastName": f"Nom{index}", "firstName": "Prénom", "email": f"client{index}@example.com",
+            "phoneNumber": "0102030405", "street": "1 rue Test", "zipCode": "75000", "city": "Paris",
+        }
+        row.update(overrides)
+        return row
+
+    def test_bulk_create(self, api_client, admin_user):
+        """Test que toutes les lignes valides sont créées en une réponse 201."""
+        api_client.force_authenticate(user=admin_user)
+        rows = [self._row(index) for index in range(3)]
+
+        response = api_client.post("/api/customers/bulk/", rows, format="json")
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert [item["email"] for item in response.data["results"]] == [row["email"] for row in rows]
+        assert all(item["id"] for item in response.data["results"])
+        assert response.data["errors"] == []
+        assert Customer.objects.count() == 3
+
+    def test_bulk_create_reports_errors_per_row(self, api_client, admin_user, customer):
+        """Test que les lignes invalides sont signalées par index sans bloquer les autres."""
+        api_client.force_authenticate(user=admin_user)
+        rows = [
+            self._row(0),
+            self._row(1, email=customer.email),
+            self._row(2, email="client0@example.com"),
+            self._row(3, lastName=""),
+        ]
+
+        response = api_client.post("/api/customers/bulk/", rows, format="json")
+
+        assert response.status_code == status.HTTP_207_MULTI_STATUS
+        assert [item["email"] for item in response.data["results"]] == ["client0@example.com"]
+        assert [error["index"] for error in response.data["errors"]] == [1, 2, 3]
+        assert "email" in response.data["errors"][0]["errors"]
+        assert "last_name" in response.data["errors"][2]["errors"]
+        assert Customer.objects.count() == 2
+
+    def test_bulk_create_checks_emails_in_one_query(self, api_client, admin_user):
+        """Test que le nombre de requêtes ne dépend pas du nombre de lignes."""
+        api_client.force_authenticate(user=admin_user)
+
+        def count_queries(rows):
+            with CaptureQueriesContext(connection) as queries:
+                api_client.post("/api/customers/bulk/", rows, format="json")
+            return len(queries)
+
+        assert count_queries([self._row(index) for index in range(2)]) == \
+            count_queries([self._row(index) for index in range(10, 30)])
+
+    def test_bulk_create_all_invalid_returns_400(self, api_client, admin_user, customer):
+        """Test qu'un envoi sans aucune ligne valide est refusé."""
+        api_client.force_authenticate(user=admin_user)
+        response = api_client.post("/api/customers/bulk/", [self._row(0, email=customer.email)], format="json")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data["results"] == []
+
+    def test_bulk_requires_a_list(self, api_client, admin_user):
+        """Test qu'un objet seul au lieu d'une liste est refusé."""
+        api_client.force_authenticate(user=admin_user)
+        response = api_client.post("/api/customers/bulk/", self._row(0), format="json")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_bulk_update(self, api_client, admin_user, customer):
+        """Test que PATCH met à jour les lignes valides et date la modification."""
+        api_client.force_authenticate(user=admin_user)
+        other = Customer.objects.create(
+            last_name="Petit", first_name="Zoé", email="zoe@example.com", phone_number="01",
+            street="1 rue Test", zip_code="75000", city="Paris",
+        )
+        previous_updated_at = customer.updated_at
+        rows = [
+            {"id": customer.id, "city": "Lyon", "email": customer.email},
+            {"id": other.id, "email": customer.email},
+            {"id": 999999, "city": "Nice"},
+        ]
+
+        response = api_client.patch("/api/customers/bulk/", rows, format="json")
+
+        assert response.status_code == status.HTTP_207_MULTI_STATUS
+        assert [item["id"] for item in response.data["results"]] == [customer.id]
+        assert [error["index"] for error in response.data["errors"]] == [1, 2]
+        customer.refresh_from_db()
+        other.refresh_from_db()
+        assert customer.city == "Lyon"
+        assert customer.updated_at > previous_updated_at
+        assert other.email == "zoe@example.com"
+
+    def test_bulk_update_rejects_boolean_ids(self, api_client, admin_user):
+        """Test qu'un id booléen (true vaut 1 en Python) ne désigne pas le client 1."""
+        api_client.force_authenticate(user=admin_user)
+        first = Customer.objects.create(pk=1, **{
+            "last_name": "Petit", "first_name": "Zoé", "email": "zoe@example.com", "phone_number": "01",
+            "street": "1 rue Test", "zip_code": "75000", "city": "Paris",
+        })
+
+        response = api_client.patch("/api/customers/bulk/", [{"id": True, "city": "Nice"}], format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data["errors"] == [{"index": 0, "errors": {"id": ["Client introuvable."]}}]
+        first.refresh_from_db()
+        assert first.city == "Paris"
+
+    def test_bulk_update_fallback_does_not_recreate_deleted_customers(self, api_client, admin_user, customer, mocker):
+        """Test que le rejeu ligne à ligne d'un paquet refusé ne recrée pas un client supprimé entre-temps."""
+        api_client.force_authenticate(user=admin_user)
+        other = Customer.objects.create(
+            last_name="Petit", first_name="Zoé", email="zoe@example.com", phone_number="01",
+            street="1 rue Test", zip_code="75000", city="Paris",
+        )
+
+        write = CustomerBulkListSerializer._write
+
+        def concurrent_delete(serializer, *args):
+            # Suppression validée entre la lecture des clients et leur écriture
+            Customer.objects.filter(pk=other.pk).delete()
+            return write(serializer, *args)
+
+        mocker.patch.object(CustomerBulkListSerializer, "_write", concurrent_delete)
+        mocker.patch.object(QuerySet, "bulk_update", side_effect=IntegrityError("duplicate key value"))
+        rows = [{"id": customer.id, "city": "Lyon"}, {"id": other.id, "city": "Nice"}]
+
+        response = api_client.patch("/api/customers/bulk/", rows, format="json")
+
+        assert response.status_code == status.HTTP_207_MULTI_STATUS
+        assert response.data["errors"] == [{"index": 1, "errors": {"id": ["Client introuvable."]}}]
+        assert list(Customer.objects.values_list("city", flat=True)) == ["Lyon"]
+
+    def test_bulk_fallback_reports_other_constraints_as_rejected(self, api_client, admin_user, mocker):
+        """Test qu'une contrainte autre que l'unicité de l'email n'est pas signalée comme doublon."""
+        api_client.force_authenticate(user=admin_user)
+        mocker.patch.object(QuerySet, "bulk_create", side_effect=IntegrityError("NOT NULL constraint failed"))
+        save = Customer.save
+
+        def failing_save(obj, *args, **kwargs):
+            if obj.email == "client1@example.com":
+                raise IntegrityError("NOT NULL constraint failed")
+            return save(obj, *args, **kwargs)
+
+        mocker.patch.object(Customer, "save", failing_save)
+
+        response = api_client.post("/api/customers/bulk/", [self._row(0), self._row(1)], format="json")
+
+        assert response.status_code == status.HTTP_207_MULTI_STATUS
+        assert response.data["errors"] == [
+            {"index": 1, "errors": {"non_field_errors": ["Ligne refusée par la base de données."]}}
+        ]
+        assert Customer.objects.get().email == "client0@example.com"
+
+    def test_bulk_archive(self, api_client, admin_user, customer):
+        """Test que bulk-archive archive les clients en une seule requête d'écriture."""
+        api_client.force_authenticate(user=admin_user)
+        previous_updated_at = customer.updated_at
+
+        with CaptureQueriesContext(connection) as queries:
+            response = api_client.post("/api/customers/bulk-archive/", {"ids": [customer.id, 999999]}, format="json")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == {"archived": 1}
+        assert len([query for query in queries if query["sql"].startswith("UPDATE")]) == 1
+        customer.refresh_from_db()
+        assert customer.archive is True
+        assert customer.updated_at > previous_updated_at
+
+    def test_bulk_archive_requires_ids(self, api_client, admin_user):
+        """Test qu'une liste d'ids vide est refusée."""
+        api_client.force_authenticate(user=admin_user)
+        response = api_client.post("/api/customers/bulk-archive/", {"ids": []}, format="json")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db
+class TestCustomerViewSetExport:
+    """Tests de l'export en flux (/api/customers/export/csv|ndjson/)."""
+
+    @staticmethod
+    def _content(response):
+        return b"".join(response.streaming_content).decode()
+
+    def test_export_csv(self, api_client, admin_user, customer):
+        """Test que l'export CSV contient l'en-tête camelCase et une ligne par client."""
+        api_client.force_authenticate(user=admin_user)
+
+        response = api_client.get("/api/customers/export/csv/")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.streaming
+        assert response["Content-Type"].startswith("text/csv")
+        assert "attachment" in response["Content-Disposition"]
+        rows = list(csv.reader(io.StringIO(self._content(response))))
+        assert rows[0][:4] == ["id", "lastName", "firstName", "email"]
+        assert rows[1][:4] == [str(customer.id), "Dupont", "Jean", "jean@dupont.com"]
+        assert rows[1][rows[0].index("archive")] == "false"
+        assert len(rows) == 2
+
+    def test_export_csv_neutralizes_formulas(self, api_client, admin_user, customer):
+        """Test que les cellules qui commencent par une formule sont préfixées d'une apostrophe."""
+        api_client.force_authenticate(user=admin_user)
+        customer.last_name = '=HYPERLINK("http://example.com","Dupont")'
+        customer.phone_number = "+33102030405"
+        customer.save()
+
+        response = api_client.get("/api/customers/export/csv/", {"fields": "lastName,firstName,phoneNumber"})
+
+        rows = list(csv.reader(io.StringIO(self._content(response))))
+        assert rows[1] == ['\'=HYPERLINK("http://example.com","Dupont")', "Jean", "'+33102030405"]
+
+    def test_export_ndjson(self, api_client, admin_user, customer):
+        """Test que l'export NDJSON renvoie un objet JSON par ligne."""
+        api_client.force_authenticate(user=admin_user)
+
+        response = api_client.get("/api/customers/export/ndjson/")
+
+        assert response["Content-Type"] == "application/x-ndjson"
+        lines = self._content(response).splitlines()
+        assert len(lines) == 1
+        item = json.loads(lines[0])
+        assert item["id"] == customer.id
+        assert item["zipCode"] == "75000"
+        assert item["updatedAt"] == api_client.get(f"/api/customers/{customer.id}/").data["updated_at"]
+
+    def test_export_honours_list_filters(self, api_client, admin_user, customer):
+        """Test que la recherche et ?fields= s'appliquent à l'export."""
+        api_client.force_authenticate(user=admin_user)
+        Customer.objects.create(
+            last_name="Petit", first_name="Zoé", email="zoe@example.com", phone_number="01",
+            street="1 rue Test", zip_code="75000", city="Paris",
+        )
+
+        response = api_client.get("/api/customers/export/ndjson/", {"search": "zoe", "fields": "id,lastName"})
+
+        lines = self._content(response).splitlines()
+        assert [json.loads(line) for line in lines] == [
+            {"id": Customer.objects.get(email="zoe@example.com").id, "lastName": "Petit"}
+        ]
+
+    def test_export_reads_tuples_with_one_query(self, api_client, admin_user, customer):
+        """Test que l'export lit les colonnes demandées en une requête, sans modèles."""
+        api_client.force_authenticate(user=admin_user)
+
+        with CaptureQueriesContext(connection) as queries:
+            self._content(api_client.get("/api/customers/export/csv/", {"fields": "email"}))
+
+        customer_queries = [query["sql"] for query in queries if "customers_customer" in query["sql"]]
+        assert len(customer_queries) == 1
+        assert "description" not in customer_queries[0]
+
+    def test_unknown_format_returns_404(self, api_client, admin_user):
+        """Test qu'un format inconnu n'est pas routé."""
+        api_client.force_authenticate(user=admin_user)
+        assert api_client.get("/api/customers/export/xml/").status_code == status.HTTP_404_NOT_FOUND
+
+    def test_export_requires_authentication(self, api_client):
+        """Test que l'export nécessite d'être authentifié."""
+        assert api_client.get("/api/customers/export/csv/").status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.django_db
+class TestCustomerViewSetQueryBudgets:
+    """Tests du nombre de requêtes SQL par endpoint (QUERY_BUDGETS)."""
+
+    @pytest.fixture(params=[1, 25], ids=["1-client", "25-clients"])
+    def customers(self, request):
+        return Customer.objects.bulk_create(
+            Customer(
+                last_name=f"Nom{index}", first_name="Prénom", email=f"client{index}@example.com",
+                phone_number="0102030405", street="1 rue Test", zip_code="75000", city="Paris",
+            )
+            for index in range(request.param)
+        )
+
+    @staticmethod
+    def _rows(customer_data, count, start=0):
+        return [{**customer_data, "email": f"lot{index}@example.com"} for index in range(start, start + count)]
+
+    def _call(self, api_client, endpoint, customers, customer_data):
+        first = customers[0]
+        ids = [customer.id for customer in customers]
+        calls = {
+            "list": lambda: api_client.get("/api/customers/"),
+            "search": lambda: api_client.get("/api/customers/", {"search": "nom"}),
+            "autocomplete": lambda: api_client.get("/api/customers/autocomplete/", {"search": "nom"}),
+            "retrieve": lambda: api_client.get(f"/api/customers/{first.id}/"),
+            "create": lambda: api_client.post("/api/customers/", customer_data, format="json"),
+            "partial_update": lambda: api_client.patch(f"/api/customers/{first.id}/", {"city": "Lyon"}, format="json"),
+            "destroy": lambda: api_client.delete(f"/api/customers/{first.id}/"),
+            "changes": lambda: api_client.get(
+                "/api/customers/changes/", {"updatedSince": (timezone.now() - datetime.timedelta(days=1)).isoformat()}
+            ),
+            "export": lambda: api_client.get("/api/customers/export/csv/"),
+            "bulk_create": lambda: api_client.post(
+                "/api/customers/bulk/", self._rows(customer_data, len(customers)), format="json"
+            ),
+            "bulk_update": lambda: api_client.patch(
+                "/api/customers/bulk/", [{"id": pk, "city": "Lyon"} for pk in ids], format="json"
+            ),
+            "bulk_archive": lambda: api_client.post("/api/customers/bulk-archive/", {"ids": ids}, format="json"),
+        }
+        return calls[endpoint]()
+
+    @pytest.mark.parametrize("endpoint", QUERY_BUDGETS)
+    def test_endpoint_stays_within_query_budget(
+        self, api_client, admin_user, customers, customer_data, query_budget, endpoint
+    ):
+        """Test que chaque endpoint reste dans son budget de requêtes, pour 1 comme pour 25 clients."""
+        api_client.force_authenticate(user=admin_user)
+
+        with query_budget(QUERY_BUDGETS[endpoint]):
+            response = self._call(api_client, endpoint, customers, customer_data)
+            if response.streaming:
+                # Les réponses en streaming lisent la base pendant l'envoi
+                b"".join(response.streaming_content)
+
+        assert response.status_code < 300
@@ -1,7 +1,186 @@
-from rest_framework import viewsets
+from django.conf import settings
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+from drf_spectacular.utils import OpenApiParameter, extend_schema, extend_schema_view
+from rest_framework import status, viewsets
+from rest_framework.decorators import action
+from rest_framework.response import Response
+
+from core.conditional import ConditionalGetMixin
+from core.filters import SPARSE_FIELDSET_PARAMETERS, SparseFieldsetFilter
+from core.serializers import get_sparse_fieldset, select_field_names
+from users.permissions import IsAdmin
+from .cache import CachedDetailMixin, detail_cache_stats
+from .export import EXPORT_FIELDS, EXPORT_FORMATS
+from .filters import CustomerSearchFilter
 from .models import Customer
-from .serializers import CustomerSerializer
+from .pagination import CustomerPagination
+from .search import autocomplete_customers
+from .serializers import (
+    CustomerArchiveSerializer,
+    CustomerAutocompleteSerializer,
+    CustomerBulkSerializer,
+    CustomerSerializer,
+)
+from .sync import get_changes, next_watermark, parse_watermark, stream_changes
 
-class CustomerViewSet(viewsets.ModelViewSet):
+@extend_schema_view(
+    list=extend_schema(parameters=SPARSE_FIELDSET_PARAMETERS),
+    retrieve=extend_schema(parameters=SPARSE_FIELDSET_PARAMETERS),
+)
+class CustomerViewSet(ConditionalGetMixin, CachedDetailMixin, viewsets.ModelViewSet):
     queryset = Customer.objects.all()
-    serializer_class = CustomerSerializer
\ No newline at end of file
+    serializer_class = CustomerSerializer
+    pagination_class = CustomerPagination
+    filter_backends = [CustomerSearchFilter, SparseFieldsetFilter]
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter('search', str, description='Début du nom ou du prénom (accents ignorés).'),
+        ],
+        responses=CustomerAutocompleteSerializer(many=True),
+    )
+    @action(detail=False, methods=['get'], pagination_class=None, filter_backends=[])
+    def autocomplete(self, request):
+        """Suggestions légères (id + libellé) pour la saisie semi-automatique."""
+        term = request.query_params.get('search', '').replace('\x00', '')
+        if not term.strip():
+            return Response([])
+        customers = autocomplete_customers(self.get_queryset(), term)[:settings.CUSTOMERS_AUTOCOMPLETE_LIMIT]
+        return Response(CustomerAutocompleteSerializer(customers, many=True).data)
+
+    @extend_schema(responses={200: {
+        'type': 'object',
+        'properties': {
+            'hits': {'type': 'integer'},
+            'misses': {'type': 'integer'},
+            'hitRatio': {'type': 'number', 'nullable': True},
+        },
+    }})
+    @action(
+        detail=False, methods=['get'], url_path='cache-stats',
+        permission_classes=[IsAdmin], pagination_class=None, filter_backends=[],
+    )
+    def cache_stats(self, request):
+        """Compteurs du cache de la fiche client (succès, échecs, taux de succès)."""
+        return Response(detail_cache_stats())
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                'updated_since', str,
+                description='Filigrane renvoyé par la synchronisation précédente (ISO 8601). '
+                            'Absent : copie complète. Refusé (400) s\'il précède la conservation '
+                            'des suppressions (CUSTOMERS_TOMBSTONE_RETENTION_DAYS).',
+            ),
+            *SPARSE_FIELDSET_PARAMETERS,
+        ],
+        responses={200: {
+            'type': 'object',
+            'properties': {
+                'watermark': {'type': 'string', 'format': 'date-time'},
+                'deleted': {'type': 'array', 'items': {'type': 'integer'}},
+                'updated': {'type': 'array', 'items': {'$ref': '#/components/schemas/Customer'}},
+            },
+        }},
+    )
+    @action(detail=False, methods=['get'], pagination_class=None, filter_backends=[SparseFieldsetFilter])
+    def changes(self, request):
+        """
+        Synchronisation incrémentale : clients modifiés et ids supprimés depuis
+        `updated_since`, plus le filigrane à renvoyer au prochain appel.
+        """
+        since = request.query_params.get('updated_since')
+        since = parse_watermark(since) if since else None
+        # Pris avant la lecture et reculé de la durée maximale d'une transaction (voir next_watermark)
+        watermark = next_watermark()
+        customers, deleted_ids = get_changes(self.filter_queryset(self.get_queryset()), since)
+        return StreamingHttpResponse(
+            stream_changes(self.get_serializer(), customers, deleted_ids, watermark),
+            content_type='application/json',
+        )
+
+    @extend_schema(
+        parameters=SPARSE_FIELDSET_PARAMETERS,
+        responses={(200, 'text/csv'): str, (200, 'application/x-ndjson'): str},
+    )
+    @action(
+        detail=False, methods=['get'], url_path=r'export/(?P<export_format>csv|ndjson)',
+        pagination_class=None, filter_backends=[CustomerSearchFilter],
+    )
+    def export(self, request, export_format):
+        """
+        Export de tous les clients (mêmes filtres que la liste) en CSV ou NDJSON.
+
+        Les lignes sont lues par curseur serveur sous forme de tuples et
+        envoyées au fil de l'eau : la mémoire ne dépend pas du nombre de clients.
+        """
+        stream, content_type = EXPORT_FORMATS[export_format]
+        columns = select_field_names(EXPORT_FIELDS, *get_sparse_fieldset(request))
+        queryset = self.filter_queryset(self.get_queryset())
+        if not queryset.query.order_by:
+            queryset = queryset.order_by('last_name', 'first_name', 'id')
+        response = StreamingHttpResponse(stream(queryset, columns), content_type=content_type)
+        filename = f'clients-{timezone.localdate():%Y%m%d}.{export_format}'
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+        return response
+
+    @extend_schema(
+        request=CustomerBulkSerializer(many=True),
+        responses={(status.HTTP_201_CREATED, 'application/json'): {
+            'type': 'object',
+            'properties': {
+                'results': {'type': 'array', 'items': {'$ref': '#/components/schemas/Customer'}},
+                'errors': {'type': 'array', 'items': {
+                    'type': 'object',
+                    'properties': {'index': {'type': 'integer'}, 'errors': {'type': 'object'}},
+                }},
+            },
+        }},
+    )
+    @action(detail=False, methods=['post', 'patch'], pagination_class=None, filter_backends=[])
+    def bulk(self, request):
+        """
+        Création (POST) ou mise à jour partielle (PATCH, `id` obligatoire) d'une
+        liste de clients. Les lignes valides sont écrites, les autres sont
+        renvoyées dans `errors` avec leur position : 201/200 si tout passe, 207
+        si une partie seulement, 400 si aucune.
+        """
+        if request.method == 'PATCH':
+            ids = [row.get('id') for row in request.data if isinstance(row, dict)] \
+                if isinstance(request.data, list) else []
+            instances = Customer.objects.in_bulk([pk for pk in ids if isinstance(pk, int) and not isinstance(pk, bool)])
+            serializer = CustomerBulkSerializer(
+                list(instances.values()), data=request.data, many=True, partial=True,
+                context=self.get_serializer_context(),
+            )
+            success_status = status.HTTP_200_OK
+        else:
+            serializer = CustomerBulkSerializer(data=request.data, many=True, context=self.get_serializer_context())
+            success_status = status.HTTP_201_CREATED
+
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+        errors = serializer.get_row_errors()
+        if not errors:
+            response_status = success_status
+        elif serializer.instance:
+            response_status = status.HTTP_207_MULTI_STATUS
+        else:
+            response_status = status.HTTP_400_BAD_REQUEST
+        return Response({'results': serializer.data, 'errors': errors}, status=response_status)
+
+    @extend_schema(
+        request=CustomerArchiveSerializer,
+        responses={200: {'type': 'object', 'properties': {'archived': {'type': 'integer'}}}},
+    )
+    @action(detail=False, methods=['post'], url_path='bulk-archive', pagination_class=None, filter_backends=[])
+    def bulk_archive(self, request):
+        """Archive les clients listés en un seul UPDATE ; renvoie le nombre archivé."""
+        serializer = CustomerArchiveSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        # update() contourne auto_now : updated_at est posé pour la synchro et les ETag
+        archived = self.get_queryset().filter(
+            pk__in=serializer.validated_data['ids'], archive=False,
+        ).update(archive=True, updated_at=timezone.now())
+        return Response({'archived': archived})
@@ -0,0 +1,56 @@
+"""
+Configuration gunicorn de production, lue automatiquement par `gunicorn`
+depuis le répertoire backend/ (voir le Dockerfile). Tout se règle par variables
+d'environnement :
+
+* WEB_CONCURRENCY : nombre de workers (défaut : 2 × CPU + 1)
+* GUNICORN_THREADS : threads par worker (défaut : 4, workers `gthread`)
+* GUNICORN_WORKER_CLASS : `gthread` (WSGI, défaut) ou
+  `uvicorn_worker.UvicornWorker` (ASGI, avec GUNICORN_APP=config.asgi:application)
+* PORT : port d'écoute (défaut : 8000)
+* PROMETHEUS_MULTIPROC_DIR : répertoire partagé des métriques de `/metrics`
+  (défini dans le Dockerfile), vidé à chaque démarrage
+"""
+import multiprocessing
+import os
+import shutil
+
+wsgi_app = os.environ.get('GUNICORN_APP', 'config.wsgi:application')
+bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
+worker_class = os.environ.get('GUNICORN_WORKER_CLASS', 'gthread')
+threads = int(os.environ.get('GUNICORN_THREADS', 4))
+
+# Application chargée une fois dans le maître puis partagée par fork
+preload_app = True
+
+# Connexions HTTP gardées ouvertes derrière le proxy
+keepalive = int(os.environ.get('GUNICORN_KEEPALIVE', 5))
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 30))
+# Arrêt / rechargement (SIGHUP) sans couper les requêtes en cours
+graceful_timeout = int(os.environ.get('GUNICORN_GRACEFUL_TIMEOUT', 30))
+# Recyclage des workers pour borner une éventuelle fuite mémoire
+max_requests = int(os.environ.get('GUNICORN_MAX_REQUESTS', 1000))
+max_requests_jitter = int(os.environ.get('GUNICORN_MAX_REQUESTS_JITTER', 100))
+
+accesslog = '-'
+errorlog = '-'
+# Le proxy (Railway, nginx) termine TLS et transmet X-Forwarded-* : seuls les en-têtes
+# venant de FORWARDED_ALLOW_IPS (adresses ou réseaux) sont crus, la machine locale par défaut
+forwarded_allow_ips = os.environ.get('FORWARDED_ALLOW_IPS', '127.0.0.1')
+
+
+def on_starting(server):
+    # Compteurs de l'exécution précédente : les workers repartent de zéro
+    directory = os.environ.get('PROMETHEUS_MULTIPROC_DIR')
+    if directory:
+        shutil.rmtree(directory, ignore_errors=True)
+        os.makedirs(directory, exist_ok=True)
+
+
+def child_exit(server, worker):
+    if os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+        from prometheus_client import multiprocess
+
+        multiprocess.mark_process_dead(worker.pid)
@@ -1,5 +1,13 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_delete, post_save
 
 
 class UsersConfig(AppConfig):
     name = 'users'
+
+    def ready(self):
+        from .authentication import invalidate_cached_user
+
+        user_model = self.get_model('User')
+        post_save.connect(invalidate_cached_user, sender=user_model, dispatch_uid='users_auth_cache_save')
+        post_delete.connect(invalidate_cached_user, sender=user_model, dispatch_uid='users_auth_cache_delete')
@@ -0,0 +1,93 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.functional import cached_property
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.models import TokenUser
+from rest_framework_simplejwt.settings import api_settings
+
+from users.models import User
+from users.tokens import ROLE_CLAIMS
+
+# Colonnes gardées en cache : de quoi authentifier et évaluer les permissions.
+# Dans l'ordre des champs du modèle, comme l'attend `Model.from_db()`.
+CACHED_USER_FIELDS = tuple(
+    field.attname for field in User._meta.concrete_fields
+    if field.attname in ('id', 'role', 'is_active', 'is_superuser')
+)
+
+
+def user_cache_key(user_id):
+    return f'users:auth:{user_id}'
+
+
+def invalidate_cached_user(sender, instance, **kwargs):
+    """Récepteur post_save / post_delete : l'utilisateur sera relu au prochain appel."""
+    cache.delete(user_cache_key(instance.pk))
+
+
+class RoleTokenUser(TokenUser):
+    """
+    Utilisateur reconstruit depuis les claims du jeton d'accès, sans base de
+    données : expose `role` et les mêmes raccourcis que `User` pour les
+    permissions (`IsAdmin`, `IsVeterinarian`, `IsSecretary`).
+    """
+
+    @cached_property
+    def role(self):
+        return self.token.get('role', '')
+
+    @property
+    def is_admin(self):
+        return self.role == User.Role.ADMIN
+
+    @property
+    def is_veterinarian(self):
+        return self.role == User.Role.VETERINARIAN
+
+    @property
+    def is_secretary(self):
+        return self.role == User.Role.SECRETARY
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    Authentification JWT sans requête sur `users_user` à chaque appel.
+
+    L'enregistrement minimal de l'utilisateur (`CACHED_USER_FIELDS`) est gardé
+    en cache AUTH_USER_CACHE_TIMEOUT secondes et effacé à chaque
+    `User.save()` / suppression. Le `User` renvoyé ne charge que ces colonnes :
+    les autres sont lues à la demande, comme après un `.only()`.
+
+    Avec un cache local au processus, une désactivation faite ailleurs (autre
+    worker, `QuerySet.update()`) s'applique au plus tard à l'expiration.
+
+    Avec JWT_ROLE_CLAIMS, un jeton qui porte les claims de rôle donne un
+    `RoleTokenUser` sans aucune lecture : rôle et désactivation sont alors
+    pris en compte au renouvellement du jeton d'accès.
+    """
+
+    def get_user(self, validated_token):
+        if settings.JWT_ROLE_CLAIMS and all(claim in validated_token for claim in ROLE_CLAIMS):
+            return RoleTokenUser(validated_token)
+
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_('Token contained no recognizable user identification'))
+
+        key = user_cache_key(user_id)
+        values = cache.get(key)
+        if values is None:
+            values = User.objects.filter(
+                **{api_settings.USER_ID_FIELD: user_id}
+            ).values_list(*CACHED_USER_FIELDS).first()
+            if values is None:
+                raise AuthenticationFailed(_('User not found'), code='user_not_found')
+            cache.set(key, values, settings.AUTH_USER_CACHE_TIMEOUT)
+
+        user = User.from_db(User.objects.db, CACHED_USER_FIELDS, values)
+        if not user.is_active:
+            raise AuthenticationFailed(_('User is inactive'), code='user_inactive')
+        return user
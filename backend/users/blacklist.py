@@ -0,0 +1,149 @@
+"""
+Liste noire des jetons de rafraîchissement révoqués par la rotation.
+
+Le stockage est choisi par JWT_BLACKLIST_STORE (chemin d'une classe) :
+
+* `DatabaseBlacklistStore` (défaut) : table `users_revokedtoken`, partagée par
+  tous les workers ; les lignes expirées sont purgées par paquets avec
+  `manage.py prune_token_blacklist`.
+* `CacheBlacklistStore` : cache Django (Redis via CACHE_URL), chaque entrée
+  expire d'elle-même avec le jeton ; rien à purger.
+* `LocalBlacklistStore` : dictionnaire en mémoire, pour les tests et le
+  développement (un seul processus).
+"""
+import datetime
+import threading
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from django.utils.module_loading import import_string
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+
+from core.monitoring import JWT_EVENTS
+from users.models import RevokedToken
+
+
+class BaseBlacklistStore:
+    def add(self, jti, expires_at):
+        """
+        Révoque le jeton `jti` jusqu'à `expires_at` (datetime avec fuseau).
+        Retourne False s'il l'était déjà : l'insertion atomique tranche entre
+        deux rafraîchissements simultanés du même jeton.
+        """
+        raise NotImplementedError
+
+    def contains(self, jti):
+        raise NotImplementedError
+
+    def prune(self, batch_size=1000):
+        """Supprime les entrées expirées ; retourne le nombre supprimé."""
+        return 0
+
+
+class DatabaseBlacklistStore(BaseBlacklistStore):
+    def add(self, jti, expires_at):
+        try:
+            with transaction.atomic():
+                RevokedToken.objects.create(jti=jti, expires_at=expires_at)
+        except IntegrityError:
+            # Contrainte d'unicité sur jti : un autre rafraîchissement l'a révoqué avant nous
+            return False
+        return True
+
+    def contains(self, jti):
+        return RevokedToken.objects.filter(jti=jti).exists()
+
+    def prune(self, batch_size=1000):
+        """
+        Purge par paquets de `batch_size` lignes, chacun dans sa propre
+        transaction : les verrous restent courts même sur une table volumineuse.
+        """
+        now = timezone.now()
+        deleted = 0
+        while True:
+            ids = list(
+                RevokedToken.objects.filter(expires_at__lt=now).values_list('pk', flat=True)[:batch_size]
+            )
+            if not ids:
+                return deleted
+            deleted += RevokedToken.objects.filter(pk__in=ids).delete()[0]
+
+
+class CacheBlacklistStore(BaseBlacklistStore):
+    key_prefix = 'users:blacklist:'
+
+    def add(self, jti, expires_at):
+        timeout = (expires_at - timezone.now()).total_seconds()
+        if timeout <= 0:
+            # Jeton expiré : refusé de toute façon par la vérification de `exp`
+            return True
+        # add() n'écrit que si la clé est absente (SET NX sous Redis)
+        return cache.add(f'{self.key_prefix}{jti}', True, timeout)
+
+    def contains(self, jti):
+        return cache.get(f'{self.key_prefix}{jti}', False)
+
+
+class LocalBlacklistStore(BaseBlacklistStore):
+    def __init__(self):
+        self.entries = {}
+        self._lock = threading.Lock()
+
+    def add(self, jti, expires_at):
+        with self._lock:
+            if self.contains(jti):
+                return False
+            self.entries[jti] = expires_at
+            return True
+
+    def contains(self, jti):
+        expires_at = self.entries.get(jti)
+        return expires_at is not None and expires_at > timezone.now()
+
+    def prune(self, batch_size=1000):
+        now = timezone.now()
+        expired = [jti for jti, expires_at in self.entries.items() if expires_at <= now]
+        for jti in expired:
+            del self.entries[jti]
+        return len(expired)
+
+
+@lru_cache(maxsize=None)
+def _load_store(path):
+    return import_string(path)()
+
+
+def get_blacklist_store():
+    return _load_store(settings.JWT_BLACKLIST_STORE)
+
+
+def expiration_of(token):
+    """Date d'expiration (claim `exp`) d'un jeton, avec fuseau UTC."""
+    return datetime.datetime.fromtimestamp(token['exp'], tz=datetime.timezone.utc)
+
+
+class StoreBlacklistMixin:
+    """
+    Pour un jeton SimpleJWT : `blacklist()` (appelé par la rotation) et la
+    vérification passent par le stockage configuré plutôt que par l'app
+    `token_blacklist`, qui n'est pas installée.
+    """
+
+    def verify(self):
+        super().verify()
+        if get_blacklist_store().contains(self[api_settings.JTI_CLAIM]):
+            JWT_EVENTS.labels('rejected').inc()
+            raise TokenError(_('Token is blacklisted'))
+
+    def blacklist(self):
+        # La révocation fait foi, pas `verify()` : entre les deux, un rafraîchissement
+        # concurrent du même jeton a pu passer ; un seul obtient une nouvelle paire
+        if not get_blacklist_store().add(self[api_settings.JTI_CLAIM], expiration_of(self)):
+            JWT_EVENTS.labels('rejected').inc()
+            raise TokenError(_('Token is blacklisted'))
+        JWT_EVENTS.labels('blacklisted').inc()
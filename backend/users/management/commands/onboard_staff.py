@@ -0,0 +1,69 @@
+import csv
+import os
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import IntegrityError
+
+from users.onboarding import StaffOnboarding
+
+
+class Command(BaseCommand):
+    help = (
+        "Crée des comptes du personnel depuis un fichier CSV (email, firstName, lastName, role, "
+        "password facultatif, …) ; les mots de passe sont hachés en parallèle."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', type=Path, help='Fichier CSV des comptes à créer.')
+        parser.add_argument(
+            '--workers', type=int, default=os.cpu_count(),
+            help='Processus de hachage des mots de passe (défaut : nombre de cœurs).',
+        )
+        parser.add_argument(
+            '--rejects', type=Path,
+            help='Fichier des lignes refusées (défaut : <fichier>.rejets.csv à côté du fichier importé).',
+        )
+        parser.add_argument(
+            '--credentials', type=Path,
+            help='Fichier des mots de passe générés (défaut : <fichier>.identifiants.csv).',
+        )
+        parser.add_argument('--delimiter', default=',', help='Séparateur de colonnes.')
+
+    def handle(self, *args, **options):
+        path = options['path']
+        if not path.is_file():
+            raise CommandError(f"Fichier introuvable : {path}")
+        if options['workers'] is not None and options['workers'] < 1:
+            raise CommandError("--workers doit être au moins 1.")
+        rejects_path = options['rejects'] or path.with_name(f'{path.stem}.rejets.csv')
+        credentials_path = options['credentials'] or path.with_name(f'{path.stem}.identifiants.csv')
+
+        with path.open(encoding='utf-8-sig', newline='') as file, \
+                rejects_path.open('w', encoding='utf-8', newline='') as rejects:
+            onboarding = StaffOnboarding(workers=options['workers'], rejects=rejects, delimiter=options['delimiter'])
+            try:
+                stats = onboarding.run(file)
+            except IntegrityError as exc:
+                raise CommandError(f"Aucun compte créé : {exc}")
+
+        if not stats.rejected:
+            rejects_path.unlink()
+        if stats.credentials:
+            # Créé en 0600 : il contient des mots de passe en clair, à transmettre puis supprimer
+            descriptor = os.open(credentials_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with open(descriptor, 'w', encoding='utf-8', newline='') as credentials:
+                writer = csv.writer(credentials, delimiter=options['delimiter'])
+                writer.writerow(['email', 'password'])
+                writer.writerows(stats.credentials)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"{stats.created} comptes créés, {stats.rejected} refusés sur {stats.rows} lignes en "
+            f"{stats.seconds:.1f} s (hachage : {stats.hashing_seconds:.1f} s sur {options['workers']} processus)."
+        ))
+        if stats.rejected:
+            self.stdout.write(self.style.WARNING(f"Lignes refusées : {rejects_path}"))
+        if stats.credentials:
+            self.stdout.write(self.style.WARNING(
+                f"{stats.generated_passwords} mots de passe générés : {credentials_path} (à supprimer après remise)"
+            ))
@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from users.blacklist import get_blacklist_store
+
+
+class Command(BaseCommand):
+    help = "Supprime de la liste noire les jetons de rafraîchissement expirés (à planifier, ex. toutes les heures)."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000, help='Lignes supprimées par transaction.')
+
+    def handle(self, *args, **options):
+        if options['batch_size'] < 1:
+            raise CommandError("--batch-size doit être positif.")
+        deleted = get_blacklist_store().prune(batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f"{deleted} jetons expirés supprimés."))
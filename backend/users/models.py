@@ -72,4 +72,17 @@ class User(AbstractBaseUser, PermissionsMixin):
 
     @property
     def is_secretary(self):
-        return self.role == self.Role.SECRETARY
\ No newline at end of file
+        return self.role == self.Role.SECRETARY
+
+
+class RevokedToken(models.Model):
+    """Jeton de rafraîchissement révoqué (rotation), conservé jusqu'à son expiration."""
+    jti = models.CharField(max_length=255, unique=True)
+    expires_at = models.DateTimeField(db_index=True)
+
+    class Meta:
+        verbose_name = "Jeton révoqué"
+        verbose_name_plural = "Jetons révoqués"
+
+    def __str__(self):
+        return f"{self.jti} (expire le {self.expires_at:%d/%m/%Y %H:%M})"
@@ -0,0 +1,139 @@
+"""
+Création en masse de comptes du personnel depuis un fichier CSV.
+
+Le hachage du mot de passe (PBKDF2, plusieurs centaines de millisecondes par
+compte) domine le coût : il est réparti sur un pool de processus, un par
+cœur (des threads ne gagneraient rien, le hachage tenant le GIL). Toutes les
+lignes sont validées avant le premier hachage, puis les comptes valides sont
+créés en une transaction.
+"""
+import csv
+import json
+import os
+import secrets
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+
+import django
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+
+from core.camel_case import underscoreize_key
+from users.models import User
+from users.serializers import UserSerializer
+
+
+def hash_passwords(passwords, workers=None):
+    """
+    Hache `passwords` avec le hacheur par défaut, dans le même ordre, sur
+    `workers` processus (défaut : nombre de cœurs).
+    """
+    passwords = list(passwords)
+    workers = min(workers or os.cpu_count() or 1, len(passwords))
+    if workers <= 1:
+        return [make_password(password) for password in passwords]
+    # Quelques paquets par processus : l'envoi au pool reste négligeable devant le hachage
+    chunksize = max(1, len(passwords) // (workers * 4))
+    # django.setup() : nécessaire quand les processus ne sont pas créés par fork
+    with ProcessPoolExecutor(workers, initializer=django.setup) as executor:
+        return list(executor.map(make_password, passwords, chunksize=chunksize))
+
+
+class StaffOnboardingSerializer(UserSerializer):
+    """
+    Mêmes règles que l'API, mais le mot de passe est facultatif (généré) et
+    le rôle administrateur est permis : la commande est lancée par l'exploitant.
+    """
+
+    class Meta(UserSerializer.Meta):
+        fields = ['email', 'password', 'first_name', 'last_name', 'role', 'phone_number', 'street', 'city', 'zip_code']
+        read_only_fields = []
+
+    def validate_role(self, value):
+        return value
+
+    def validate(self, attrs):
+        return attrs
+
+
+@dataclass
+class OnboardingStats:
+    rows: int = 0
+    created: int = 0
+    rejected: int = 0
+    generated_passwords: int = 0
+    seconds: float = 0.0
+    hashing_seconds: float = 0.0
+    # (email, mot de passe) des comptes dont le mot de passe a été généré
+    credentials: list = field(default_factory=list)
+
+
+class StaffOnboarding:
+    """
+    Crée les comptes d'un CSV (en-têtes en camelCase ou snake_case : `email`,
+    `firstName`, `lastName`, `role`, `password` facultatif, …). Les lignes
+    refusées sont écrites dans `rejects` avec leur numéro de ligne et leurs
+    erreurs ; un mot de passe absent est généré et renvoyé dans
+    `OnboardingStats.credentials`.
+    """
+
+    def __init__(self, workers=None, rejects=None, delimiter=','):
+        self.workers = workers
+        self.rejects = rejects
+        self.delimiter = delimiter
+        self._rejects_writer = None
+
+    def run(self, file):
+        stats = OnboardingStats()
+        start = time.perf_counter()
+        reader = csv.DictReader(file, delimiter=self.delimiter, restval='')
+        valid, seen = [], set()
+        for row in reader:
+            stats.rows += 1
+            values = {underscoreize_key(key): value.strip() for key, value in row.items() if key}
+            if not values.get('password'):
+                values.pop('password', None)
+            serializer = StaffOnboardingSerializer(data=values)
+            if serializer.is_valid():
+                email = serializer.validated_data['email'].lower()
+                errors = {'email': ['Adresse présente plus haut dans le fichier.']} if email in seen else None
+            else:
+                errors = serializer.errors
+            if errors:
+                stats.rejected += 1
+                self.write_reject(reader.fieldnames, reader.line_num, row, errors)
+                continue
+            seen.add(email)
+            valid.append(serializer.validated_data)
+
+        for attrs in valid:
+            if 'password' not in attrs:
+                attrs['password'] = secrets.token_urlsafe(12)
+                stats.credentials.append((attrs['email'], attrs['password']))
+        stats.generated_passwords = len(stats.credentials)
+
+        hashing_start = time.perf_counter()
+        hashed = hash_passwords((attrs['password'] for attrs in valid), self.workers)
+        stats.hashing_seconds = time.perf_counter() - hashing_start
+
+        users = [
+            User(**{**attrs, 'email': User.objects.normalize_email(attrs['email']), 'password': password})
+            for attrs, password in zip(valid, hashed)
+        ]
+        with transaction.atomic():
+            stats.created = len(User.objects.bulk_create(users))
+        stats.seconds = time.perf_counter() - start
+        return stats
+
+    def write_reject(self, fieldnames, line, row, errors):
+        if self.rejects is None:
+            return
+        if self._rejects_writer is None:
+            self._rejects_writer = csv.writer(self.rejects, delimiter=self.delimiter)
+            # Le mot de passe éventuel n'est pas recopié dans les rejets
+            self._columns = [name for name in fieldnames if underscoreize_key(name) != 'password']
+            self._rejects_writer.writerow(['line', 'errors', *self._columns])
+        self._rejects_writer.writerow([
+            line, json.dumps(errors, ensure_ascii=False), *(row.get(name, '') for name in self._columns),
+        ])
@@ -1,9 +1,13 @@
 from rest_framework import serializers
 from django.contrib.auth.password_validation import validate_password
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer, TokenRefreshSerializer
+from core.monitoring import JWT_EVENTS
+from core.serializers import SparseFieldsetMixin, TimedRepresentationMixin
 from users.models import User
+from users.tokens import RoleRefreshToken
 
 
-class UserSerializer(serializers.ModelSerializer):
+class UserSerializer(SparseFieldsetMixin, TimedRepresentationMixin, serializers.ModelSerializer):
     password = serializers.CharField(
         write_only=True,
         required=False,
@@ -62,4 +66,24 @@ class UserSerializer(serializers.ModelSerializer):
         if password:
             instance.set_password(password)
         instance.save()
-        return instance
\ No newline at end of file
+        return instance
+
+
+class RoleTokenObtainPairSerializer(TokenObtainPairSerializer):
+    """Connexion : jeton d'accès avec les claims de rôle (voir `users.tokens`)."""
+    token_class = RoleRefreshToken
+
+    def validate(self, attrs):
+        data = super().validate(attrs)
+        JWT_EVENTS.labels('obtained').inc()
+        return data
+
+
+class RoleTokenRefreshSerializer(TokenRefreshSerializer):
+    """Rafraîchissement : claims de rôle relus en base pour le nouveau jeton d'accès."""
+    token_class = RoleRefreshToken
+
+    def validate(self, attrs):
+        data = super().validate(attrs)
+        JWT_EVENTS.labels('refreshed').inc()
+        return data
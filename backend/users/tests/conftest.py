@@ -1,6 +1,7 @@
 import pytest
 from unittest.mock import Mock
 
+from django.core.cache import cache
 from rest_framework.test import APIClient, APIRequestFactory
 
 from users.models import User
@@ -22,6 +23,14 @@ def api_request_factory():
     return APIRequestFactory()
 
 
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Vide le cache (utilisateurs authentifiés, throttling) entre les tests."""
+    cache.clear()
+    yield
+    cache.clear()
+
+
 # ============================================================
 # Mock Fixtures
 # ============================================================
@@ -0,0 +1,132 @@
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+
+from users.authentication import user_cache_key
+
+
+def _authenticate(api_client, user):
+    api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(user)}")
+
+
+def _user_queries(queries):
+    return [query["sql"] for query in queries if "users_user" in query["sql"]]
+
+
+@pytest.mark.django_db
+class TestCachedJWTAuthentication:
+    """Tests de l'authentification JWT avec utilisateur en cache."""
+
+    def test_second_request_runs_no_user_query(self, api_client, veterinarian_user):
+        """Test qu'après le premier appel, l'authentification ne lit plus users_user."""
+        _authenticate(api_client, veterinarian_user)
+        assert api_client.get("/api/customers/").status_code == status.HTTP_200_OK
+
+        with CaptureQueriesContext(connection) as queries:
+            response = api_client.get("/api/customers/")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert _user_queries(queries) == []
+
+    def test_permissions_use_cached_role(self, api_client, admin_user, veterinarian_user):
+        """Test que les permissions par rôle fonctionnent avec l'utilisateur en cache."""
+        _authenticate(api_client, veterinarian_user)
+        response = api_client.patch(f"/api/users/{admin_user.id}/", {"city": "Lyon"}, format="json")
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+        _authenticate(api_client, admin_user)
+        response = api_client.patch(f"/api/users/{veterinarian_user.id}/", {"city": "Lyon"}, format="json")
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_save_invalidates_cache(self, api_client, veterinarian_user):
+        """Test qu'un compte désactivé par save() est refusé dès l'appel suivant."""
+        _authenticate(api_client, veterinarian_user)
+        api_client.get("/api/customers/")
+        assert cache.get(user_cache_key(veterinarian_user.id)) is not None
+
+        veterinarian_user.is_active = False
+        veterinarian_user.save()
+
+        assert cache.get(user_cache_key(veterinarian_user.id)) is None
+        assert api_client.get("/api/customers/").status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_deleted_user_is_rejected(self, api_client, veterinarian_user):
+        """Test qu'un utilisateur supprimé n'est plus authentifié."""
+        _authenticate(api_client, veterinarian_user)
+        api_client.get("/api/customers/")
+        veterinarian_user.delete()
+
+        assert api_client.get("/api/customers/").status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_other_fields_are_loaded_on_demand(self, veterinarian_user):
+        """Test que l'utilisateur renvoyé lit ses autres colonnes à la demande."""
+        from users.authentication import CachedJWTAuthentication
+
+        user = CachedJWTAuthentication().get_user(AccessToken.for_user(veterinarian_user))
+
+        assert user.is_veterinarian
+        assert user.email == "vet@example.com"
+
+
+@pytest.mark.django_db
+class TestRoleClaims:
+    """Tests des claims de rôle dans les jetons d'accès (JWT_ROLE_CLAIMS)."""
+
+    @pytest.fixture(autouse=True)
+    def enable_role_claims(self, settings):
+        settings.JWT_ROLE_CLAIMS = True
+
+    @staticmethod
+    def _login(api_client, email, password):
+        response = api_client.post("/api/token/", {"email": email, "password": password}, format="json")
+        assert response.status_code == status.HTTP_200_OK
+        return response.data
+
+    def test_access_token_carries_role_claims(self, api_client, veterinarian_user):
+        """Test que le jeton d'accès porte le rôle et le statut superutilisateur."""
+        tokens = self._login(api_client, "vet@example.com", "vetpass123")
+
+        access = AccessToken(tokens["access"])
+        assert access["role"] == "veterinarian"
+        assert access["is_superuser"] is False
+
+    def test_authorization_runs_no_user_query(self, api_client, admin_user, veterinarian_user):
+        """Test que l'authentification et les permissions ne lisent pas users_user."""
+        tokens = self._login(api_client, "admin@example.com", "adminpass123")
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {tokens['access']}")
+
+        with CaptureQueriesContext(connection) as queries:
+            response = api_client.get("/api/customers/")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert _user_queries(queries) == []
+        response = api_client.patch(f"/api/users/{veterinarian_user.id}/", {"city": "Lyon"}, format="json")
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_role_claims_deny_other_roles(self, api_client, admin_user, secretary_user):
+        """Test qu'un rôle non autorisé dans le jeton est refusé."""
+        tokens = self._login(api_client, "secretary@example.com", "secretarypass123")
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {tokens['access']}")
+
+        response = api_client.patch(f"/api/users/{admin_user.id}/", {"city": "Lyon"}, format="json")
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_refresh_reads_current_role(self, api_client, secretary_user):
+        """Test qu'un rôle modifié est repris au rafraîchissement du jeton."""
+        tokens = self._login(api_client, "secretary@example.com", "secretarypass123")
+        secretary_user.role = "veterinarian"
+        secretary_user.save()
+
+        response = api_client.post("/api/token/refresh/", {"refresh": tokens["refresh"]}, format="json")
+
+        assert AccessToken(response.data["access"])["role"] == "veterinarian"
+        assert "role" not in RefreshToken(response.data["refresh"])
+
+    def test_tokens_without_claims_fall_back_to_cache(self, api_client, veterinarian_user):
+        """Test qu'un ancien jeton sans claims reste accepté."""
+        _authenticate(api_client, veterinarian_user)
+        assert api_client.get("/api/customers/").status_code == status.HTTP_200_OK
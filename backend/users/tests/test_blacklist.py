@@ -0,0 +1,113 @@
+import datetime
+import io
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+from rest_framework import status
+
+from users.blacklist import CacheBlacklistStore, DatabaseBlacklistStore, LocalBlacklistStore, _load_store
+from users.models import RevokedToken
+
+
+@pytest.fixture
+def local_store(settings):
+    """Liste noire en mémoire, propre à chaque test."""
+    settings.JWT_BLACKLIST_STORE = "users.blacklist.LocalBlacklistStore"
+    _load_store.cache_clear()
+    yield _load_store(settings.JWT_BLACKLIST_STORE)
+    _load_store.cache_clear()
+
+
+def _login(api_client):
+    response = api_client.post(
+        "/api/token/", {"email": "vet@example.com", "password": "vetpass123"}, format="json"
+    )
+    return response.data["refresh"]
+
+
+@pytest.mark.django_db
+class TestRefreshRotation:
+    """Tests de la révocation des jetons remplacés par la rotation."""
+
+    def test_rotated_refresh_token_cannot_be_replayed(self, api_client, veterinarian_user):
+        """Test qu'un jeton de rafraîchissement déjà utilisé est refusé."""
+        refresh = _login(api_client)
+
+        first = api_client.post("/api/token/refresh/", {"refresh": refresh}, format="json")
+        replay = api_client.post("/api/token/refresh/", {"refresh": refresh}, format="json")
+
+        assert first.status_code == status.HTTP_200_OK
+        assert replay.status_code == status.HTTP_401_UNAUTHORIZED
+        assert RevokedToken.objects.count() == 1
+
+    def test_concurrent_refresh_of_same_token_is_rejected(self, api_client, veterinarian_user, mocker):
+        """Test que deux rafraîchissements passés tous deux par verify() n'obtiennent qu'une paire."""
+        refresh = _login(api_client)
+        # Les deux requêtes ont lu la liste noire avant que l'une révoque le jeton
+        mocker.patch.object(DatabaseBlacklistStore, "contains", return_value=False)
+
+        first = api_client.post("/api/token/refresh/", {"refresh": refresh}, format="json")
+        second = api_client.post("/api/token/refresh/", {"refresh": refresh}, format="json")
+
+        assert first.status_code == status.HTTP_200_OK
+        assert second.status_code == status.HTTP_401_UNAUTHORIZED
+        assert "refresh" not in second.data
+        assert RevokedToken.objects.count() == 1
+
+    def test_new_refresh_token_is_accepted(self, api_client, veterinarian_user):
+        """Test que le jeton renvoyé par la rotation reste utilisable."""
+        refresh = _login(api_client)
+        rotated = api_client.post("/api/token/refresh/", {"refresh": refresh}, format="json").data["refresh"]
+
+        response = api_client.post("/api/token/refresh/", {"refresh": rotated}, format="json")
+
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_local_store_is_pluggable(self, api_client, veterinarian_user, local_store):
+        """Test que le stockage configuré remplace la table."""
+        refresh = _login(api_client)
+        api_client.post("/api/token/refresh/", {"refresh": refresh}, format="json")
+
+        replay = api_client.post("/api/token/refresh/", {"refresh": refresh}, format="json")
+
+        assert replay.status_code == status.HTTP_401_UNAUTHORIZED
+        assert len(local_store.entries) == 1
+        assert not RevokedToken.objects.exists()
+
+
+@pytest.mark.django_db
+class TestBlacklistStores:
+    """Tests des stockages de liste noire."""
+
+    @pytest.mark.parametrize("store_class", [DatabaseBlacklistStore, CacheBlacklistStore, LocalBlacklistStore])
+    def test_add_and_contains(self, store_class):
+        """Test qu'un jeton révoqué est reconnu, et lui seul."""
+        store = store_class()
+        first = store.add("revoked-jti", timezone.now() + datetime.timedelta(hours=1))
+        second = store.add("revoked-jti", timezone.now() + datetime.timedelta(hours=1))
+
+        assert (first, second) == (True, False)
+        assert store.contains("revoked-jti")
+        assert not store.contains("other-jti")
+
+    def test_database_prune_deletes_expired_rows_in_batches(self):
+        """Test que la purge supprime les seules lignes expirées, par paquets."""
+        now = timezone.now()
+        RevokedToken.objects.bulk_create(
+            [RevokedToken(jti=f"expired-{index}", expires_at=now - datetime.timedelta(hours=1)) for index in range(5)]
+            + [RevokedToken(jti="valid", expires_at=now + datetime.timedelta(hours=1))]
+        )
+
+        assert DatabaseBlacklistStore().prune(batch_size=2) == 5
+        assert list(RevokedToken.objects.values_list("jti", flat=True)) == ["valid"]
+
+    def test_prune_command(self):
+        """Test que la commande de purge affiche le nombre de jetons supprimés."""
+        RevokedToken.objects.create(jti="expired", expires_at=timezone.now() - datetime.timedelta(minutes=1))
+        out = io.StringIO()
+
+        call_command("prune_token_blacklist", "--batch-size", "10", stdout=out)
+
+        assert "1 jetons expirés supprimés" in out.getvalue()
+        assert not RevokedToken.objects.exists()
@@ -0,0 +1,98 @@
+import csv
+import io
+
+import pytest
+from django.contrib.auth.hashers import check_password
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from users.models import User
+from users.onboarding import StaffOnboarding, hash_passwords
+
+HEADER = "email,firstName,lastName,role,phoneNumber,password\n"
+
+
+def _line(index, **overrides):
+    values = {
+        "email": f"personnel{index}@clinique-veto.fr", "first_name": "Prénom", "last_name": f"Nom{index}",
+        "role": User.Role.VETERINARIAN, "phone_number": "0102030405", "password": f"Str0ngP@ss{index}!",
+        **overrides,
+    }
+    return ",".join(values[key] for key in (
+        "email", "first_name", "last_name", "role", "phone_number", "password"
+    )) + "\n"
+
+
+class TestHashPasswords:
+    """Tests du hachage des mots de passe en parallèle."""
+
+    def test_hashes_in_order_with_a_process_pool(self):
+        """Test que les empreintes calculées par le pool suivent l'ordre des mots de passe."""
+        passwords = [f"motdepasse{index}" for index in range(6)]
+
+        hashed = hash_passwords(passwords, workers=2)
+
+        assert len(hashed) == len(passwords)
+        assert all(check_password(password, encoded) for password, encoded in zip(passwords, hashed))
+
+    def test_single_worker_hashes_in_process(self):
+        """Test qu'un seul processus hache sans pool, et qu'une liste vide ne coûte rien."""
+        assert check_password("motdepasse", hash_passwords(["motdepasse"], workers=1)[0])
+        assert hash_passwords([], workers=4) == []
+
+
+@pytest.mark.django_db
+class TestStaffOnboarding:
+    """Tests de la création en masse des comptes du personnel."""
+
+    def test_creates_accounts_with_usable_passwords(self):
+        """Test que les comptes valides sont créés avec leur mot de passe haché."""
+        stats = StaffOnboarding(workers=2).run(io.StringIO(HEADER + _line(0) + _line(1, role=User.Role.ADMIN)))
+
+        assert (stats.rows, stats.created, stats.rejected) == (2, 2, 0)
+        user = User.objects.get(email="personnel1@clinique-veto.fr")
+        assert user.role == User.Role.ADMIN
+        assert user.check_password("Str0ngP@ss1!")
+
+    def test_generates_missing_passwords(self):
+        """Test qu'un mot de passe absent est généré et renvoyé pour être transmis."""
+        stats = StaffOnboarding(workers=1).run(io.StringIO(HEADER + _line(0, password="")))
+
+        [(email, password)] = stats.credentials
+        assert email == "personnel0@clinique-veto.fr"
+        assert User.objects.get(email=email).check_password(password)
+
+    def test_rejects_invalid_rows_without_password(self, secretary_user):
+        """Test que les lignes invalides sont refusées, sans recopier le mot de passe."""
+        rejects = io.StringIO()
+        content = (
+            HEADER + _line(0) + _line(1, role="stagiaire") + _line(2, email=secretary_user.email)
+            + _line(3, email="personnel0@clinique-veto.fr") + _line(4, password="123")
+        )
+
+        stats = StaffOnboarding(workers=1, rejects=rejects).run(io.StringIO(content))
+
+        assert (stats.created, stats.rejected) == (1, 4)
+        rows = list(csv.reader(io.StringIO(rejects.getvalue())))
+        assert rows[0] == ["line", "errors", "email", "firstName", "lastName", "role", "phoneNumber"]
+        assert [row[0] for row in rows[1:]] == ["3", "4", "5", "6"]
+        assert "Str0ngP@ss" not in rejects.getvalue()
+
+    def test_command_writes_credentials_file(self, tmp_path):
+        """Test que la commande crée les comptes et écrit les mots de passe générés."""
+        path = tmp_path / "personnel.csv"
+        path.write_text(HEADER + _line(0) + _line(1, password=""), encoding="utf-8")
+        out = io.StringIO()
+
+        call_command("onboard_staff", str(path), "--workers", "2", stdout=out)
+
+        assert "2 comptes créés, 0 refusés sur 2 lignes" in out.getvalue()
+        assert not (tmp_path / "personnel.rejets.csv").exists()
+        credentials = list(csv.reader((tmp_path / "personnel.identifiants.csv").open(encoding="utf-8")))
+        assert [row[0] for row in credentials] == ["email", "personnel1@clinique-veto.fr"]
+        assert (tmp_path / "personnel.identifiants.csv").stat().st_mode & 0o077 == 0
+
+    def test_command_rejects_missing_file(self, tmp_path):
+        """Test qu'un fichier absent lève une CommandError."""
+        with pytest.raises(CommandError):
+            call_command("onboard_staff", str(tmp_path / "absent.csv"))
@@ -203,3 +203,43 @@ class TestUserViewSetDelete:
         response = api_client.delete(f"/api/users/{user_id}/")
         assert response.status_code == status.HTTP_204_NO_CONTENT
         assert not User.objects.filter(id=user_id).exists()
+
+
+@pytest.mark.django_db
+class TestUserViewSetSparseFieldsets:
+    """Tests pour `?fields=` / `?omit=` sur les utilisateurs."""
+
+    def test_fields_narrows_output(self, api_client, admin_user):
+        """Test que `?fields=` ne renvoie que les champs demandés."""
+        api_client.force_authenticate(user=admin_user)
+        response = api_client.get("/api/users/", {"fields": "id,email,roleDisplay"})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()[0] == {"id": admin_user.id, "email": admin_user.email, "roleDisplay": "Administrateur"}
+
+    def test_omit_removes_fields(self, api_client, admin_user):
+        """Test que `?omit=` retire les champs demandés."""
+        api_client.force_authenticate(user=admin_user)
+        response = api_client.get(f"/api/users/{admin_user.id}/", {"omit": "street,city,zipCode"})
+        data = response.json()
+        assert not {"street", "city", "zipCode"} & set(data)
+        assert data["email"] == admin_user.email
+
+
+@pytest.mark.django_db
+class TestUserViewSetConditionalRequests:
+    """Tests des requêtes conditionnelles sur les utilisateurs."""
+
+    def test_detail_if_none_match_returns_304(self, api_client, admin_user, veterinarian_user):
+        """Test qu'un ETag à jour donne une 304 sur le détail."""
+        api_client.force_authenticate(user=admin_user)
+        etag = api_client.get(f"/api/users/{veterinarian_user.id}/")["ETag"]
+        response = api_client.get(f"/api/users/{veterinarian_user.id}/", HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_list_etag_changes_after_update(self, api_client, admin_user, veterinarian_user):
+        """Test qu'une modification d'utilisateur invalide l'ETag de la liste."""
+        api_client.force_authenticate(user=admin_user)
+        etag = api_client.get("/api/users/")["ETag"]
+        assert api_client.get("/api/users/", HTTP_IF_NONE_MATCH=etag).status_code == status.HTTP_304_NOT_MODIFIED
+        api_client.patch(f"/api/users/{veterinarian_user.id}/", {"city": "Lyon"}, format="json")
+        assert api_client.get("/api/users/", HTTP_IF_NONE_MATCH=etag).status_code == status.HTTP_200_OK
@@ -0,0 +1,44 @@
+from django.conf import settings
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from users.blacklist import StoreBlacklistMixin
+from users.models import User
+
+# Claims d'autorisation ajoutés aux jetons d'accès (voir JWT_ROLE_CLAIMS)
+ROLE_CLAIMS = ('role', 'is_superuser')
+
+
+class RoleRefreshToken(StoreBlacklistMixin, RefreshToken):
+    """
+    Jeton de rafraîchissement dont les jetons d'accès portent `role` et
+    `is_superuser` quand JWT_ROLE_CLAIMS est actif.
+
+    Les claims sont relus en base à chaque émission d'un jeton d'accès (connexion
+    ou rafraîchissement), jamais copiés depuis le jeton de rafraîchissement : un
+    rôle modifié est donc pris en compte au plus tard après ACCESS_TOKEN_LIFETIME.
+
+    Un jeton remplacé par la rotation est révoqué dans la liste noire
+    (`users.blacklist`) et ne peut plus être rejoué.
+    """
+    _user = None
+
+    @classmethod
+    def for_user(cls, user):
+        token = super().for_user(user)
+        token._user = user
+        return token
+
+    @property
+    def access_token(self):
+        access = super().access_token
+        if settings.JWT_ROLE_CLAIMS:
+            if self._user is not None:
+                values = [getattr(self._user, claim) for claim in ROLE_CLAIMS]
+            else:
+                values = User.objects.filter(
+                    **{api_settings.USER_ID_FIELD: self[api_settings.USER_ID_CLAIM]}
+                ).values_list(*ROLE_CLAIMS).first() or ()
+            for claim, value in zip(ROLE_CLAIMS, values):
+                access[claim] = value
+        return access
@@ -1,14 +1,22 @@
+from drf_spectacular.utils import extend_schema, extend_schema_view
 from rest_framework import viewsets
 from rest_framework.exceptions import PermissionDenied
 
+from core.conditional import ConditionalGetMixin
+from core.filters import SPARSE_FIELDSET_PARAMETERS, SparseFieldsetFilter
 from users.models import User
 from users.permissions import IsAdmin
 from users.serializers import UserSerializer
 
 
-class UserViewSet(viewsets.ModelViewSet):
+@extend_schema_view(
+    list=extend_schema(parameters=SPARSE_FIELDSET_PARAMETERS),
+    retrieve=extend_schema(parameters=SPARSE_FIELDSET_PARAMETERS),
+)
+class UserViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     queryset = User.objects.all()
     serializer_class = UserSerializer
+    filter_backends = [SparseFieldsetFilter]
 
     def get_permissions(self):
         if self.action in ['create', 'destroy', 'update', 'partial_update']:
@@ -0,0 +1,49 @@
+import { act, renderHook } from "@testing-library/react";
+import { afterEach, beforeEach, describe, expect, it, vi } from "vitest";
+import axios from "axios";
+import type { CustomerOption } from "@/types/customer";
+import { useCustomerAutocomplete } from "./useCustomerAutocomplete";
+import { customerService } from "@/features/customers/services/customerService";
+
+// Simulation du service
+vi.mock("@/features/customers/services/customerService", () => ({
+  customerService: {
+    autocomplete: vi.fn(),
+  },
+}));
+
+describe("useCustomerAutocomplete", () => {
+  beforeEach(() => {
+    vi.useFakeTimers();
+    // Requête qui ne répond jamais, sauf pour signaler son annulation
+    vi.mocked(customerService.autocomplete).mockImplementation(
+      (_search, signal) =>
+        new Promise<CustomerOption[]>((_resolve, reject) => {
+          signal?.addEventListener("abort", () => reject(new axios.CanceledError()));
+        }),
+    );
+  });
+
+  afterEach(() => {
+    vi.useRealTimers();
+    vi.clearAllMocks();
+  });
+
+  it("n'est plus en chargement quand la recherche est vidée pendant une requête", async () => {
+    const { result, rerender } = renderHook(({ search }) => useCustomerAutocomplete(search), {
+      initialProps: { search: "Dup" },
+    });
+
+    await act(async () => {
+      vi.advanceTimersByTime(200);
+    });
+    expect(result.current.isLoading).toBe(true);
+
+    await act(async () => {
+      rerender({ search: "" });
+    });
+
+    expect(result.current.isLoading).toBe(false);
+    expect(result.current.options).toEqual([]);
+  });
+});
@@ -0,0 +1,43 @@
+import { useEffect, useState } from "react";
+import axios from "axios";
+import type { CustomerOption } from "@/types/customer";
+import { customerService } from "@/features/customers/services/customerService";
+
+const DEBOUNCE_MS = 200;
+
+// Suggestions de clients pour un champ de recherche : la requête part après
+// DEBOUNCE_MS sans frappe, et toute requête devenue obsolète est annulée.
+export const useCustomerAutocomplete = (search: string) => {
+  const [options, setOptions] = useState<CustomerOption[]>([]);
+  const [isLoading, setIsLoading] = useState(false);
+
+  useEffect(() => {
+    const term = search.trim();
+    if (!term) {
+      // Une requête en cours vient d'être annulée : son `finally` ne remet pas
+      // isLoading à false
+      setOptions([]);
+      setIsLoading(false);
+      return;
+    }
+
+    const controller = new AbortController();
+    const timer = window.setTimeout(async () => {
+      setIsLoading(true);
+      try {
+        setOptions(await customerService.autocomplete(term, controller.signal));
+      } catch (error) {
+        if (!axios.isCancel(error)) setOptions([]);
+      } finally {
+        if (!controller.signal.aborted) setIsLoading(false);
+      }
+    }, DEBOUNCE_MS);
+
+    return () => {
+      window.clearTimeout(timer);
+      controller.abort();
+    };
+  }, [search]);
+
+  return { options, isLoading };
+};
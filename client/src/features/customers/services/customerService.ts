@@ -1,5 +1,5 @@
 import api from "@/services/api";
-import type { Customer } from "@/types/customer";
+import type { Customer, CustomerOption } from "@/types/customer";
 
 export const customerService = {
   // Créer un client
@@ -7,4 +7,13 @@ export const customerService = {
     const response = await api.post<Customer>("/customers/", customer);
     return response.data;
   },
+
+  // Suggestions pour la saisie semi-automatique (annulable via `signal`)
+  autocomplete: async (search: string, signal?: AbortSignal) => {
+    const response = await api.get<CustomerOption[]>("/customers/autocomplete/", {
+      params: { search },
+      signal,
+    });
+    return response.data;
+  },
 };
@@ -25,6 +25,27 @@ api.interceptors.request.use(
   (error) => Promise.reject(error),
 );
 
+// Rafraîchissement en cours, partagé par les requêtes qui reçoivent un 401 en même temps :
+// le jeton de rafraîchissement est à usage unique (rotation), un seul appel doit l'utiliser.
+let refreshPromise: Promise<string> | null = null;
+
+function refreshAccessToken(refreshToken: string): Promise<string> {
+  refreshPromise ??= axios
+    .post(`${baseURL}/token/refresh/`, { refresh: refreshToken })
+    .then((response) => {
+      const { access, refresh } = response.data;
+      localStorage.setItem("accessToken", access);
+      if (refresh) {
+        localStorage.setItem("refreshToken", refresh);
+      }
+      return access as string;
+    })
+    .finally(() => {
+      refreshPromise = null;
+    });
+  return refreshPromise;
+}
+
 // Intercepteur de réponse pour gérer les erreurs
 api.interceptors.response.use(
   function onFulfilled(response: AxiosResponse) {
@@ -42,11 +63,7 @@ api.interceptors.response.use(
 
       if (refreshToken) {
         try {
-          const response = await axios.post(`${baseURL}/token/refresh/`, {
-            refresh: refreshToken,
-          });
-          const { access } = response.data;
-          localStorage.setItem("accessToken", access);
+          const access = await refreshAccessToken(refreshToken);
 
           if (originalRequest.headers) {
             originalRequest.headers.Authorization = `Bearer ${access}`;
@@ -11,4 +11,10 @@ export interface Customer {
   archive?: boolean;
   readonly createdAt?: string;
   readonly updatedAt?: string;
-}
\ No newline at end of file
+}
+
+// Suggestion renvoyée par /customers/autocomplete/
+export interface CustomerOption {
+  id: number;
+  label: string;
+}